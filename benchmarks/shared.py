@@ -0,0 +1,98 @@
+"""Benchmarks the cost of passing a large fluenttuple to worker processes, comparing
+pickling the tuple, which copies all of its items to each worker for each task, with
+sharing it via fluenttuple.share(), which copies the items into shared memory once, so
+that each task receives only the name of the block, attaching to it without copying.
+
+Run from the repository root via: PYTHONPATH=source python benchmarks/shared.py"""
+
+from __future__ import annotations
+
+from fluently import fluenttuple
+from concurrent.futures import ProcessPoolExecutor
+
+import argparse
+import os
+import pickle
+import time
+
+
+def measure(function: callable, repeats: int) -> float:
+    """Returns the best wall-clock time in seconds of the specified number of runs."""
+
+    best: float = None
+
+    for _ in range(repeats):
+        started = time.perf_counter()
+
+        function()
+
+        elapsed = time.perf_counter() - started
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def task(items: object) -> int:
+    """Reads a single item within a worker process, so that the measured time is that of
+    transferring the items to the worker, rather than of any work performed upon them.
+    """
+
+    return items[len(items) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--tasks", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    arguments = parser.parse_args()
+
+    size: int = arguments.size
+    tasks: int = arguments.tasks
+    repeats: int = arguments.repeats
+    workers: int = arguments.workers
+
+    datasets: dict[str, fluenttuple] = {
+        "integers": fluenttuple(range(size)),
+        "strings": fluenttuple(f"item-{index}" for index in range(size)),
+    }
+
+    print(f"Passing {size:,} items to {tasks} tasks on {workers} workers:")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Warm up the worker processes so that their start-up time is not measured
+        list(executor.map(task, [fluenttuple([0])] * workers))
+
+        for kind, items in datasets.items():
+            pickled: int = len(pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL))
+
+            elapsed: float = measure(
+                lambda: list(executor.map(task, [items] * tasks)), repeats
+            )
+
+            print(
+                f"  {kind + ', pickled:':<22} {elapsed * 1000:10.2f} ms"
+                f"  {pickled:>14,} bytes per task"
+            )
+
+            creating: float = measure(lambda: items.share().__exit__(), repeats)
+
+            with items.share() as shared:
+                pickled = len(pickle.dumps(shared, protocol=pickle.HIGHEST_PROTOCOL))
+
+                elapsed = measure(
+                    lambda: list(executor.map(task, [shared] * tasks)), repeats
+                )
+
+            print(
+                f"  {kind + ', shared:':<22} {elapsed * 1000:10.2f} ms"
+                f"  {pickled:>14,} bytes per task"
+                f"  (plus {creating * 1000:.2f} ms once to share)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmarks the throughput of the fluentlist shuffle methods, comparing shuffles that use
+the random module's global generator, as the shuffle method did originally, with those
+using per-call generators, and with shards shuffled concurrently in worker processes each
+using an independent generator obtained via fluently.sampling.spawn().
+
+Run from the repository root via: PYTHONPATH=source python benchmarks/shuffle.py"""
+
+from __future__ import annotations
+
+from fluently import fluentlist, sampling
+from concurrent.futures import ProcessPoolExecutor
+
+import argparse
+import os
+import random
+import time
+
+
+def measure(function: callable, repeats: int) -> float:
+    """Returns the best wall-clock time in seconds of the specified number of runs."""
+
+    best: float = None
+
+    for _ in range(repeats):
+        started = time.perf_counter()
+
+        function()
+
+        elapsed = time.perf_counter() - started
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def shard(arguments: tuple[int, random.Random]) -> int:
+    """Shuffles a shard of the specified size within a worker process via the specified
+    generator, returning the first item so that the work cannot be optimised away."""
+
+    (size, rng) = arguments
+
+    return fluentlist(range(size)).shuffle(rng=rng)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    arguments = parser.parse_args()
+
+    size: int = arguments.size
+    repeats: int = arguments.repeats
+    workers: int = arguments.workers
+
+    items = fluentlist(range(size))
+    rng = random.Random(42)
+
+    results: dict[str, float] = {
+        "random.shuffle() (global generator)": measure(
+            lambda: random.shuffle(items), repeats
+        ),
+        "fluentlist.shuffle() (global generator)": measure(
+            lambda: items.shuffle(), repeats
+        ),
+        "fluentlist.shuffle(rng=...) (per-call generator)": measure(
+            lambda: items.shuffle(rng=rng), repeats
+        ),
+        "fluentlist.shuffle(seed=...) (seeded per call)": measure(
+            lambda: items.shuffle(seed=42), repeats
+        ),
+    }
+
+    # Shuffle the same total number of items as shards, sequentially and then across
+    # worker processes, each shard using its own independent, reproducible generator
+    shards: int = workers
+    shardsize: int = size // shards
+
+    results[f"{shards} shards, sequential (spawned generators)"] = measure(
+        lambda: [
+            shard((shardsize, generator)) for generator in sampling.spawn(42, shards)
+        ],
+        repeats,
+    )
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Warm up the worker processes so that their start-up time is not measured
+        list(executor.map(shard, [(1, generator) for generator in sampling.spawn(42)]))
+
+        results[f"{shards} shards, {workers} processes (spawned generators)"] = measure(
+            lambda: list(
+                executor.map(
+                    shard,
+                    [
+                        (shardsize, generator)
+                        for generator in sampling.spawn(42, shards)
+                    ],
+                )
+            ),
+            repeats,
+        )
+
+    width: int = max(len(name) for name in results)
+
+    print(f"Shuffling {size:,} items, best of {repeats} runs:")
+
+    for name, elapsed in results.items():
+        print(
+            f"  {name:<{width}}  {elapsed * 1000:10.2f} ms  {size / elapsed:14,.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmarks the time taken to reload a saved fluentlist, comparing binary snapshots,
+written via fluentlist.save(), with and without compression, against pickle and JSON
+files, for lists of integers, floats, strings and dictionaries; also reports the size
+of each file, and the time taken to read the last tenth of a snapshot via load(start=).
+
+Run from the repository root via: PYTHONPATH=source python benchmarks/snapshot.py"""
+
+from __future__ import annotations
+
+from fluently import fluentlist
+
+import argparse
+import json
+import os
+import pickle
+import tempfile
+import time
+
+
+def measure(function: callable, repeats: int) -> float:
+    """Returns the best wall-clock time in seconds of the specified number of runs."""
+
+    best: float = None
+
+    for _ in range(repeats):
+        started = time.perf_counter()
+
+        function()
+
+        elapsed = time.perf_counter() - started
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def dump_pickle(items: fluentlist, path: str) -> None:
+    with open(path, "wb") as file:
+        pickle.dump(items, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_pickle(path: str) -> fluentlist:
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+
+def dump_json(items: fluentlist, path: str) -> None:
+    with open(path, "w") as file:
+        json.dump(items, file)
+
+
+def load_json(path: str) -> fluentlist:
+    with open(path) as file:
+        return fluentlist(json.load(file))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    size: int = arguments.size
+    repeats: int = arguments.repeats
+
+    datasets: dict[str, fluentlist] = {
+        "integers": fluentlist(range(size)),
+        "floats": fluentlist(index / 7 for index in range(size)),
+        "strings": fluentlist(f"item-{index}" for index in range(size)),
+        "dictionaries": fluentlist(
+            {"id": index, "name": f"item-{index}"} for index in range(size)
+        ),
+    }
+
+    formats: dict[str, tuple[callable, callable]] = {
+        "snapshot": (lambda items, path: items.save(path), fluentlist.load),
+        "snapshot, zlib": (
+            lambda items, path: items.save(path, compress="zlib"),
+            fluentlist.load,
+        ),
+        "pickle": (dump_pickle, load_pickle),
+        "json": (dump_json, load_json),
+    }
+
+    print(f"Reloading lists of {size:,} items:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "items")
+
+        for kind, items in datasets.items():
+            for name, (dump, load) in formats.items():
+                dump(items, path)
+
+                assert load(path) == items
+
+                elapsed: float = measure(lambda: load(path), repeats)
+
+                print(
+                    f"  {kind + ', ' + name + ':':<30} {elapsed * 1000:10.2f} ms"
+                    f"  {os.path.getsize(path):>14,} bytes"
+                )
+
+            items.save(path, compress="zlib")
+
+            elapsed = measure(
+                lambda: fluentlist.load(path, start=size - size // 10), repeats
+            )
+
+            print(f"  {kind + ', last tenth, zlib:':<30} {elapsed * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,17 @@
 from fluently.list import fluentlist, flulist, flist
 from fluently.set import fluentset, fluset, fset
+from fluently.stringset import fluentstringset, flustringset, fstringset
 from fluently.tuple import fluenttuple, flutuple, ftuple
+from fluently.array import fluentarray, fluarray, farray
+from fluently.bag import fluentbag, flubag, fbag
+from fluently.sortedlist import fluentsortedlist, flusortedlist, fsortedlist
+from fluently.spilled import fluentspilledlist, fluspilledlist, fspilledlist
+from fluently.view import fluentview, fluview, fview
+from fluently.numeric import fluentnumeric, flunumeric, fnumeric
+from fluently.mapped import fluentmapped, flumapped, fmapped
+from fluently.shared import fluentshared, flushared, fshared
+from fluently.records import fluentrecords, flurecords, frecords, fluentrecord
+from fluently.grouping import fluentgroups
 
 __all__ = [
     "fluentlist",
@@ -9,7 +20,39 @@ __all__ = [
     "fluentset",
     "fluset",
     "fset",
+    "fluentstringset",
+    "flustringset",
+    "fstringset",
     "fluenttuple",
     "flutuple",
     "ftuple",
+    "fluentarray",
+    "fluarray",
+    "farray",
+    "fluentbag",
+    "flubag",
+    "fbag",
+    "fluentsortedlist",
+    "flusortedlist",
+    "fsortedlist",
+    "fluentspilledlist",
+    "fluspilledlist",
+    "fspilledlist",
+    "fluentview",
+    "fluview",
+    "fview",
+    "fluentnumeric",
+    "flunumeric",
+    "fnumeric",
+    "fluentmapped",
+    "flumapped",
+    "fmapped",
+    "fluentshared",
+    "flushared",
+    "fshared",
+    "fluentrecords",
+    "flurecords",
+    "frecords",
+    "fluentrecord",
+    "fluentgroups",
 ]
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.list import fluentlist
+from fluently.stats import stats
+from array import array
+from functools import partial, reduce
+
+import builtins
+import pickle
+import typing
+
+if typing.TYPE_CHECKING:
+    from fluently.numeric import fluentnumeric
+    from fluently.shared import fluentshared
+    from fluently.view import fluentview
+
+logger = logger.getChild(__name__)
+
+# The typecodes supported by the array module for integer and floating point values
+typecodes: str = "bBhHiIlLqQfd"
+
+
+class fluentarray(array):
+    """An array subclass with a fluent interface, which holds its integer or floating
+    point values unboxed in a single contiguous block of memory, as per the `array`
+    module, rather than as separate Python objects, using around a quarter of the memory
+    needed by a list of floats. As with the `array` class, the arrays support the buffer
+    protocol, so their memory may be shared without copying via `memoryview()`."""
+
+    def __new__(cls, typecode: str = "d", initializer: object = None):
+        if not isinstance(typecode, str):
+            raise TypeError("The 'typecode' argument must have a string value!")
+        elif not (len(typecode) == 1 and typecode in typecodes):
+            raise ValueError(
+                "The 'typecode' argument must have one of the following values: %s!"
+                % (", ".join(typecodes))
+            )
+
+        if initializer is None:
+            return super().__new__(cls, typecode)
+        else:
+            return super().__new__(cls, typecode, initializer)
+
+    def _new(self, items: object = None) -> fluentarray:
+        """Creates a new array of the same typecode holding the specified items."""
+
+        return fluentarray(self.typecode, items)
+
+    def length(self) -> int:
+        """Supports returning the count of the total number of items in the array."""
+
+        return len(self)
+
+    def clone(self) -> fluentarray:
+        """Supports returning a cloned, independent copy of the current array."""
+
+        return self._new(self)
+
+    def prepend(self, item: int | float) -> fluentarray:
+        """Supports prepending the specified item to the start of the array."""
+
+        super().insert(0, item)
+
+        return self
+
+    def append(self, item: int | float) -> fluentarray:
+        """Supports appending the specified item to the end of the array."""
+
+        super().append(item)
+
+        return self
+
+    def extend(self, iterable) -> fluentarray:
+        """Supports extending the current array with the specified items by appending."""
+
+        super().extend(iterable)
+
+        return self
+
+    def insert(self, index: int, item: int | float) -> fluentarray:
+        """Supports inserting the specified item into the array at the specified index."""
+
+        super().insert(index, item)
+
+        return self
+
+    def remove(self, item: int | float, raises: bool = True) -> fluentarray:
+        """Supports removing the first occurance of the specified item from the array."""
+
+        if not isinstance(raises, bool):
+            raise TypeError("The 'raises' argument must have a boolean value!")
+
+        try:
+            super().remove(item)
+        except ValueError as exception:
+            if raises is True:
+                raise exception
+            else:
+                logger.error(str(exception))
+
+        return self
+
+    def discard(self, item: int | float) -> fluentarray:
+        """Supports removing the specified item from the array, without raising an error
+        should the item be found not to exist - consistent with behaviour of sets."""
+
+        try:
+            super().remove(item)
+        except ValueError:
+            pass
+
+        return self
+
+    def clear(self) -> fluentarray:
+        """Supports removing all of the items from the array."""
+
+        del self[:]
+
+        return self
+
+    def repeat(self, count: int) -> fluentarray:
+        """Supports repeating the contents of the array the specified number of times."""
+
+        if not isinstance(count, int):
+            raise TypeError("The 'count' argument must have an integer value!")
+        elif not count >= 1:
+            raise ValueError(
+                "The 'count' argument must have an integer value of 1 or more!"
+            )
+
+        super().__imul__(count)
+
+        return self
+
+    def reverse(self) -> fluentarray:
+        """Supports reversing the order of the items in the array."""
+
+        super().reverse()
+
+        return self
+
+    def slice(self, start: int, stop: int = None, step: int = 1) -> fluentarray:
+        """Supports returning a new array containing the sliced part of the array."""
+
+        if not isinstance(start, int):
+            raise TypeError("The 'start' argument must have an integer value!")
+
+        if stop is None:
+            pass
+        elif not isinstance(stop, int):
+            raise TypeError("The 'stop' argument must have an integer value!")
+
+        if not isinstance(step, int):
+            raise TypeError("The 'step' argument must have an integer value!")
+
+        return self._new(self[builtins.slice(start, stop, step)])
+
+    def take(self, index: int) -> fluentarray:
+        """Supports returning a new array containing the items from the start of the
+        array until the index specified; the original array remains unmodified."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return self.slice(start=0, stop=index)
+
+    def drop(self, index: int) -> fluentarray:
+        """Supports returning a new array containing the items from the specified
+        index until the end of the array; the original array remains unmodified."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return self.slice(start=index)
+
+    def view(self, start: int = None, stop: int = None, step: int = None) -> fluentview:
+        """Supports returning a read-only view onto the array, or the sliced part of it,
+        without copying any of its items; see the `fluentview` class for details."""
+
+        from fluently.view import fluentview
+
+        return fluentview(
+            self, start, stop, step, factory=partial(fluentarray, self.typecode)
+        )
+
+    def share(self, name: str = None) -> fluentshared:
+        """Supports copying the array's values into a new block of shared memory, with a
+        single copy, returning a read-only `fluentshared` sequence which owns the block;
+        see the `fluentshared` class for details."""
+
+        from fluently.shared import fluentshared
+
+        return fluentshared.create(self, name=name)
+
+    def unique(self) -> fluentarray:
+        """Supports returning a new version of the array without duplicate values, with
+        the values retained in the order in which they first appear."""
+
+        return self._new(dict.fromkeys(self))
+
+    def stats(
+        self,
+        key: str | callable = None,
+        bins: int | list[float] = None,
+        bounds: tuple[float, float] = None,
+    ) -> dict[str, object]:
+        """Supports computing the count, sum, min, max, mean, variance and standard
+        deviation, and optionally a histogram, of the array's values, via the vectorised
+        path of the `fluently.stats.stats()` function unless a key is specified."""
+
+        return stats(self, key=key, bins=bins, bounds=bounds)
+
+    def numeric(self, typecode: str = None, backend: str = None) -> fluentnumeric:
+        """Supports returning the array's values as a `fluentnumeric` sequence, whose
+        operations are vectorised via NumPy if the optional dependency is installed."""
+
+        from fluently.numeric import fluentnumeric
+
+        return fluentnumeric(self, typecode=typecode, backend=backend)
+
+    def contains(self, value: int | float) -> bool:
+        """Supports returning if the array contains the specified value or not."""
+
+        return value in self
+
+    def any(self, value: int | float) -> bool:
+        """Supports returning if the array contains the specified value at least once."""
+
+        return value in self
+
+    def all(self, value: int | float) -> bool:
+        """Supports returning if the array is completely filled with the specified value."""
+
+        return self.count(value) == self.length()
+
+    def map(self, function: callable, typecode: str = None) -> fluentarray:
+        """Supports running a callback on each item in the array returning a new array,
+        of the same typecode as the current array, unless another typecode is specified,
+        such as 'd' when mapping integers to floats."""
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        return fluentarray(typecode or self.typecode, builtins.map(function, self))
+
+    def reduce(self, function: callable, initialiser=None) -> object:
+        """Supports running a callback on each item in the array returning the reduced value."""
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        if initialiser is None:
+            return reduce(function, self)
+        else:
+            return reduce(function, self, initialiser)
+
+    def sort(self, key: callable = None, reverse: bool = False) -> fluentarray:
+        """Provides a fluent interface for sorting the current array in-place."""
+
+        if key is None:
+            pass
+        elif not callable(key):
+            raise TypeError(
+                "The 'key' argument, if specified, must reference a callable!"
+            )
+
+        if not isinstance(reverse, bool):
+            raise TypeError("The 'reverse' argument must have a boolean value!")
+
+        self[:] = array(self.typecode, builtins.sorted(self, key=key, reverse=reverse))
+
+        return self
+
+    def sorted(self, key: callable = None, reverse: bool = False) -> fluentarray:
+        """Supports returning a new array holding the items of the array in sorted order."""
+
+        return self.clone().sort(key=key, reverse=reverse)
+
+    def filter(self, predicate: callable) -> fluentarray:
+        """Supports returning a new array holding the items which match the predicate."""
+
+        if not callable(predicate):
+            raise TypeError("The 'predicate' argument must reference a callable!")
+
+        return self._new(builtins.filter(predicate, self))
+
+    def first(self, predicate: callable = None) -> int | float | None:
+        """Supports returning the first item, optionally the first matching the specified
+        predicate, or None if the array is empty or there is no match."""
+
+        items = self if predicate is None else self.filter(predicate)
+
+        return items[0] if (len(items) >= 1) else None
+
+    def last(self, predicate: callable = None) -> int | float | None:
+        """Supports returning the last item, optionally the last matching the specified
+        predicate, or None if the array is empty or there is no match."""
+
+        items = self if predicate is None else self.filter(predicate)
+
+        return items[-1] if (len(items) >= 1) else None
+
+    def tolist(self) -> fluentlist[int | float]:
+        """Supports returning the items of the array as a new fluentlist."""
+
+        return fluentlist(super().tolist())
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """Supports pickling the array, where with pickle protocol 5 or later the array's
+        memory is provided via a `PickleBuffer`, so that it is either written directly to
+        the pickle, without first being copied into a bytes object, or, if the pickler
+        was given a `buffer_callback`, is transferred out-of-band without copying; while
+        the buffer is referenced, the array cannot be resized."""
+
+        if protocol >= 5:
+            values = pickle.PickleBuffer(memoryview(self).cast("B"))
+        else:
+            values = self.tobytes()
+
+        return (_reconstruct, (self.__class__, self.typecode, values))
+
+    def __copy__(self) -> fluentarray:
+        """Supports copying the array via the 'copy' module, retaining its class."""
+
+        return self.clone()
+
+    def __deepcopy__(self, memo: dict) -> fluentarray:
+        """Supports deep copying the array via the 'copy' module; as the array holds
+        numeric values rather than references, this is equivalent to a shallow copy."""
+
+        return self.clone()
+
+    def __add__(self, items: object) -> fluentarray:
+        """Supports appending items to a clone of the array via the '+' syntax."""
+
+        return self.clone().extend(items)
+
+    def __iadd__(self, items: object) -> fluentarray:
+        """Supports appending items to the current array in-place via the '+=' syntax."""
+
+        return self.extend(items)
+
+    def __mul__(self, count: int) -> fluentarray:
+        """Supports repeating the items of a clone of the array via the '*' syntax."""
+
+        return self.clone().repeat(count)
+
+    def __imul__(self, count: int) -> fluentarray:
+        """Supports repeating the items of the current array in-place via the '*=' syntax."""
+
+        return self.repeat(count)
+
+    def __sub__(self, item: int | float) -> fluentarray:
+        """Supports removing specified item from a clone of the array via the '-' syntax."""
+
+        return self.clone().remove(item)
+
+    def __isub__(self, item: int | float) -> fluentarray:
+        """Supports removing the specified item from the current array via the '-=' syntax."""
+
+        return self.remove(item)
+
+
+def _reconstruct(cls: type, typecode: str, values: object) -> fluentarray:
+    """Reconstructs a pickled array from its typecode and the bytes of its values, which
+    may be any object supporting the buffer protocol, such as an out-of-band buffer."""
+
+    instance = cls(typecode)
+
+    instance.frombytes(values)
+
+    return instance
+
+
+# Shorthand aliases
+farray = fluarray = fluentarray
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.list import fluentlist
+from collections import Counter
+
+logger = logger.getChild(__name__)
+
+
+class fluentbag(Counter):
+    """A multiset (bag) implementation with a fluent interface, built upon the standard
+    library's `Counter` class, which holds each distinct item once alongside a count of
+    its occurrences, so that counting occurrences of an item is a constant time lookup
+    rather than requiring a scan of the whole container."""
+
+    def length(self) -> int:
+        """Supports returning the count of the number of distinct items in the bag."""
+
+        return len(self)
+
+    def clone(self) -> fluentbag[object]:
+        """Supports returning a cloned, independent copy of the current bag."""
+
+        return fluentbag(self)
+
+    def add(self, item: object, count: int = 1) -> fluentbag[object]:
+        """Supports adding the specified item to the bag the specified number of times."""
+
+        if not isinstance(count, int):
+            raise TypeError("The 'count' argument must have an integer value!")
+        elif not count >= 1:
+            raise ValueError(
+                "The 'count' argument must have an integer value of 1 or more!"
+            )
+
+        self[item] += count
+
+        return self
+
+    def remove(
+        self, item: object, count: int = 1, raises: bool = True
+    ) -> fluentbag[object]:
+        """Supports removing the specified number of occurrences of the specified item
+        from the bag; should fewer occurrences be present, all of them are removed. If
+        the item is not present, and the `raises` keyword argument is set to its default
+        of `True` then the method will raise a `KeyError` exception noting the absence
+        of the specified item; if `raises` is set to `False`, the method will not raise
+        an exception but will log the absence of the item via the standard logger."""
+
+        if not isinstance(count, int):
+            raise TypeError("The 'count' argument must have an integer value!")
+        elif not count >= 1:
+            raise ValueError(
+                "The 'count' argument must have an integer value of 1 or more!"
+            )
+
+        if not isinstance(raises, bool):
+            raise TypeError("The 'raises' argument must have a boolean value!")
+
+        if self[item] > count:
+            self[item] -= count
+        elif item in self:
+            del self[item]
+        elif raises is True:
+            raise KeyError(item)
+        else:
+            logger.error(str(KeyError(item)))
+
+        return self
+
+    def discard(self, item: object) -> fluentbag[object]:
+        """Supports removing all occurrences of the specified item from the bag, without
+        raising an error should the item be found not to exist."""
+
+        self.pop(item, None)
+
+        return self
+
+    def clear(self) -> fluentbag[object]:
+        """Supports removing all of the items from the bag."""
+
+        super().clear()
+
+        return self
+
+    def update(self, iterable: object = None, /, **kwargs) -> fluentbag[object]:
+        """Supports adding the items or counts from the specified iterable or mapping
+        to the bag, counting the items of an iterable in a single pass."""
+
+        super().update(iterable, **kwargs)
+
+        return self
+
+    def count(self, item: object) -> int:
+        """Supports returning a count of how many times the specified item is present."""
+
+        return self.get(item, 0)
+
+    def contains(self, item: object) -> bool:
+        """Supports returning if the bag contains the specified item or not."""
+
+        return item in self
+
+    def most_common(self, k: int = None) -> fluentlist[tuple[object, int]]:
+        """Supports returning a new list of the specified number of most common items
+        along with their counts, ordered from the most to the least common; if the
+        number of items is specified, a bounded heap is used rather than a full sort."""
+
+        if k is None:
+            pass
+        elif not isinstance(k, int):
+            raise TypeError(
+                "The 'k' argument, if specified, must have an integer value!"
+            )
+
+        return fluentlist(super().most_common(k))
+
+    def union(self, *others: Counter) -> fluentbag[object]:
+        """Supports returning a new bag holding the items from the current bag and the
+        specified bags, where each item is held the largest number of times it occurs
+        in any of the bags."""
+
+        union = self.clone()
+
+        for other in others:
+            for item, count in other.items():
+                if count > union.get(item, 0):
+                    union[item] = count
+
+        return union
+
+    def intersect(self, *others: Counter) -> fluentbag[object]:
+        """Supports returning a new bag holding only the items found in the current bag
+        and in all of the specified bags, where each item is held the smallest number
+        of times it occurs in any of the bags."""
+
+        intersection = self.clone()
+
+        for other in others:
+            for item, count in list(intersection.items()):
+                count = min(count, other.get(item, 0))
+
+                if count > 0:
+                    intersection[item] = count
+                else:
+                    del intersection[item]
+
+        return intersection
+
+    def tolist(self) -> fluentlist[object]:
+        """Supports returning a new list holding each item repeated as many times as it
+        occurs in the bag, in the order in which the items were first added."""
+
+        return fluentlist(self.elements())
+
+
+# Shorthand aliases
+fbag = flubag = fluentbag
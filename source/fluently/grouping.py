@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.utilities import accessor
+from fluently import spill
+from collections.abc import Mapping
+
+logger = logger.getChild(__name__)
+
+
+class fluentgroups(Mapping):
+    """A read-only mapping of group keys to the items sharing that key, as returned by
+    the `group_by()` method of the fluent containers. The groups are only materialised
+    when the mapping is first accessed, so calling `agg()` to compute per-group summary
+    values can be performed in a single pass without building the groups at all. The
+    optional getter, which defaults to `accessor()`, obtains the callable used to get
+    the value named by the key, or by an aggregate, from each of the items."""
+
+    aggregates: tuple[str] = ("count", "sum", "min", "max", "mean")
+
+    def __init__(
+        self,
+        items: object,
+        key: str | callable,
+        factory: type = None,
+        memory_limit: int | str = None,
+        spill_dir: str = None,
+        getter: callable = None,
+    ):
+        self._items = items
+        self._getter: callable = getter or accessor
+        self._key: callable = self._getter(key)
+        self._factory: type = factory
+        self._groups: dict[object, object] = None
+        self._limit: int = None if memory_limit is None else spill.size(memory_limit)
+        self._directory: str = spill_dir
+
+    def _materialise(self) -> dict[object, object]:
+        """Groups the items in a single pass, the first time the groups are needed."""
+
+        if self._groups is None:
+            groups: dict[object, list] = {}
+
+            key: callable = self._key
+
+            for item in self._items:
+                value = key(item)
+
+                if value in groups:
+                    groups[value].append(item)
+                else:
+                    groups[value] = [item]
+
+            if self._factory is not None:
+                groups = {
+                    value: self._factory(group) for value, group in groups.items()
+                }
+
+            self._groups = groups
+
+        return self._groups
+
+    def __getitem__(self, key: object) -> object:
+        return self._materialise()[key]
+
+    def __iter__(self):
+        return iter(self._materialise())
+
+    def __len__(self) -> int:
+        return len(self._materialise())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._materialise()!r})"
+
+    def length(self) -> int:
+        """Supports returning the count of the number of distinct groups."""
+
+        return len(self)
+
+    def stream(self):
+        """Supports iterating over the (key, group) pairs in the order in which each key
+        was first seen; if a memory limit was specified when grouping, and the items
+        exceed it, the items are hash-partitioned by key across temporary files, with the
+        number of partitions derived from the limit, and the groups of each partition are
+        built and yielded in turn, so that only one partition's groups, rather than all
+        of the groups, are held in memory, and the keys are ordered by partition, and by
+        when they were first seen within each partition."""
+
+        if self._groups is not None or self._limit is None:
+            yield from self._materialise().items()
+        else:
+            for key, group in spill.group(
+                self._items, self._key, limit=self._limit, directory=self._directory
+            ):
+                yield (key, group if self._factory is None else self._factory(group))
+
+    def agg(self, **aggregates: dict[str, str | callable]) -> dict[object, dict]:
+        """Supports computing summary values for each group in a single hash-aggregate
+        pass over the items, without materialising the groups. Each keyword names the
+        aggregate to compute, one of 'count', 'sum', 'min', 'max' or 'mean', while its
+        value names the attribute (or references a callable returning the value) to be
+        aggregated; the 'count' aggregate may instead be given `True` to count items.
+        As with SQL aggregates, values of None are ignored. Returns a dictionary which
+        maps each group key to a dictionary of the computed aggregate values."""
+
+        if len(aggregates) == 0:
+            raise ValueError("At least one aggregate must be specified!")
+
+        accessors: dict[str, callable] = {}
+
+        for name, value in aggregates.items():
+            if not name in self.aggregates:
+                raise ValueError(
+                    f"The '{name}' aggregate is not supported; it must be one of: "
+                    + ", ".join(self.aggregates)
+                    + "!"
+                )
+
+            accessors[name] = None if value is True else self._getter(value)
+
+        count: callable = accessors.get("count")
+        values: callable = accessors.get("sum")
+        minimum: callable = accessors.get("min")
+        maximum: callable = accessors.get("max")
+        mean: callable = accessors.get("mean")
+
+        key: callable = self._key
+
+        # Each group's running state is held in a list of [count, sum, min, max, total,
+        # tally] to minimise per-item overhead; the mean is computed from total / tally
+        states: dict[object, list] = {}
+
+        for item in self._items:
+            group = key(item)
+
+            if group in states:
+                state = states[group]
+            else:
+                state = states[group] = [0, 0, None, None, 0, 0]
+
+            if count is None or count(item) is not None:
+                state[0] += 1
+
+            if values is not None:
+                value = values(item)
+
+                if value is not None:
+                    state[1] += value
+
+            if minimum is not None:
+                value = minimum(item)
+
+                if value is not None and (state[2] is None or value < state[2]):
+                    state[2] = value
+
+            if maximum is not None:
+                value = maximum(item)
+
+                if value is not None and (state[3] is None or value > state[3]):
+                    state[3] = value
+
+            if mean is not None:
+                value = mean(item)
+
+                if value is not None:
+                    state[4] += value
+                    state[5] += 1
+
+        results: dict[object, dict] = {}
+
+        for group, state in states.items():
+            result = results[group] = {}
+
+            for name in aggregates:
+                if name == "count":
+                    result[name] = state[0]
+                elif name == "sum":
+                    result[name] = state[1]
+                elif name == "min":
+                    result[name] = state[2]
+                elif name == "max":
+                    result[name] = state[3]
+                elif name == "mean":
+                    result[name] = (state[4] / state[5]) if state[5] else None
+
+        return results
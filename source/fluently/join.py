@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.utilities import accessor
+from itertools import groupby
+
+logger = logger.getChild(__name__)
+
+# The supported join types, noting for each whether unmatched left and right items
+# respectively are included in the results
+joins: dict[str, tuple[bool, bool]] = {
+    "inner": (False, False),
+    "left": (True, False),
+    "right": (False, True),
+    "outer": (True, True),
+}
+
+
+def join(
+    left: object,
+    right: object,
+    on: str | callable = None,
+    left_key: str | callable = None,
+    right_key: str | callable = None,
+    how: str = "inner",
+    merge: callable = None,
+    presorted: bool = False,
+):
+    """The join method provides support for joining the items of two iterables whose
+    keys are equal, as named by the `on` attribute or returned by the `on` callable, or
+    separately for each side via `left_key` and `right_key`, returning an iterator of
+    (left, right) pairs, or of the results of calling `merge` with each pair; for left,
+    right and outer joins, unmatched items are paired with None. By default a hash join
+    is performed, building a hash table from the smaller of the two sides, where its
+    length is known, and then streaming the other side past it, so that the join
+    completes in O(n + m) time; items with a key of None are never matched, as per SQL.
+    If both sides are already sorted by key, `presorted` may be set to `True` to perform
+    a sort-merge join instead, which streams both sides without building a hash table,
+    yielding the pairs in key order."""
+
+    if on is None:
+        if left_key is None or right_key is None:
+            raise TypeError(
+                "Either the 'on' argument or both the 'left_key' and 'right_key' "
+                "arguments must be specified!"
+            )
+    elif left_key is not None or right_key is not None:
+        raise TypeError(
+            "The 'on' argument cannot be combined with 'left_key' or 'right_key'!"
+        )
+    else:
+        left_key = right_key = on
+
+    if not how in joins:
+        raise ValueError(
+            "The 'how' argument must have a value of: %s!" % (", ".join(joins.keys()))
+        )
+
+    if not (isinstance(left_key, str) or callable(left_key)):
+        raise TypeError(
+            "The 'left_key' argument must have a string value or reference a callable!"
+        )
+
+    if not (isinstance(right_key, str) or callable(right_key)):
+        raise TypeError(
+            "The 'right_key' argument must have a string value or reference a callable!"
+        )
+
+    if merge is None:
+        pass
+    elif not callable(merge):
+        raise TypeError(
+            "The 'merge' argument, if specified, must reference a callable!"
+        )
+
+    if not isinstance(presorted, bool):
+        raise TypeError("The 'presorted' argument must have a boolean value!")
+
+    pairs = _join(left, right, accessor(left_key), accessor(right_key), how, presorted)
+
+    if merge is not None:
+        pairs = map(lambda pair: merge(*pair), pairs)
+
+    return pairs
+
+
+def _join(
+    left: object,
+    right: object,
+    left_key: callable,
+    right_key: callable,
+    how: str,
+    presorted: bool,
+):
+    """Joins the items of the two iterables via the keys, as per the `join()` method,
+    choosing between a sort-merge join and a hash join built from the smaller side."""
+
+    (lefts, rights) = joins[how]
+
+    if presorted is True:
+        return _merge(left, right, left_key, right_key, lefts, rights)
+
+    # Build the hash table from the right side if it is known to be the smaller side,
+    # otherwise build from the left side, and stream the right side, which need not
+    # have a known length, and so may be an iterator, past the table
+    if hasattr(right, "__len__") and len(right) <= len(left):
+        return _hash(left, right, left_key, right_key, lefts, rights, False)
+    else:
+        return _hash(right, left, right_key, left_key, rights, lefts, True)
+
+
+def _hash(
+    probe: object,
+    build: object,
+    probe_key: callable,
+    build_key: callable,
+    probes: bool,
+    builds: bool,
+    swapped: bool,
+):
+    """Performs a hash join as a generator on behalf of the join method, building the
+    hash table from the build side, and then streaming the probe side past the table;
+    if the sides have been swapped, the pairs are swapped back as they are yielded."""
+
+    table: dict[object, list] = {}
+    unkeyed: list = []
+
+    for item in build:
+        key = build_key(item)
+
+        if key is None:
+            unkeyed.append(item)
+        elif key in table:
+            table[key].append(item)
+        else:
+            table[key] = [item]
+
+    matched: set = set()
+
+    for item in probe:
+        key = probe_key(item)
+
+        matches = None if key is None else table.get(key)
+
+        if matches is not None:
+            if builds is True:
+                matched.add(key)
+
+            for match in matches:
+                yield (match, item) if swapped else (item, match)
+        elif probes is True:
+            yield (None, item) if swapped else (item, None)
+
+    if builds is True:
+        for key, items in table.items():
+            if not key in matched:
+                for item in items:
+                    yield (item, None) if swapped else (None, item)
+
+        for item in unkeyed:
+            yield (item, None) if swapped else (None, item)
+
+
+def _merge(
+    left: object,
+    right: object,
+    left_key: callable,
+    right_key: callable,
+    lefts: bool,
+    rights: bool,
+):
+    """Performs a sort-merge join as a generator on behalf of the join method, walking
+    the runs of equally keyed items on each side in step with one another; as with the
+    hash join, runs of items with a key of None, which may be placed anywhere in either
+    side, such as first or last, are never matched, nor compared with other keys."""
+
+    lgroups = groupby(left, key=left_key)
+    rgroups = groupby(right, key=right_key)
+
+    lgroup = next(lgroups, None)
+    rgroup = next(rgroups, None)
+
+    while lgroup is not None and rgroup is not None:
+        (lkey, litems) = lgroup
+        (rkey, ritems) = rgroup
+
+        if lkey is None:
+            if lefts is True:
+                for item in litems:
+                    yield (item, None)
+
+            lgroup = next(lgroups, None)
+        elif rkey is None:
+            if rights is True:
+                for item in ritems:
+                    yield (None, item)
+
+            rgroup = next(rgroups, None)
+        elif lkey < rkey:
+            if lefts is True:
+                for item in litems:
+                    yield (item, None)
+
+            lgroup = next(lgroups, None)
+        elif rkey < lkey:
+            if rights is True:
+                for item in ritems:
+                    yield (None, item)
+
+            rgroup = next(rgroups, None)
+        else:
+            ritems = list(ritems)
+
+            for litem in litems:
+                for ritem in ritems:
+                    yield (litem, ritem)
+
+            lgroup = next(lgroups, None)
+            rgroup = next(rgroups, None)
+
+    while lefts is True and lgroup is not None:
+        for item in lgroup[1]:
+            yield (item, None)
+
+        lgroup = next(lgroups, None)
+
+    while rights is True and rgroup is not None:
+        for item in rgroup[1]:
+            yield (None, item)
+
+        rgroup = next(rgroups, None)
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
 from fluently.logging import logger
-from fluently.utilities import filter
+from fluently.grouping import fluentgroups
+from fluently.join import join
+from fluently.stats import stats
+from fluently.utilities import filter, sortkey
+from fluently import sampling, snapshot, spill, streams
 from functools import reduce
+from itertools import islice
 
 import random
+import bisect
 import builtins
+import heapq
+import typing
+
+if typing.TYPE_CHECKING:
+    from fluently.bag import fluentbag
+    from fluently.numeric import fluentnumeric
+    from fluently.view import fluentview
 
 logger = logger.getChild(__name__)
 
@@ -124,13 +137,39 @@ class fluentlist(list):
 
         return self
 
-    def shuffle(self) -> fluentlist[object]:
-        """Supports randomly suffling the order of the items in the list."""
+    def shuffle(
+        self, seed: int | str | bytes = None, rng: random.Random = None
+    ) -> fluentlist[object]:
+        """Supports randomly suffling the order of the items in the list, optionally via
+        a generator seeded with the specified seed, or via the specified generator."""
 
-        random.shuffle(self)
+        sampling.generator(seed, rng).shuffle(self)
 
         return self
 
+    def shuffled(
+        self,
+        k: int = None,
+        seed: int | str | bytes = None,
+        rng: random.Random = None,
+    ) -> fluentlist[object]:
+        """Supports returning a new list holding the items of the list shuffled via a
+        partial Fisher-Yates shuffle, which only randomises the first k positions."""
+
+        return fluentlist(sampling.shuffled(self, k=k, seed=seed, rng=rng))
+
+    def sample(
+        self,
+        k: int,
+        weights: str | callable | object = None,
+        seed: int | str | bytes = None,
+        rng: random.Random = None,
+    ) -> fluentlist[object]:
+        """Supports returning a new list holding a random sample of k of the items of
+        the list, drawn without replacement, optionally weighted by the weights."""
+
+        return fluentlist(sampling.sample(self, k, weights=weights, seed=seed, rng=rng))
+
     def slice(self, start: int, stop: int = None, step: int = 1) -> fluentlist[object]:
         """Supports returning a new list containing the sliced part of the list."""
 
@@ -165,6 +204,217 @@ class fluentlist(list):
 
         return self.slice(start=index)
 
+    def view(self, start: int = None, stop: int = None, step: int = None) -> fluentview:
+        """Supports returning a read-only view onto the list, or the sliced part of it,
+        without copying any of its items; see the `fluentview` class for details."""
+
+        from fluently.view import fluentview
+
+        return fluentview(self, start, stop, step, factory=fluentlist)
+
+    @classmethod
+    def from_lines(
+        cls,
+        path: str,
+        encoding: str = "utf-8",
+        lazy: bool = False,
+        threaded: bool = False,
+    ) -> fluentlist[str]:
+        """Supports creating a new list holding the lines of the specified text file,
+        without their line endings, where the file is read in large buffered blocks. If
+        `lazy` is set to `True` then an iterator is returned instead, which yields the
+        lines as the file is read, and if `threaded` is set to `True` the file is read
+        ahead in a background thread; see `fluently.streams.read_lines()` for more."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        items = streams.read_lines(path, encoding=encoding, threaded=threaded)
+
+        return items if lazy is True else cls(items)
+
+    @classmethod
+    def from_jsonl(
+        cls,
+        path: str,
+        encoding: str = "utf-8",
+        lazy: bool = False,
+        threaded: bool = False,
+    ) -> fluentlist[object]:
+        """Supports creating a new list holding the decoded items of the specified JSON
+        Lines file, where the file is read and decoded in large batches of lines. If
+        `lazy` is set to `True` then an iterator is returned instead, which yields the
+        items as the file is read, and if `threaded` is set to `True` the file is read
+        ahead in a background thread; see `fluently.streams.read_jsonl()` for more."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        items = streams.read_jsonl(path, encoding=encoding, threaded=threaded)
+
+        return items if lazy is True else cls(items)
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str,
+        fields: list[str] = None,
+        encoding: str = "utf-8",
+        lazy: bool = False,
+        threaded: bool = False,
+        **formatting: dict[str, object],
+    ) -> fluentlist[dict[str, str]]:
+        """Supports creating a new list holding the rows of the specified CSV file, each
+        as a dictionary keyed by the field names, taken from the file's first row unless
+        specified. If `lazy` is set to `True` then an iterator is returned instead, which
+        yields the rows as the file is read, and if `threaded` is set to `True` the file
+        is read ahead in a background thread; see `fluently.streams.read_csv()`."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        items = streams.read_csv(
+            path, fields=fields, encoding=encoding, threaded=threaded, **formatting
+        )
+
+        return items if lazy is True else cls(items)
+
+    def to_jsonl(self, path: str, encoding: str = "utf-8") -> fluentlist[object]:
+        """Supports writing the list's items to the specified JSON Lines file, encoding
+        and writing the items in batches; see `fluently.streams.write_jsonl()`."""
+
+        streams.write_jsonl(self, path, encoding=encoding)
+
+        return self
+
+    def to_csv(
+        self,
+        path: str,
+        fields: list[str] = None,
+        encoding: str = "utf-8",
+        **formatting: dict[str, object],
+    ) -> fluentlist[object]:
+        """Supports writing the list's items to the specified CSV file, as a header row
+        of the field names, which default to those of the first item, followed by a row
+        per item, written in batches; see `fluently.streams.write_csv()` for details."""
+
+        streams.write_csv(self, path, fields=fields, encoding=encoding, **formatting)
+
+        return self
+
+    def save(
+        self, path: str, compress: str = None, chunksize: int = None
+    ) -> fluentlist[object]:
+        """Supports saving the list's items to the specified file as a chunked binary
+        snapshot, optionally compressed with the 'zlib', 'bz2' or 'lzma' codec, which can
+        be read via the `load()` method; see `fluently.snapshot.save()` for details."""
+
+        snapshot.save(self, path, compress=compress, chunksize=chunksize)
+
+        return self
+
+    @classmethod
+    def load(
+        cls, path: str, start: int = 0, stop: int = None, lazy: bool = False
+    ) -> fluentlist[object]:
+        """Supports creating a new list holding the items of a snapshot saved via the
+        `save()` method, optionally only those from the start index until the stop index,
+        where chunks before the start are skipped. If `lazy` is set to `True` then an
+        iterator is returned instead, which reads and decodes each chunk as needed."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        if start == 0 and stop is None and lazy is False:
+            return cls(snapshot.load(path))
+
+        items = snapshot.stream(path, start=start, stop=stop)
+
+        return items if lazy is True else cls(items)
+
+    def chunk(self, size: int):
+        """Supports returning an iterator which yields the items of the list in batches
+        of the specified size, each as a new list, where the last batch may be smaller;
+        each batch is only created as it is needed, and is read directly from a single
+        pass over the items, so batching a large list only copies each item once."""
+
+        if not isinstance(size, int):
+            raise TypeError("The 'size' argument must have an integer value!")
+        elif not size >= 1:
+            raise ValueError(
+                "The 'size' argument must have an integer value of 1 or more!"
+            )
+
+        iterator = iter(self)
+
+        return (fluentlist(islice(iterator, size)) for _ in range(0, len(self), size))
+
+    def window(self, size: int, step: int = 1):
+        """Supports returning an iterator which yields sliding windows of the specified
+        size over the items of the list, each as a new list, where each window starts
+        the specified step number of items after the previous window; only complete
+        windows are yielded, so a list shorter than the window yields no windows; where
+        the windows do not overlap, they are read from a single pass over the items."""
+
+        if not isinstance(size, int):
+            raise TypeError("The 'size' argument must have an integer value!")
+        elif not size >= 1:
+            raise ValueError(
+                "The 'size' argument must have an integer value of 1 or more!"
+            )
+
+        if not isinstance(step, int):
+            raise TypeError("The 'step' argument must have an integer value!")
+        elif not step >= 1:
+            raise ValueError(
+                "The 'step' argument must have an integer value of 1 or more!"
+            )
+
+        if step >= size:
+            iterator = iter(self)
+
+            # Skip the items between windows, other than before the first window
+            return (
+                fluentlist(
+                    islice(iterator, step - size, step)
+                    if index
+                    else islice(iterator, size)
+                )
+                for index in range(0, len(self) - size + 1, step)
+            )
+
+        return (
+            fluentlist(self[index : index + size])
+            for index in range(0, len(self) - size + 1, step)
+        )
+
+    def partition(
+        self, predicate: callable
+    ) -> tuple[fluentlist[object], fluentlist[object]]:
+        """Supports splitting the list into two new lists in a single pass, the first
+        holding the items for which the predicate returns True, and the second holding
+        the remaining items, with the items of each retaining their original order."""
+
+        if not callable(predicate):
+            raise TypeError("The 'predicate' argument must reference a callable!")
+
+        matches: list = []
+        others: list = []
+
+        for item in self:
+            (matches if predicate(item) else others).append(item)
+
+        return (fluentlist(matches), fluentlist(others))
+
+    def split_at(self, index: int) -> tuple[fluentlist[object], fluentlist[object]]:
+        """Supports splitting the list at the specified index into two new lists, the
+        first holding the items before the index, and the second the remaining items."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return (fluentlist(self[:index]), fluentlist(self[index:]))
+
     def swap(self, source: int, target: int) -> fluentlist[object]:
         """Supports swapping the list items at the source and target indices."""
 
@@ -200,18 +450,29 @@ class fluentlist(list):
 
         return self
 
-    def unique(self) -> fluentlist[object]:
-        """Supports returning a new version of the list without duplicate values."""
+    def unique(
+        self, memory_limit: int | str = None, spill_dir: str = None, lazy: bool = False
+    ) -> fluentlist[object]:
+        """Supports returning a new version of the list without duplicate values, within
+        an optional `memory_limit`, or as an iterator if `lazy` is set to `True`."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
 
-        seenit: set = set()
-        unique: list = []
+        if memory_limit is None:
+            seenit: set = set()
+            unique: list = []
 
-        for item in self:
-            if item not in seenit:
-                seenit.add(item)
-                unique.append(item)
+            for item in self:
+                if item not in seenit:
+                    seenit.add(item)
+                    unique.append(item)
 
-        return fluentlist(unique)
+            return iter(unique) if lazy is True else fluentlist(unique)
+
+        items = spill.unique(self, limit=memory_limit, directory=spill_dir)
+
+        return items if lazy is True else fluentlist(items)
 
     def count(self, value: object) -> int:
         """Supports returning a count of how many list items have the specified value."""
@@ -224,6 +485,34 @@ class fluentlist(list):
 
         return found
 
+    def counts(self) -> fluentbag[object]:
+        """Supports returning a bag holding a count of how many times each distinct
+        value occurs in the list, computed in a single pass over the list."""
+
+        from fluently.bag import fluentbag
+
+        return fluentbag(self)
+
+    def stats(
+        self,
+        key: str | callable = None,
+        bins: int | list[float] = None,
+        bounds: tuple[float, float] = None,
+    ) -> dict[str, object]:
+        """Supports computing the count, sum, min, max, mean, variance and standard
+        deviation, and optionally a histogram, of the list's numeric values in a single
+        pass; see the `fluently.stats.stats()` function for details of the arguments."""
+
+        return stats(self, key=key, bins=bins, bounds=bounds)
+
+    def numeric(self, typecode: str = None, backend: str = None) -> fluentnumeric:
+        """Supports returning the list's values as a `fluentnumeric` sequence, whose
+        operations are vectorised via NumPy if the optional dependency is installed."""
+
+        from fluently.numeric import fluentnumeric
+
+        return fluentnumeric(self, typecode=typecode, backend=backend)
+
     def contains(self, value: object) -> bool:
         """Supports returning if the list contains the specified value or not."""
 
@@ -257,18 +546,175 @@ class fluentlist(list):
 
         return reduce(function, items)
 
-    def sort(self, *args, **kwargs) -> fluentlist[object]:
-        """Provides a fluent interface for sorting the current list in-place."""
+    def sort(
+        self, *args, by: str | list[str] = None, nones: str = "last", **kwargs
+    ) -> fluentlist[object]:
+        """Provides a fluent interface for sorting the current list in-place; alongside
+        the usual `key` and `reverse` arguments, the items may be sorted by one or more
+        attributes, by naming them via the `by` argument in order of precedence, where
+        names prefixed with '-' are sorted in descending order, and where items with None
+        values for an attribute are placed "first" or "last" as specified by `nones`."""
+
+        if by is not None:
+            if len(args) > 0 or "key" in kwargs:
+                raise TypeError("The 'by' and 'key' arguments cannot be combined!")
+
+            kwargs["key"], kwargs["reverse"] = sortkey(
+                by, nones=nones, reverse=kwargs.get("reverse", False)
+            )
 
         super().sort(*args, **kwargs)
 
         return self
 
-    def sorted(self, *args, **kwargs) -> fluentlist[object]:
+    def sorted(
+        self,
+        *args,
+        by: str | list[str] = None,
+        nones: str = "last",
+        memory_limit: int | str = None,
+        spill_dir: str = None,
+        lazy: bool = False,
+        **kwargs,
+    ) -> fluentlist[object]:
         """The sorted method provides a fluent interface for sorting the current list,
         returning a new list with the items ordered according to the specified sort."""
 
-        return fluentlist(builtins.sorted(self, *args, **kwargs))
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        if memory_limit is None:
+            items = self.clone().sort(*args, by=by, nones=nones, **kwargs)
+
+            return iter(items) if lazy is True else items
+
+        if len(args) > 0:
+            raise TypeError(
+                "The sort arguments must be specified as keyword arguments!"
+            )
+
+        key: callable = kwargs.pop("key", None)
+        reverse: bool = kwargs.pop("reverse", False)
+
+        if len(kwargs) > 0:
+            raise TypeError(
+                "Unsupported sort arguments: %s!" % (", ".join(kwargs.keys()))
+            )
+
+        if by is not None:
+            if key is not None:
+                raise TypeError("The 'by' and 'key' arguments cannot be combined!")
+
+            key, reverse = sortkey(by, nones=nones, reverse=reverse)
+
+        items = spill.sort(
+            self, key=key, reverse=reverse, limit=memory_limit, directory=spill_dir
+        )
+
+        return items if lazy is True else fluentlist(items)
+
+    def merge_sorted(
+        self,
+        *others: list[object],
+        key: callable = None,
+        reverse: bool = False,
+        lazy: bool = False,
+    ) -> fluentlist[object]:
+        """Supports merging the current list with the specified lists, each of which must
+        already be sorted by the same `key` and `reverse` arguments, into a new list."""
+
+        if key is None:
+            pass
+        elif not callable(key):
+            raise TypeError(
+                "The 'key' argument, if specified, must reference a callable!"
+            )
+
+        if not isinstance(reverse, bool):
+            raise TypeError("The 'reverse' argument must have a boolean value!")
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        merged = heapq.merge(self, *others, key=key, reverse=reverse)
+
+        return merged if lazy is True else fluentlist(merged)
+
+    def bisect(self, value: object, key: callable = None, side: str = "left") -> int:
+        """Supports returning the index at which the specified value would be inserted
+        into the list, which must already be sorted, to keep the list in sorted order,
+        via a binary search; if a `key` is specified, the value is compared against the
+        key of each item. The `side` argument determines whether the index is before
+        ("left") or after ("right") any existing items that compare equal to it."""
+
+        if key is None:
+            pass
+        elif not callable(key):
+            raise TypeError(
+                "The 'key' argument, if specified, must reference a callable!"
+            )
+
+        if side == "left":
+            return bisect.bisect_left(self, value, key=key)
+        elif side == "right":
+            return bisect.bisect_right(self, value, key=key)
+        else:
+            raise ValueError(
+                "The 'side' argument must have a value of 'left' or 'right'!"
+            )
+
+    def search_sorted(self, value: object, key: callable = None) -> int | None:
+        """Supports returning the index of the first item in the list, which must already
+        be sorted, which compares equal to the specified value, via a binary search; if
+        a `key` is specified, the value is compared against the key of each item. If no
+        matching item is found, the method returns None."""
+
+        index: int = self.bisect(value, key=key, side="left")
+
+        if index < len(self):
+            found = self[index] if key is None else key(self[index])
+
+            if found == value:
+                return index
+
+        return None
+
+    def top(
+        self, k: int, key: callable = None, reverse: bool = False
+    ) -> fluentlist[object]:
+        """Supports returning a new list of the list's first k items in sorted order."""
+
+        if not isinstance(k, int):
+            raise TypeError("The 'k' argument must have an integer value!")
+        elif not k >= 0:
+            raise ValueError(
+                "The 'k' argument must have an integer value of 0 or more!"
+            )
+
+        if key is None:
+            pass
+        elif not callable(key):
+            raise TypeError(
+                "The 'key' argument, if specified, must reference a callable!"
+            )
+
+        if not isinstance(reverse, bool):
+            raise TypeError("The 'reverse' argument must have a boolean value!")
+
+        if reverse is True:
+            return fluentlist(heapq.nlargest(k, self, key=key))
+        else:
+            return fluentlist(heapq.nsmallest(k, self, key=key))
+
+    def nsmallest(self, k: int, key: callable = None) -> fluentlist[object]:
+        """Supports returning a new list of the k smallest items of the list."""
+
+        return self.top(k, key=key)
+
+    def nlargest(self, k: int, key: callable = None) -> fluentlist[object]:
+        """Supports returning a new list of the k largest items of the list."""
+
+        return self.top(k, key=key, reverse=True)
 
     def filter(
         self, predicate: callable = None, **filters: dict[str, object]
@@ -287,6 +733,54 @@ class fluentlist(list):
         else:
             return fluentlist(filter(self, **filters))
 
+    def group_by(
+        self, key: str | callable, memory_limit: int | str = None, spill_dir: str = None
+    ) -> fluentgroups[object, fluentlist]:
+        """Supports grouping the items in the list by the value of the specified attribute
+        or by the value returned by the specified callable, returning a mapping of each
+        group's key to a new list of the items in that group, in their original order. If
+        a memory limit is specified, the groups can be streamed via the mapping's stream
+        method, spilling the items to temporary files once the limit is reached, which
+        yields the groups one partition at a time."""
+
+        return fluentgroups(
+            self,
+            key=key,
+            factory=fluentlist,
+            memory_limit=memory_limit,
+            spill_dir=spill_dir,
+        )
+
+    def join(
+        self,
+        other: object,
+        on: str | callable = None,
+        left_key: str | callable = None,
+        right_key: str | callable = None,
+        how: str = "inner",
+        merge: callable = None,
+        presorted: bool = False,
+        lazy: bool = False,
+    ) -> fluentlist[tuple[object, object]]:
+        """Supports joining the items of the list with those of the other iterable where
+        their keys are equal, returning a new list of (left, right) pairs."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        pairs = join(
+            self,
+            other,
+            on=on,
+            left_key=left_key,
+            right_key=right_key,
+            how=how,
+            merge=merge,
+            presorted=presorted,
+        )
+
+        return pairs if lazy is True else fluentlist(pairs)
+
     def first(
         self, predicate: callable = None, **filters: dict[str, object]
     ) -> object | None:
@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.tuple import fluenttuple
+from fluently.view import fluentview
+from fluently.utilities import filter
+from fluently.array import fluentarray, typecodes
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate
+from operator import countOf
+
+import builtins
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+
+logger = logger.getChild(__name__)
+
+# The signature and version recorded at the start of each mapped tuple file
+signature: bytes = b"FLUENTLY"
+version: int = 1
+
+# The file header holding the signature, version, encoding and count of the items,
+# padded to 24 bytes so that the item values or offsets which follow are 8-byte aligned
+header: struct.Struct = struct.Struct("<8sBc6xQ")
+
+# The encodings of the items, where integers and floats are held as fixed width values,
+# denoted by their array typecode, such as 'q' or 'd', while strings ('s'), bytes ('y')
+# and any other items, which are pickled ('p'), are held as variable width values that
+# are located via a table of offsets
+encodings: str = typecodes + "syp"
+
+
+def save(items: Sequence, path: str) -> str:
+    """The save method provides support for writing the items to the specified file in
+    the format read by the `fluentmapped` class. Sequences holding only integers or only
+    floats, and arrays, are written as fixed width values, sequences of only strings or
+    bytes are written as variable width values preceded by a table of their offsets, as
+    are any other items, which are pickled. The file is written to a temporary file that
+    then replaces any existing file, so that processes mapping the existing file are not
+    affected. Returns the path of the file."""
+
+    if not isinstance(path, (str, os.PathLike)):
+        raise TypeError("The 'path' argument must have a string or path-like value!")
+
+    path = os.fspath(path)
+
+    if not isinstance(items, Sequence):
+        items = tuple(items)
+
+    encoding: str = _encoding(items)
+
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp", delete=False
+    ) as file:
+        try:
+            file.write(header.pack(signature, version, encoding.encode(), len(items)))
+
+            if encoding in typecodes:
+                _array(encoding, items).tofile(file)
+            else:
+                # Reserve space for the offsets, which are written once they are known
+                file.write(bytes(8 * (len(items) + 1)))
+
+                offsets: array = array(
+                    "Q",
+                    accumulate(
+                        builtins.map(
+                            file.write, builtins.map(_encoder(encoding), items)
+                        ),
+                        initial=0,
+                    ),
+                )
+
+                file.seek(header.size)
+
+                offsets.tofile(file)
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+
+    os.replace(file.name, path)
+
+    return path
+
+
+def _encoding(items: Sequence) -> str:
+    """Determines the encoding of the items, preferring the fixed width encodings."""
+
+    if isinstance(items, array) and items.typecode in typecodes:
+        return items.typecode
+
+    types: set[type] = set(builtins.map(type, items))
+
+    if len(types) == 0:
+        return "q"
+    elif types == {int}:
+        if -(2**63) <= builtins.min(items) and builtins.max(items) < 2**63:
+            return "q"
+    elif types == {float}:
+        return "d"
+    elif types == {str}:
+        return "s"
+    elif types == {bytes}:
+        return "y"
+
+    return "p"
+
+
+def _encoder(encoding: str) -> callable:
+    """Returns the callable used to encode each item for the variable width encodings."""
+
+    if encoding == "s":
+        return lambda item: item.encode("utf-8")
+    elif encoding == "y":
+        return bytes
+    else:
+        return lambda item: pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _array(encoding: str, items: Sequence) -> array:
+    """Returns the items as an array of the specified typecode, without copying them if
+    they are already held in such an array."""
+
+    if isinstance(items, array) and items.typecode == encoding:
+        return items
+
+    return array(encoding, items)
+
+
+class fluentmapped(Sequence):
+    """A read-only sequence over a file of items written by `fluenttuple.save()`, as
+    returned by the `fluenttuple.mmap()` method, where the file is memory-mapped, so its
+    items are only read, and decoded, from the mapping as they are accessed, and as the
+    pages of the mapping are held by the operating system's page cache, they are shared
+    by every process that maps the same file. Indexing, `length()`, `contains()` and
+    `count()` operate directly on the mapping, while slicing returns a `fluentview` onto
+    the sequence, and `filter()` decodes each item in turn; the sequence is pickled by its
+    path, so passing it to worker processes maps the file rather than copying its items.
+
+    As files holding pickled items are unpickled on access, only files from trusted
+    sources should be mapped; as with the `pickle` module, mapping an untrusted file may
+    lead to the execution of arbitrary code."""
+
+    def __init__(self, path: str):
+        if not isinstance(path, (str, os.PathLike)):
+            raise TypeError(
+                "The 'path' argument must have a string or path-like value!"
+            )
+
+        self._path: str = os.fspath(path)
+
+        with open(self._path, "rb") as file:
+            try:
+                self._mmap: mmap.mmap = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                raise ValueError(
+                    f"The file, {self._path}, is not a fluently mapped tuple file!"
+                ) from None
+
+        if not self._load(self._mmap):
+            self._mmap.close()
+
+            raise ValueError(
+                f"The file, {self._path}, is not a fluently mapped tuple file!"
+            )
+
+    def _load(self, buffer: object) -> bool:
+        """Reads the header from the buffer, a memory mapping or memoryview holding the
+        items in the format written by `save()`, and creates the memoryviews through
+        which the values or offsets are accessed; returns False if the buffer does not
+        hold items in the expected format."""
+
+        try:
+            (marker, revision, encoding, count) = header.unpack_from(buffer)
+        except struct.error:
+            return False
+
+        if not (marker == signature and revision == version):
+            return False
+
+        self._buffer: object = buffer
+        self._encoding: str = encoding.decode()
+        self._length: int = count
+
+        memory = memoryview(buffer)
+
+        if self._encoding in typecodes:
+            size: int = array(self._encoding).itemsize * count
+
+            self._values: memoryview = memory[header.size : header.size + size].cast(
+                self._encoding
+            )
+            self._offsets: memoryview = None
+        else:
+            self._values: memoryview = None
+            self._offsets: memoryview = memory[
+                header.size : header.size + 8 * (count + 1)
+            ].cast("Q")
+
+        # The position in the buffer of the first byte of the variable width values
+        self._base: int = header.size + 8 * (count + 1)
+
+        memory.release()
+
+        return True
+
+    def _release(self) -> None:
+        """Releases the memoryviews onto the buffer, so that it may be closed."""
+
+        for memory in (self._values, self._offsets):
+            if memory is not None:
+                memory.release()
+
+    def __reduce__(self) -> tuple:
+        return (self.__class__, (self._path,))
+
+    def __enter__(self) -> fluentmapped:
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Supports closing the mapping, after which its items can no longer be read."""
+
+        self._release()
+
+        self._mmap.close()
+
+    @property
+    def path(self) -> str:
+        """Returns the path of the mapped file."""
+
+        return self._path
+
+    def _raw(self, index: int) -> bytes:
+        """Returns the encoded bytes of the variable width item at the specified index."""
+
+        start: int = self._base + self._offsets[index]
+        stop: int = self._base + self._offsets[index + 1]
+
+        return bytes(self._buffer[start:stop])
+
+    def _find(self, encoded: bytes, start: int) -> int:
+        """Returns the position of the first occurrence of the encoded bytes within the
+        buffer, at or after the start position, or -1 if there are no occurrences."""
+
+        return self._buffer.find(encoded, start)
+
+    def _item(self, index: int) -> object:
+        """Returns the decoded item at the specified, non-negative, index."""
+
+        if self._offsets is None:
+            return self._values[index]
+        elif self._encoding == "s":
+            return str(self._raw(index), "utf-8")
+        elif self._encoding == "y":
+            return self._raw(index)
+        else:
+            return pickle.loads(self._raw(index))
+
+    def _matches(self, value: object) -> object:
+        """Returns an iterator of the indices of the variable width items which equal the
+        value, or None if the value cannot be compared in its encoded form. Strings and
+        bytes are located by searching the mapping for the encoded value, bisecting the
+        offsets to determine if each occurrence is an item, rather than decoding any."""
+
+        if self._encoding == "s" and isinstance(value, str):
+            encoded: bytes = value.encode("utf-8")
+        elif self._encoding == "y" and isinstance(value, (bytes, bytearray)):
+            encoded: bytes = bytes(value)
+        elif self._encoding == "p":
+            return None
+        else:
+            # Only strings can equal strings, and only bytes can equal bytes
+            return iter(())
+
+        offsets: memoryview = self._offsets
+
+        if len(encoded) == 0:
+            return (
+                index
+                for index in range(self._length)
+                if offsets[index] == offsets[index + 1]
+            )
+
+        return self._occurrences(encoded)
+
+    def _occurrences(self, encoded: bytes):
+        """Yields the indices of the variable width items whose encoded bytes equal the
+        specified non-empty encoded value, in order."""
+
+        offsets: memoryview = self._offsets
+        size: int = len(encoded)
+
+        position: int = self._find(encoded, self._base)
+
+        while position >= 0:
+            # Find the last item starting at or before the occurrence, as any items of
+            # zero length share their offset with the item which follows them
+            offset: int = position - self._base
+            index: int = bisect_right(offsets, offset, 0, self._length) - 1
+
+            if offsets[index] == offset and offsets[index + 1] == offset + size:
+                yield index
+
+            # A match can only begin at the start of an item, so resume the search from
+            # the start of the next item, rather than from the next byte
+            position = self._find(
+                encoded, builtins.max(position + 1, self._base + offsets[index + 1])
+            )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        if self._offsets is None:
+            return iter(self._values)
+        else:
+            return builtins.map(self._item, range(self._length))
+
+    def __getitem__(self, index: int | builtins.slice) -> object:
+        if isinstance(index, builtins.slice):
+            return fluentview(
+                self, index.start, index.stop, index.step, factory=fluenttuple
+            )
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("The mapped tuple index is out of range!")
+
+        return self._item(index)
+
+    def __contains__(self, value: object) -> bool:
+        return self.contains(value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                a == b for (a, b) in zip(self, other)
+            )
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._path!r}, length={self._length})"
+
+    def length(self) -> int:
+        """Supports returning the count of the total number of items."""
+
+        return self._length
+
+    def collect(self) -> fluenttuple[object]:
+        """Supports reading all of the items into a new fluenttuple."""
+
+        return fluenttuple(self)
+
+    def toarray(self) -> fluentarray:
+        """Supports copying fixed width integer or floating point items into a new
+        fluentarray of the same typecode, via a single copy of their memory."""
+
+        if self._values is None:
+            raise TypeError("Only integer or floating point items can form an array!")
+
+        return fluentarray(self._encoding, self._values.tobytes())
+
+    def view(self, start: int = None, stop: int = None, step: int = None) -> fluentview:
+        """Supports returning a read-only view onto the items, or the sliced part of
+        them, without reading any items; see the `fluentview` class for details."""
+
+        return fluentview(self, start, stop, step, factory=fluenttuple)
+
+    def contains(self, value: object) -> bool:
+        """Supports returning if the items contain the specified value or not."""
+
+        if self._offsets is None:
+            return value in self._values
+
+        matches = self._matches(value)
+
+        if matches is None:
+            return builtins.any(item == value for item in self)
+
+        return next(matches, None) is not None
+
+    def any(self, value: object) -> bool:
+        """Supports returning if the items contain the specified value at least once."""
+
+        return self.contains(value)
+
+    def count(self, value: object) -> int:
+        """Supports returning a count of how many of the items have the specified value."""
+
+        if self._offsets is None:
+            return countOf(self._values, value)
+
+        matches = self._matches(value)
+
+        if matches is None:
+            return countOf(self, value)
+
+        return builtins.sum(1 for _ in matches)
+
+    def filter(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> fluenttuple[object]:
+        """Provides a fluent interface for filtering the items, returning the matching
+        items in a new fluenttuple."""
+
+        if predicate is None:
+            pass
+        elif not callable(predicate):
+            raise TypeError(
+                "The 'predicate' argument, if specified, must reference a callable!"
+            )
+
+        if predicate:
+            return fluenttuple(builtins.filter(predicate, self))
+        else:
+            return fluenttuple(filter(self, **filters))
+
+    def first(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> object | None:
+        """Supports returning the first item, optionally of those matching the filters,
+        or None if there are no such items."""
+
+        if predicate is not None or len(filters) > 0:
+            items = self.filter(predicate=predicate, **filters)
+        else:
+            items = self
+
+        return items[0] if (len(items) >= 1) else None
+
+    def last(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> object | None:
+        """Supports returning the last item, optionally of those matching the filters,
+        or None if there are no such items."""
+
+        if predicate is not None or len(filters) > 0:
+            items = self.filter(predicate=predicate, **filters)
+        else:
+            items = self
+
+        return items[-1] if (len(items) >= 1) else None
+
+
+# Shorthand aliases
+fmapped = flumapped = fluentmapped
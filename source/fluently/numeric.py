@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.list import fluentlist
+from fluently.array import fluentarray
+from fluently.stats import stats
+from array import array
+from collections.abc import Sequence
+from functools import reduce
+
+import builtins
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+logger = logger.getChild(__name__)
+
+# The backends which may be used to perform the numeric operations, where the "numpy"
+# backend is only available if the optional NumPy dependency has been installed
+backends: tuple[str] = ("numpy", "python")
+
+# Whether the optional NumPy dependency is available, and so is the default backend
+available: bool = numpy is not None
+
+
+class fluentnumeric(Sequence):
+    """A fluent sequence of integer or floating point values, as returned by the
+    `numeric()` methods of the fluent containers, whose operations are vectorised via
+    NumPy, where the optional NumPy dependency is installed; otherwise the values are
+    held in a `fluentarray` and the operations are performed in Python, so that code
+    using the class works, albeit more slowly, whether or not NumPy is available.
+
+    The `map()` and `filter()` methods first call the function with all of the values
+    at once, which is a single vectorised call when the function is a NumPy ufunc, or a
+    lambda composed of arithmetic operators, comparisons and ufuncs, such as `lambda x:
+    x * 2 + 1`; if the function cannot be applied to the array as a whole, or does not
+    return a result for each value, it is instead called for each value in turn.
+
+    The values are always copied from the container the sequence is created from, with
+    either backend, so later changes to the container are not reflected in the sequence,
+    and the container may still be modified or resized while the sequence exists."""
+
+    def __init__(self, values: object, typecode: str = None, backend: str = None):
+        if backend is None:
+            backend = "numpy" if available else "python"
+        elif not backend in backends:
+            raise ValueError(
+                "The 'backend' argument, if specified, must have a value of: %s!"
+                % (", ".join(backends))
+            )
+        elif backend == "numpy" and not available:
+            raise ImportError(
+                "The 'numpy' backend requires the optional NumPy dependency; it can be"
+                " installed via 'pip install fluently[numeric]'!"
+            )
+
+        if typecode is None:
+            pass
+        elif not isinstance(typecode, str):
+            raise TypeError("The 'typecode' argument must have a string value!")
+
+        self._backend: str = backend
+
+        if isinstance(values, fluentnumeric):
+            values = values._values
+
+        if backend == "numpy":
+            if isinstance(values, numpy.ndarray):
+                pass
+            elif isinstance(values, array):
+                # Copy the array via the buffer protocol in a single pass, as sharing
+                # its memory would prevent the array from being resized while exported
+                values = numpy.array(values)
+            elif not isinstance(values, Sequence):
+                values = list(values)
+
+            values = numpy.asarray(values, dtype=typecode)
+
+            if not values.dtype.kind in "biuf" or values.ndim != 1:
+                raise TypeError("The values must be a sequence of integers or floats!")
+
+            if values.dtype.kind == "b":
+                values = values.astype(int)
+
+            self._values = values
+        else:
+            if isinstance(values, array) and typecode in (None, values.typecode):
+                self._values = fluentarray(values.typecode, values)
+            else:
+                if not isinstance(values, Sequence):
+                    values = list(values)
+
+                self._values = fluentarray(typecode or _typecode(values), values)
+
+    def _derive(self, values: object) -> fluentnumeric:
+        """Creates a new numeric sequence holding the values, using the same backend,
+        where a new fluentarray of derived values is held without being copied again."""
+
+        if self._backend == "python" and isinstance(values, fluentarray):
+            derived = fluentnumeric.__new__(fluentnumeric)
+            derived._backend = self._backend
+            derived._values = values
+
+            return derived
+
+        return fluentnumeric(values, backend=self._backend)
+
+    @property
+    def backend(self) -> str:
+        """Returns the name of the backend performing the operations, numpy or python."""
+
+        return self._backend
+
+    @property
+    def values(self) -> object:
+        """Returns the underlying NumPy array or fluentarray holding the values."""
+
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        if self._backend == "numpy":
+            return iter(self._values.tolist())
+        else:
+            return iter(self._values)
+
+    def __getitem__(self, index: int | builtins.slice) -> object:
+        if isinstance(index, builtins.slice):
+            return self._derive(self._values[index])
+        elif self._backend == "numpy":
+            return self._values[index].item()
+        else:
+            return self._values[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """Supports pickling the numeric sequence as its backend and its NumPy array or
+        fluentarray, both of which support out-of-band buffers via pickle protocol 5."""
+
+        return (self.__class__, (self._values, None, self._backend))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r}, backend={self._backend!r})"
+
+    def length(self) -> int:
+        """Supports returning the count of the total number of values."""
+
+        return len(self._values)
+
+    def tolist(self) -> fluentlist[int | float]:
+        """Supports returning the values as a new fluentlist of Python numbers."""
+
+        return fluentlist(self)
+
+    def toarray(self) -> fluentarray:
+        """Supports returning the values as a new fluentarray."""
+
+        if self._backend == "numpy":
+            return fluentarray(self._values.dtype.char, self._values.tolist())
+        else:
+            return self._values.clone()
+
+    def map(self, function: callable) -> fluentnumeric:
+        """Supports running a function on the values, returning the results as a new
+        numeric sequence, vectorising the function where possible."""
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        if self._backend == "numpy":
+            results = self._vectorise(function)
+
+            if results is None:
+                results = [function(value) for value in self._values.tolist()]
+
+            return self._derive(results)
+        else:
+            return self._derive(builtins.map(function, self._values))
+
+    def filter(self, predicate: callable) -> fluentnumeric:
+        """Supports returning a new numeric sequence holding the values for which the
+        predicate returns True, vectorising the predicate as a mask where possible."""
+
+        if not callable(predicate):
+            raise TypeError("The 'predicate' argument must reference a callable!")
+
+        if self._backend == "numpy":
+            mask = self._vectorise(predicate)
+
+            if mask is None or mask.dtype.kind != "b":
+                mask = [bool(predicate(value)) for value in self._values.tolist()]
+
+            return self._derive(self._values[numpy.asarray(mask, dtype=bool)])
+        else:
+            return self._derive(
+                fluentarray(self._values.typecode, builtins.filter(predicate, self))
+            )
+
+    def _vectorise(self, function: callable) -> object:
+        """Attempts to call the function with all of the values as a single NumPy array,
+        returning the resulting array, or None if the function cannot be vectorised."""
+
+        try:
+            results = function(self._values)
+        except (TypeError, ValueError):
+            return None
+
+        if isinstance(results, numpy.ndarray) and results.shape == self._values.shape:
+            return results
+
+        return None
+
+    def sorted(self, reverse: bool = False) -> fluentnumeric:
+        """Supports returning a new numeric sequence holding the values in sorted order."""
+
+        if not isinstance(reverse, bool):
+            raise TypeError("The 'reverse' argument must have a boolean value!")
+
+        if self._backend == "numpy":
+            values = numpy.sort(self._values, kind="stable")
+
+            return self._derive(values[::-1] if reverse else values)
+        else:
+            return self._derive(self._values.sorted(reverse=reverse))
+
+    def unique(self) -> fluentnumeric:
+        """Supports returning a new numeric sequence without duplicate values, with the
+        values retained in the order in which they first appear."""
+
+        if self._backend == "numpy":
+            (_, indices) = numpy.unique(self._values, return_index=True)
+
+            return self._derive(self._values[numpy.sort(indices)])
+        else:
+            return self._derive(self._values.unique())
+
+    def count(self, value: int | float) -> int:
+        """Supports returning a count of how many of the values equal the value."""
+
+        if self._backend == "numpy":
+            return int(numpy.count_nonzero(self._values == value))
+        else:
+            return self._values.count(value)
+
+    def reduce(self, function: callable, initialiser=None) -> object:
+        """Supports reducing the values via the function, which is performed by NumPy
+        when the function is a binary ufunc, such as `numpy.add` or `numpy.maximum`."""
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        if self._backend == "numpy" and isinstance(function, numpy.ufunc):
+            if initialiser is None:
+                return function.reduce(self._values).item()
+            else:
+                return function.reduce(self._values, initial=initialiser).item()
+
+        if initialiser is None:
+            return reduce(function, self)
+        else:
+            return reduce(function, self, initialiser)
+
+    def sum(self) -> int | float:
+        """Supports returning the sum of the values."""
+
+        if self._backend == "numpy":
+            return self._values.sum().item()
+        elif self._values.typecode in "fd":
+            return math.fsum(self._values)
+        else:
+            return builtins.sum(self._values)
+
+    def min(self) -> int | float | None:
+        """Supports returning the minimum value, or None if there are no values."""
+
+        if len(self._values) == 0:
+            return None
+        elif self._backend == "numpy":
+            return self._values.min().item()
+        else:
+            return builtins.min(self._values)
+
+    def max(self) -> int | float | None:
+        """Supports returning the maximum value, or None if there are no values."""
+
+        if len(self._values) == 0:
+            return None
+        elif self._backend == "numpy":
+            return self._values.max().item()
+        else:
+            return builtins.max(self._values)
+
+    def mean(self) -> float | None:
+        """Supports returning the mean of the values, or None if there are no values."""
+
+        if len(self._values) == 0:
+            return None
+        elif self._backend == "numpy":
+            return self._values.mean().item()
+        else:
+            return self.sum() / len(self._values)
+
+    def stats(
+        self, bins: int | list[float] = None, bounds: tuple[float, float] = None
+    ) -> dict[str, object]:
+        """Supports computing the aggregates returned by the `fluently.stats.stats()`
+        function, computed by NumPy when using the numpy backend."""
+
+        if self._backend == "python" or len(self._values) == 0:
+            return stats(self._values, bins=bins, bounds=bounds)
+
+        count: int = len(self._values)
+
+        variance = self._values.var(ddof=1).item() if count > 1 else None
+
+        results = {
+            "count": count,
+            "sum": self.sum(),
+            "min": self.min(),
+            "max": self.max(),
+            "mean": self.mean(),
+            "variance": variance,
+            "stdev": None if variance is None else math.sqrt(variance),
+        }
+
+        if bins is not None:
+            (counts, edges) = numpy.histogram(self._values, bins=bins, range=bounds)
+
+            results["histogram"] = {"edges": edges.tolist(), "counts": counts.tolist()}
+        elif bounds is not None:
+            raise ValueError("The 'bounds' argument can only be used with 'bins'!")
+
+        return results
+
+
+def _typecode(values: Sequence) -> str:
+    """Determines the array typecode needed to hold the values, being 'q' for integers
+    and 'd' for floats, or for integers and floats combined."""
+
+    types: set[type] = set(builtins.map(type, values))
+
+    if types <= {int, bool}:
+        return "q"
+    elif types <= {int, bool, float}:
+        return "d"
+    else:
+        raise TypeError("The values must be a sequence of integers or floats!")
+
+
+# Shorthand aliases
+fnumeric = flunumeric = fluentnumeric
@@ -0,0 +1,612 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.list import fluentlist
+from fluently.grouping import fluentgroups
+from fluently.stats import _homogeneous
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from itertools import compress, repeat
+from operator import eq
+
+import builtins
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+logger = logger.getChild(__name__)
+
+
+class fluentrecord(object):
+    """A lightweight proxy for a single row of a `fluentrecords` container, as yielded
+    when iterating over or indexing into the container, which holds only a reference
+    to the container and the row's index, obtaining its field values from the columns
+    as they are accessed, via attribute or item access."""
+
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, records: fluentrecords, index: int):
+        self._records = records
+        self._index = index
+
+    def __getattr__(self, name: str) -> object:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        try:
+            return self._records._columns[name][self._index]
+        except KeyError:
+            raise AttributeError(
+                f"The '{self.__class__.__name__}' has no '{name}' field!"
+            ) from None
+
+    def __getitem__(self, name: str) -> object:
+        return self._records._columns[name][self._index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, fluentrecord):
+            return self.todict() == other.todict()
+        elif isinstance(other, Mapping):
+            return self.todict() == dict(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.todict()!r})"
+
+    def todict(self) -> dict[str, object]:
+        """Supports returning the row's field values as a new dictionary."""
+
+        return {
+            name: column[self._index] for name, column in self._records._columns.items()
+        }
+
+
+class fluentrecords(Sequence):
+    """A columnar, or struct-of-arrays, container of records, which holds the values of
+    each field in a separate list, so that, unlike a list of objects, no per-record
+    object or attribute dictionary is held in memory, and which evaluates filters and
+    sorts a column at a time. The records may be created from dictionaries or objects,
+    whose fields are taken from the specified field names, or else from the keys of the
+    dictionaries or the public attributes of the objects, where a column is added for
+    each field first seen in a later record; records that do not hold a value for a
+    field are given a value of None for that field, although, as with the filter method
+    of `fluentlist`, they never match a filter on the field. Iterating over, or indexing
+    into, the container yields lightweight `fluentrecord` row proxies."""
+
+    def __init__(self, records: object = None, fields: list[str] = None):
+        if fields is None:
+            pass
+        elif not (
+            isinstance(fields, (list, tuple))
+            and all(isinstance(field, str) for field in fields)
+        ):
+            raise TypeError("The 'fields' argument must reference a list of strings!")
+
+        self._columns: dict[str, list] = {}
+        self._length: int = 0
+
+        # Whether the fields were specified, rather than taken from the records, and the
+        # indices of the records which did not hold a value for each field, if any
+        self._specified: bool = fields is not None
+        self._absent: dict[str, set[int]] = {}
+
+        # The per-column caches of value frequencies and NumPy arrays used by filter()
+        self._frequencies: dict[str, Counter | None] = {}
+        self._arrays: dict[str, object] = {}
+
+        if fields is not None:
+            for field in fields:
+                self._columns[field] = []
+
+        if records is not None:
+            self.extend(records)
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, Sequence]) -> fluentrecords:
+        """Supports creating a new container from a dictionary of column names mapped to
+        its values, where each column must hold the same number of values."""
+
+        if not isinstance(columns, Mapping):
+            raise TypeError("The 'columns' argument must reference a mapping!")
+
+        lengths: set[int] = set(len(values) for values in columns.values())
+
+        if len(lengths) > 1:
+            raise ValueError("The columns must all hold the same number of values!")
+
+        records = cls()
+
+        records._columns = {name: list(values) for name, values in columns.items()}
+        records._length = lengths.pop() if lengths else 0
+
+        return records
+
+    def _derive(self, indices: object) -> fluentrecords:
+        """Creates a new container holding the records at the specified indices, which
+        are gathered from each column in turn."""
+
+        records = fluentrecords()
+
+        indices = indices if isinstance(indices, (list, range)) else list(indices)
+
+        records._columns = {
+            name: list(builtins.map(column.__getitem__, indices))
+            for name, column in self._columns.items()
+        }
+        records._length = len(indices)
+
+        if len(self._absent) > 0:
+            for name, absent in self._absent.items():
+                records._absent[name] = {
+                    position
+                    for position, index in enumerate(indices)
+                    if index in absent
+                }
+
+        return records
+
+    def _fields(self, record: object) -> list[str]:
+        """Determines the field names of a record, where none have been specified, where
+        the first record must hold at least one field."""
+
+        if isinstance(record, Mapping):
+            fields = list(record.keys())
+        elif isinstance(record, fluentrecord):
+            fields = list(record._records._columns.keys())
+        elif hasattr(record, "__dict__"):
+            fields = [name for name in vars(record) if not name.startswith("_")]
+        else:
+            fields = []
+
+        if len(fields) == 0 and len(self._columns) == 0:
+            raise TypeError(
+                "The field names must be specified for records of type %s!"
+                % (type(record).__name__)
+            )
+
+        return fields
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return builtins.map(fluentrecord, repeat(self), range(self._length))
+
+    def __getitem__(self, index: int | builtins.slice) -> object:
+        if isinstance(index, builtins.slice):
+            return self._derive(range(self._length)[index])
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("The record index is out of range!")
+
+        return fluentrecord(self, index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, fluentrecords):
+            return self._columns == other._columns
+        elif isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                a == b for (a, b) in zip(self, other)
+            )
+
+        return NotImplemented
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """Supports pickling the records compactly as their columns, without the cached
+        value frequencies and arrays used by filter(), which are rebuilt as needed."""
+
+        return (
+            self.__class__.from_columns,
+            (self._columns,),
+            {"_absent": self._absent} if self._absent else None,
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.todicts()!r})"
+
+    @property
+    def fields(self) -> fluentlist[str]:
+        """Returns the names of the fields held by the records."""
+
+        return fluentlist(self._columns.keys())
+
+    def length(self) -> int:
+        """Supports returning the count of the total number of records."""
+
+        return self._length
+
+    def clone(self) -> fluentrecords:
+        """Supports returning a cloned, independent copy of the current records."""
+
+        return self._derive(range(self._length))
+
+    def column(self, name: str) -> fluentlist[object]:
+        """Supports returning the values of the named field as a new fluentlist."""
+
+        if not name in self._columns:
+            raise KeyError(f"The records have no '{name}' field!")
+
+        return fluentlist(self._columns[name])
+
+    def append(self, record: object) -> fluentrecords:
+        """Supports appending the specified record, a dictionary or object, to the end
+        of the records, adding a column for any fields not held by earlier records."""
+
+        if not self._specified:
+            for field in self._fields(record):
+                if not field in self._columns:
+                    self._columns[field] = [None] * self._length
+
+                    if self._length > 0:
+                        self._absent[field] = set(range(self._length))
+
+        index: int = self._length
+
+        if isinstance(record, Mapping):
+            for name, column in self._columns.items():
+                if name in record:
+                    column.append(record[name])
+                else:
+                    column.append(None)
+
+                    self._absent.setdefault(name, set()).add(index)
+        else:
+            for name, column in self._columns.items():
+                if hasattr(record, name):
+                    column.append(getattr(record, name))
+                else:
+                    column.append(None)
+
+                    self._absent.setdefault(name, set()).add(index)
+
+        self._length += 1
+
+        self._frequencies.clear()
+        self._arrays.clear()
+
+        return self
+
+    def extend(self, records: object) -> fluentrecords:
+        """Supports extending the current records with the specified records."""
+
+        for record in records:
+            self.append(record)
+
+        return self
+
+    def slice(self, start: int, stop: int = None, step: int = 1) -> fluentrecords:
+        """Supports returning a new container holding the sliced part of the records."""
+
+        if not isinstance(start, int):
+            raise TypeError("The 'start' argument must have an integer value!")
+
+        if stop is None:
+            pass
+        elif not isinstance(stop, int):
+            raise TypeError("The 'stop' argument must have an integer value!")
+
+        if not isinstance(step, int):
+            raise TypeError("The 'step' argument must have an integer value!")
+
+        return self[builtins.slice(start, stop, step)]
+
+    def take(self, index: int) -> fluentrecords:
+        """Supports returning a new container holding the records from the start until
+        the index specified."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return self.slice(start=0, stop=index)
+
+    def drop(self, index: int) -> fluentrecords:
+        """Supports returning a new container holding the records from the specified
+        index until the end."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return self.slice(start=index)
+
+    def _matches(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> list[int]:
+        """Evaluates the filters a column at a time, returning the indices of the rows
+        whose values equal all of the filter values, and which match the predicate.
+
+        Each filter is compiled into a boolean mask over its column, held as a NumPy
+        array for numeric columns where NumPy is available, or otherwise as a bytes
+        bitmap, and the masks are AND-ed together; where there are several filters, the
+        frequencies of each column's values are used to evaluate the most selective
+        filters first, and once few rows remain, the remaining filters are evaluated
+        only against the values of those rows. The rows are then gathered only once."""
+
+        indices: list[int] = None
+
+        criteria: list[tuple[str, object]] = list(filters.items())
+
+        for name, value in criteria:
+            # As per the fluentlist filter, records lacking a field never match it
+            if not name in self._columns:
+                return []
+
+        if len(criteria) > 1:
+            criteria.sort(key=self._selectivity)
+
+        mask: bytes | object = None
+
+        for name, value in criteria:
+            column: list = self._columns[name]
+
+            if indices is None:
+                if mask is None:
+                    mask = self._mask(name, value)
+                else:
+                    mask = _conjunction(mask, self._mask(name, value))
+
+                matches: int = _population(mask)
+
+                if matches == 0:
+                    return []
+                elif matches * 8 < self._length:
+                    # Once the matches are sparse, gather only their values to test
+                    indices = _positions(mask)
+            else:
+                values = builtins.map(column.__getitem__, indices)
+
+                indices = list(
+                    compress(indices, builtins.map(eq, values, repeat(value)))
+                )
+
+        if indices is None:
+            indices = range(self._length) if mask is None else _positions(mask)
+
+        for name, value in criteria:
+            # As per the fluentlist filter, records lacking a field never match it
+            if absent := self._absent.get(name):
+                indices = [index for index in indices if not index in absent]
+
+        if predicate is not None:
+            indices = [
+                index for index in indices if predicate(fluentrecord(self, index))
+            ]
+
+        return indices if isinstance(indices, list) else list(indices)
+
+    def _selectivity(self, criterion: tuple[str, object]) -> tuple[int, bool]:
+        """Estimates the number of rows matching a filter from the frequencies of the
+        values in the column, so that the most selective filters, and of those, the
+        filters over columns held as NumPy arrays, may be evaluated first."""
+
+        (name, value) = criterion
+
+        if not name in self._frequencies:
+            try:
+                self._frequencies[name] = Counter(self._columns[name])
+            except TypeError:
+                # The frequencies of unhashable values cannot be counted
+                self._frequencies[name] = None
+
+        frequencies: Counter = self._frequencies[name]
+
+        try:
+            estimate: int = self._length if frequencies is None else frequencies[value]
+        except TypeError:
+            estimate: int = self._length
+
+        return (estimate, self._arrays.get(name) is None)
+
+    def _mask(self, name: str, value: object) -> bytes | object:
+        """Compiles a filter into a boolean mask over the named column, as a NumPy array
+        where the column and value are numeric and NumPy is available, or otherwise as a
+        bytes bitmap holding a byte of 1 for each row whose value equals the value."""
+
+        if isinstance(value, (int, float)):
+            if not name in self._arrays:
+                self._arrays[name] = _ndarray(self._columns[name])
+
+            if (array := self._arrays[name]) is not None:
+                return array == value
+
+        return bytes(builtins.map(eq, self._columns[name], repeat(value)))
+
+    def filter(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> fluentrecords:
+        """Provides a fluent interface for filtering the records, by the values of their
+        fields, a column at a time, and by the optional predicate, which is called with
+        the row proxy for each record that matches the filters, returning the matching
+        records within a new container."""
+
+        if predicate is None:
+            pass
+        elif not callable(predicate):
+            raise TypeError(
+                "The 'predicate' argument, if specified, must reference a callable!"
+            )
+
+        return self._derive(self._matches(predicate, **filters))
+
+    def first(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> fluentrecord | None:
+        """Supports returning the first record, optionally of those matching the filters,
+        or None if there are no such records."""
+
+        indices = self._matches(predicate, **filters)
+
+        return fluentrecord(self, indices[0]) if len(indices) >= 1 else None
+
+    def last(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> fluentrecord | None:
+        """Supports returning the last record, optionally of those matching the filters,
+        or None if there are no such records."""
+
+        indices = self._matches(predicate, **filters)
+
+        return fluentrecord(self, indices[-1]) if len(indices) >= 1 else None
+
+    def sorted(
+        self, by: str | list[str], nones: str = "last", reverse: bool = False
+    ) -> fluentrecords:
+        """Supports returning a new container holding the records sorted by the values of
+        one or more fields, named via the `by` argument in order of precedence, where
+        names prefixed with '-' are sorted in descending order, and where records with
+        None values for a field are placed "first" or "last" as specified by `nones`.
+        The sort is performed a column at a time, via a stable sort of the row indices by
+        each field in turn, from the least to the most significant field."""
+
+        if isinstance(by, str):
+            by = [by]
+        elif not (isinstance(by, (list, tuple)) and len(by) > 0):
+            raise TypeError("The 'by' argument must reference one or more field names!")
+
+        if not nones in ("first", "last"):
+            raise ValueError(
+                "The 'nones' argument must have a value of 'first' or 'last'!"
+            )
+
+        if not isinstance(reverse, bool):
+            raise TypeError("The 'reverse' argument must have a boolean value!")
+
+        indices: list[int] = list(range(self._length))
+
+        for name in reversed(by):
+            if not (isinstance(name, str) and len(name.lstrip("-")) > 0):
+                raise TypeError(
+                    "The 'by' argument must reference one or more field names!"
+                )
+
+            column = self._columns.get(name.lstrip("-"))
+
+            if column is None:
+                raise KeyError(f"The records have no '{name.lstrip('-')}' field!")
+
+            values = [index for index in indices if column[index] is not None]
+            nulls = [index for index in indices if column[index] is None]
+
+            values.sort(key=column.__getitem__, reverse=name.startswith("-") ^ reverse)
+
+            indices = (nulls + values) if nones == "first" else (values + nulls)
+
+        return self._derive(indices)
+
+    def map(self, function: callable, *fields: str) -> fluentlist[object]:
+        """Supports running a callback for each record, returning the results as a new
+        fluentlist. If one or more field names are specified, the callback is called with
+        the values of those fields, taken directly from the columns, else the callback
+        is called with the row proxy for each record."""
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        if len(fields) == 0:
+            return fluentlist(builtins.map(function, self))
+
+        for field in fields:
+            if not field in self._columns:
+                raise KeyError(f"The records have no '{field}' field!")
+
+        return fluentlist(
+            builtins.map(function, *[self._columns[field] for field in fields])
+        )
+
+    def group_by(self, key: str | callable) -> fluentgroups[object, fluentrecords]:
+        """Supports grouping the records by the value of the named field, or the value
+        returned by the specified callable for each row proxy, returning a mapping of
+        each group's key to a new container of the records in that group; where the
+        groups are aggregated via `agg()`, values are read directly from the columns."""
+
+        return fluentgroups(
+            range(self._length),
+            key=key,
+            factory=self._derive,
+            getter=self._getter,
+        )
+
+    def _getter(self, key: str | callable) -> callable:
+        """Returns a callable which returns the value of the named field, or the value
+        returned by the specified callable for the row proxy, for a given row index."""
+
+        if isinstance(key, str):
+            column = self._columns.get(key)
+
+            if column is None:
+                return lambda index: None
+
+            return column.__getitem__
+        elif callable(key):
+            return lambda index: key(fluentrecord(self, index))
+        else:
+            raise TypeError(
+                "The 'key' argument must have a string value or reference a callable!"
+            )
+
+    def todicts(self) -> fluentlist[dict[str, object]]:
+        """Supports returning the records as a new fluentlist of dictionaries."""
+
+        names: list[str] = list(self._columns.keys())
+
+        return fluentlist(
+            dict(zip(names, values)) for values in zip(*self._columns.values())
+        )
+
+
+def _ndarray(column: list) -> object:
+    """Returns the column's values as a NumPy array if NumPy is available and the column
+    holds only integers or only floats, which fit into a NumPy array, or else None."""
+
+    if numpy is None or not _homogeneous(column):
+        return None
+
+    try:
+        return numpy.asarray(column)
+    except OverflowError:
+        return None
+
+
+def _conjunction(mask: bytes | object, other: bytes | object) -> bytes | object:
+    """Returns the logical AND of two masks, combining bytes bitmaps as integers, and
+    converting a bytes bitmap to a NumPy boolean array to combine it with an array."""
+
+    if isinstance(mask, bytes) and isinstance(other, bytes):
+        return (
+            int.from_bytes(mask, "little") & int.from_bytes(other, "little")
+        ).to_bytes(len(mask), "little")
+
+    if isinstance(mask, bytes):
+        mask = numpy.frombuffer(mask, dtype=bool)
+
+    if isinstance(other, bytes):
+        other = numpy.frombuffer(other, dtype=bool)
+
+    return mask & other
+
+
+def _population(mask: bytes | object) -> int:
+    """Returns the number of rows selected by the mask."""
+
+    if isinstance(mask, bytes):
+        return mask.count(1)
+
+    return int(numpy.count_nonzero(mask))
+
+
+def _positions(mask: bytes | object) -> list[int]:
+    """Returns the indices of the rows selected by the mask."""
+
+    if isinstance(mask, bytes):
+        return list(compress(range(len(mask)), mask))
+
+    return numpy.flatnonzero(mask).tolist()
+
+
+# Shorthand aliases
+frecords = flurecords = fluentrecords
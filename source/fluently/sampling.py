@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.utilities import accessor
+from collections.abc import Sequence
+from itertools import islice
+
+import hashlib
+import heapq
+import math
+import random
+import secrets
+
+logger = logger.getChild(__name__)
+
+
+def generator(
+    seed: int | str | bytes = None, rng: random.Random = None
+) -> random.Random:
+    """The generator method provides support for obtaining the random number generator
+    to use for a sampling or shuffling operation: the generator specified via `rng`, if
+    any, so that a caller may draw from its own generator, or a new generator seeded with
+    the seed, if specified, so that the results are reproducible, else the `random`
+    module itself, whose functions share the module's global generator."""
+
+    if rng is None:
+        pass
+    elif not isinstance(rng, random.Random):
+        raise TypeError(
+            "The 'rng' argument, if specified, must reference a random.Random instance!"
+        )
+    elif seed is not None:
+        raise ValueError("The 'seed' and 'rng' arguments cannot both be specified!")
+    else:
+        return rng
+
+    if seed is None:
+        return random
+    elif isinstance(seed, (int, str, bytes)) and not isinstance(seed, bool):
+        return random.Random(seed)
+    else:
+        raise TypeError(
+            "The 'seed' argument, if specified, must have an integer, string or bytes value!"
+        )
+
+
+def spawn(seed: int | str | bytes = None, count: int = 1) -> list[random.Random]:
+    """The spawn method provides support for creating the specified number of independent
+    random number generators, such as one for each of several parallel workers, each of
+    which is seeded from the hash of the root seed combined with the generator's index,
+    so that the generators produce unrelated streams, which are reproducible given the
+    same root seed and count; if no root seed is specified, a random one is chosen."""
+
+    if seed is None:
+        seed = secrets.randbits(128)
+    elif not isinstance(seed, (int, str, bytes)) or isinstance(seed, bool):
+        raise TypeError(
+            "The 'seed' argument, if specified, must have an integer, string or bytes value!"
+        )
+
+    if not isinstance(count, int):
+        raise TypeError("The 'count' argument must have an integer value!")
+    elif not count >= 1:
+        raise ValueError(
+            "The 'count' argument must have an integer value of 1 or more!"
+        )
+
+    root: bytes = seed if isinstance(seed, bytes) else repr(seed).encode()
+
+    return [
+        random.Random(
+            hashlib.blake2b(root + b":" + str(index).encode(), digest_size=32).digest()
+        )
+        for index in range(count)
+    ]
+
+
+def uniform(rng: random.Random) -> float:
+    """The uniform method provides support for obtaining a random float in the open
+    interval (0.0, 1.0), so that both its logarithm and its complement's are finite."""
+
+    while True:
+        value: float = rng.random()
+
+        if value > 0.0:
+            return value
+
+
+def sample(
+    iterable: object,
+    k: int,
+    weights: str | callable | object = None,
+    seed: int | str | bytes = None,
+    rng: random.Random = None,
+) -> list:
+    """The sample method provides support for drawing a random sample of k items without
+    replacement from an iterable, returning the sampled items as a list. Where the items
+    are held in a sequence, the sample is drawn via random indices, in O(k) time, else
+    the items are streamed through a reservoir of k items via Algorithm L, which skips
+    over the items that will not be sampled, so that only O(k) memory is needed however
+    many items there are. If weights are specified, either as an attribute name or a
+    callable returning the weight of each item, or as an iterable of weights aligned to
+    the items, each item is sampled with a probability proportional to its weight, via
+    the A-Res reservoir algorithm, where items with a weight of zero are never sampled.
+    The random numbers are drawn from the generator obtained via `generator()`."""
+
+    if not isinstance(k, int):
+        raise TypeError("The 'k' argument must have an integer value!")
+    elif not k >= 0:
+        raise ValueError("The 'k' argument must have an integer value of 0 or more!")
+
+    rng = generator(seed, rng)
+
+    if weights is not None:
+        return _weighted(iterable, k, weights, rng)
+    elif k == 0:
+        return []
+    elif isinstance(iterable, Sequence):
+        return rng.sample(iterable, min(k, len(iterable)))
+    else:
+        return _reservoir(iterable, k, rng)
+
+
+def _reservoir(iterable: object, k: int, rng: random.Random) -> list:
+    """Performs an unweighted reservoir sample via Algorithm L on behalf of sample."""
+
+    iterator = iter(iterable)
+
+    reservoir: list = list(islice(iterator, k))
+
+    if len(reservoir) < k:
+        rng.shuffle(reservoir)
+
+        return reservoir
+
+    w: float = math.exp(math.log(uniform(rng)) / k)
+
+    while w < 1.0:
+        # The number of items to skip before the next item which replaces an item held
+        # in the reservoir follows a geometric distribution parameterised by w
+        skip: int = math.floor(math.log(uniform(rng)) / math.log1p(-w))
+
+        for item in islice(iterator, skip, skip + 1):
+            reservoir[rng.randrange(k)] = item
+            break
+        else:
+            break
+
+        w *= math.exp(math.log(uniform(rng)) / k)
+
+    rng.shuffle(reservoir)
+
+    return reservoir
+
+
+def _weighted(iterable: object, k: int, weights: object, rng: random.Random) -> list:
+    """Performs a weighted reservoir sample via A-Res on behalf of sample, keeping the k
+    items with the largest keys of log(u) / weight in a heap as items are streamed."""
+
+    if callable(weights) or isinstance(weights, str):
+        weigher: callable = accessor(weights)
+
+        pairs = ((weigher(item), item) for item in iterable)
+    else:
+        pairs = ((weight, item) for item, weight in zip(iterable, weights, strict=True))
+
+    # The heap holds (key, index, item) triples, where the index ensures that the items
+    # themselves, which may not be comparable, are never compared with one another
+    heap: list[tuple[float, int, object]] = []
+
+    for index, (weight, item) in enumerate(pairs):
+        if not isinstance(weight, (int, float)) or isinstance(weight, bool):
+            raise TypeError("The sample weights must have integer or float values!")
+        elif weight < 0:
+            raise ValueError("The sample weights must not have negative values!")
+        elif weight == 0:
+            continue
+
+        key: float = math.log(uniform(rng)) / weight
+
+        if len(heap) < k:
+            heapq.heappush(heap, (key, index, item))
+        elif k > 0 and key > heap[0][0]:
+            heapq.heapreplace(heap, (key, index, item))
+
+    return [item for (key, index, item) in sorted(heap, reverse=True)]
+
+
+def shuffled(
+    iterable: object,
+    k: int = None,
+    seed: int | str | bytes = None,
+    rng: random.Random = None,
+) -> list:
+    """The shuffled method provides support for returning the items of an iterable as a
+    new list, shuffled via a partial Fisher-Yates shuffle which only randomises the first
+    k positions, so that they hold a uniformly random sample of the items, in a random
+    order, in O(k) time after the copy; if k is not specified, all are shuffled."""
+
+    if k is None:
+        pass
+    elif not isinstance(k, int):
+        raise TypeError("The 'k' argument, if specified, must have an integer value!")
+    elif not k >= 0:
+        raise ValueError("The 'k' argument must have an integer value of 0 or more!")
+
+    rng = generator(seed, rng)
+
+    items: list = list(iterable)
+
+    count: int = len(items)
+
+    for index in range(count if k is None else min(k, count)):
+        other: int = rng.randrange(index, count)
+
+        items[index], items[other] = items[other], items[index]
+
+    return items
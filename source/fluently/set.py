@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 from fluently.logging import logger
+from fluently.list import fluentlist
+from fluently import snapshot
+
+import heapq
 
 logger = logger.getChild(__name__)
 
@@ -61,6 +65,73 @@ class fluentset(set):
 
         return value in self
 
+    def top(
+        self, k: int, key: callable = None, reverse: bool = False
+    ) -> fluentlist[object]:
+        """Supports returning a new list of the set's first k items in sorted order."""
+
+        if not isinstance(k, int):
+            raise TypeError("The 'k' argument must have an integer value!")
+        elif not k >= 0:
+            raise ValueError(
+                "The 'k' argument must have an integer value of 0 or more!"
+            )
+
+        if key is None:
+            pass
+        elif not callable(key):
+            raise TypeError(
+                "The 'key' argument, if specified, must reference a callable!"
+            )
+
+        if not isinstance(reverse, bool):
+            raise TypeError("The 'reverse' argument must have a boolean value!")
+
+        if reverse is True:
+            return fluentlist(heapq.nlargest(k, self, key=key))
+        else:
+            return fluentlist(heapq.nsmallest(k, self, key=key))
+
+    def nsmallest(self, k: int, key: callable = None) -> fluentlist[object]:
+        """Supports returning a new list of the k smallest items of the set."""
+
+        return self.top(k, key=key)
+
+    def nlargest(self, k: int, key: callable = None) -> fluentlist[object]:
+        """Supports returning a new list of the k largest items of the set."""
+
+        return self.top(k, key=key, reverse=True)
+
+    def save(
+        self, path: str, compress: str = None, chunksize: int = None
+    ) -> fluentset[object]:
+        """Supports saving the set's items to the specified file as a chunked binary
+        snapshot, optionally compressed with the 'zlib', 'bz2' or 'lzma' codec, which can
+        be read via the `load()` method; see `fluently.snapshot.save()` for details."""
+
+        snapshot.save(self, path, compress=compress, chunksize=chunksize)
+
+        return self
+
+    @classmethod
+    def load(
+        cls, path: str, start: int = 0, stop: int = None, lazy: bool = False
+    ) -> fluentset[object]:
+        """Supports creating a new set holding the items of a snapshot saved via the
+        `save()` method, optionally only those from the start index until the stop index,
+        where chunks before the start are skipped. If `lazy` is set to `True` then an
+        iterator is returned instead, which reads and decodes each chunk as needed."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        if start == 0 and stop is None and lazy is False:
+            return cls(snapshot.load(path))
+
+        items = snapshot.stream(path, start=start, stop=stop)
+
+        return items if lazy is True else cls(items)
+
 
 # Shorthand aliases
 fset = fluset = fluentset
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.mapped import (
+    fluentmapped,
+    header,
+    signature,
+    version,
+    _array,
+    _encoder,
+    _encoding,
+)
+from fluently.array import typecodes
+from collections.abc import Sequence
+from itertools import accumulate
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import array
+import builtins
+import re
+import threading
+
+logger = logger.getChild(__name__)
+
+# Serialises the temporary replacement of the resource tracker's register function,
+# which is shared by all threads, while blocks are attached prior to Python 3.13
+_lock: threading.Lock = threading.Lock()
+
+
+class fluentshared(fluentmapped):
+    """A read-only sequence over items held in a named block of shared memory, via the
+    `multiprocessing.shared_memory` module, as created by the `share()` methods of the
+    `fluenttuple` and `fluentarray` classes, or by the `fluentshared.create()` method.
+    The items are held in the same format as used by the `fluentmapped` class, so the
+    sequence supports the same read-only fluent interface, reading each item from the
+    shared memory as it is accessed; the sequence is pickled by the name of the block,
+    so passing it to a worker process attaches to the block, rather than copying items.
+
+    The process that creates the block owns it, and must call `unlink()` once the items
+    are no longer needed, to free the block, or use the sequence as a context manager,
+    which unlinks the block upon exit; every process attached to the block, including
+    the owner, should call `close()` once done, which a context manager also does."""
+
+    def __init__(self, name: str):
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must have a string value!")
+
+        self._memory: SharedMemory = _attach(name)
+        self._owner: bool = False
+
+        if not self._load(self._memory.buf):
+            self._memory.close()
+
+            raise ValueError(
+                f"The shared memory block, {name}, does not hold fluently items!"
+            )
+
+    @classmethod
+    def create(cls, items: Sequence, name: str = None) -> fluentshared:
+        """Supports copying the items into a new block of shared memory, optionally with
+        the specified name, returning a sequence that owns the block. The items are held
+        as per the `fluently.mapped.save()` function, where integers and floats are held
+        as fixed width values, and other items as variable width values."""
+
+        if name is None:
+            pass
+        elif not isinstance(name, str):
+            raise TypeError(
+                "The 'name' argument, if specified, must have a string value!"
+            )
+
+        if not isinstance(items, Sequence):
+            items = tuple(items)
+
+        encoding: str = _encoding(items)
+
+        if encoding in typecodes:
+            values: memoryview = memoryview(_array(encoding, items)).cast("B")
+            offsets: memoryview = None
+            size: int = header.size + values.nbytes
+        else:
+            encoded: list[bytes] = list(builtins.map(_encoder(encoding), items))
+            offsets: memoryview = memoryview(
+                array.array("Q", accumulate(builtins.map(len, encoded), initial=0))
+            ).cast("B")
+            values: bytes = b"".join(encoded)
+
+            del encoded
+            size: int = header.size + offsets.nbytes + len(values)
+
+        memory = SharedMemory(name=name, create=True, size=size)
+
+        try:
+            header.pack_into(
+                memory.buf, 0, signature, version, encoding.encode(), len(items)
+            )
+
+            position: int = header.size
+
+            for part in (offsets, values):
+                if part is not None:
+                    memory.buf[position : position + len(part)] = part
+                    position += len(part)
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+
+        shared = cls.__new__(cls)
+        shared._memory = memory
+        shared._owner = True
+        shared._load(memory.buf)
+
+        return shared
+
+    def __reduce__(self) -> tuple:
+        return (self.__class__, (self.name,))
+
+    def __del__(self):
+        # Release the views onto the block so that the block may be closed when collected
+        if hasattr(self, "_values"):
+            self._release()
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+        if self._owner is True:
+            self.unlink()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, length={self._length})"
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the shared memory block, used to attach to the block."""
+
+        return self._memory.name
+
+    @property
+    def path(self) -> None:
+        """Returns None, as the items are held in shared memory rather than in a file."""
+
+        return None
+
+    @property
+    def owner(self) -> bool:
+        """Returns whether the current sequence created, and so owns, the block."""
+
+        return self._owner
+
+    def close(self) -> None:
+        """Supports detaching from the block, after which its items can no longer be read
+        via this sequence; the block itself remains until it is unlinked."""
+
+        self._release()
+
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Supports freeing the block, once all attached processes have closed it; this
+        should be called once, by the process which created the block."""
+
+        self._memory.unlink()
+
+    def _find(self, encoded: bytes, start: int) -> int:
+        """Returns the position of the first occurrence of the encoded bytes within the
+        shared memory, at or after the start position, or -1 if there is none."""
+
+        if found := re.compile(re.escape(encoded)).search(self._memory.buf, start):
+            return found.start()
+
+        return -1
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attaches to the named block of shared memory without registering the block with
+    the resource tracker, which would otherwise unlink the block when any attached
+    process exits, rather than leaving its lifetime to the process which created it."""
+
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+
+    # Prior to Python 3.13, blocks are always registered when attached, so registration
+    # is suppressed while attaching; unregistering the block afterwards is not an option
+    # as the resource tracker is shared with, and so would forget, the creating process.
+    # The replacement is made under a lock, so that concurrent attachments cannot leave
+    # it in place, and only suppresses registrations made by the attaching thread
+    thread: int = threading.get_ident()
+
+    with _lock:
+        register: callable = resource_tracker.register
+
+        def suppress(name: str, rtype: str):
+            if not (rtype == "shared_memory" and threading.get_ident() == thread):
+                register(name, rtype)
+
+        resource_tracker.register = suppress
+
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+# Shorthand aliases
+fshared = flushared = fluentshared
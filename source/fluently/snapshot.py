@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from array import array
+from itertools import islice
+
+import builtins
+import bz2
+import lzma
+import os
+import pickle
+import struct
+import tempfile
+import zlib
+
+logger = logger.getChild(__name__)
+
+# The signature and version recorded at the start of each snapshot file
+signature: bytes = b"FLUSNAPS"
+version: int = 1
+
+# The file header holding the signature, version, compression codec, count of the items
+# and count of the chunks, padded to 40 bytes; the counts are written once all of the
+# chunks have been written, so that the items may be provided by an iterator
+header: struct.Struct = struct.Struct("<8sB7x8sQQ")
+
+# The header preceding each chunk, holding the encoding of the chunk's items, either an
+# array typecode for integers or floats, or 'p' for pickled items, the count of the items
+# and the size of the encoded, and optionally compressed, items which follow the header
+chunkheader: struct.Struct = struct.Struct("<c7xQQ")
+
+# The number of items written together in each chunk, unless otherwise specified
+chunklength: int = 65536
+
+# The compression codecs from the standard library which may be used for the chunks
+codecs: dict[str, object] = {
+    "zlib": zlib,
+    "bz2": bz2,
+    "lzma": lzma,
+}
+
+
+def save(items: object, path: str, compress: str = None, chunksize: int = None) -> str:
+    """The save method provides support for writing the items to the specified file as a
+    binary snapshot, which is read by the `load()` and `stream()` methods. The items are
+    written in chunks, each encoded according to the types of its items: chunks of only
+    integers are written as arrays of the narrowest integer type that holds their values,
+    chunks of only floats as arrays of doubles, and other chunks are pickled; each chunk
+    is optionally compressed with the named codec, one of 'zlib', 'bz2' or 'lzma'. The
+    items may be any iterable, including an iterator, and the file is written to a
+    temporary file that then replaces any existing file. Returns the file's path."""
+
+    if not isinstance(path, (str, os.PathLike)):
+        raise TypeError("The 'path' argument must have a string or path-like value!")
+
+    if compress is None:
+        codec = None
+    elif not isinstance(compress, str):
+        raise TypeError("The 'compress' argument, if specified, must be a string!")
+    elif not compress in codecs:
+        raise ValueError(
+            "The 'compress' argument must have one of the following values: %s!"
+            % (", ".join(codecs))
+        )
+    else:
+        codec = codecs[compress]
+
+    if chunksize is None:
+        chunksize = chunklength
+    elif not isinstance(chunksize, int) or isinstance(chunksize, bool):
+        raise TypeError("The 'chunksize' argument must have an integer value!")
+    elif not chunksize >= 1:
+        raise ValueError(
+            "The 'chunksize' argument must have an integer value of 1 or more!"
+        )
+
+    path = os.fspath(path)
+
+    iterator = iter(items)
+
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp", delete=False
+    ) as file:
+        try:
+            # Reserve space for the header, which is written once the counts are known
+            file.write(bytes(header.size))
+
+            length: int = 0
+            chunks: int = 0
+
+            while chunk := list(islice(iterator, chunksize)):
+                encoding: str = _encoding(chunk)
+
+                if encoding == "p":
+                    payload = pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL)
+                else:
+                    payload = array(encoding, chunk).tobytes()
+
+                if codec is not None:
+                    payload = codec.compress(payload)
+
+                file.write(
+                    chunkheader.pack(encoding.encode(), len(chunk), len(payload))
+                )
+                file.write(payload)
+
+                length += len(chunk)
+                chunks += 1
+
+            file.seek(0)
+
+            file.write(
+                header.pack(
+                    signature, version, (compress or "").encode(), length, chunks
+                )
+            )
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+
+    os.replace(file.name, path)
+
+    return path
+
+
+def load(path: str) -> list:
+    """The load method provides support for reading all of the items from a snapshot
+    written by the `save()` method, returning them as a list, where each chunk of items
+    is decoded as a whole, such as via a single copy from an array of integers. Files
+    written by the `fluently.mapped.save()` method may also be loaded. As with pickle,
+    only snapshots from trusted sources should be loaded."""
+
+    from fluently import mapped
+
+    with open(path, "rb") as file:
+        if file.read(len(mapped.signature)) == mapped.signature:
+            with mapped.fluentmapped(path) as items:
+                if items._values is not None:
+                    return items._values.tolist()
+
+                return list(items)
+
+        file.seek(0)
+
+        items: list = []
+
+        for chunk in _chunks(file, _header(file), 0, None):
+            items.extend(chunk)
+
+        return items
+
+
+def stream(path: str, start: int = 0, stop: int = None):
+    """The stream method provides support for reading the items from a snapshot written
+    by the `save()` method, optionally only those from the start index until the stop
+    index, returning an iterator which reads and decodes each chunk as it is needed.
+    Chunks before the start index are skipped without being read, so that the items of
+    a later part of a snapshot can be read without reading the whole snapshot. Files
+    written by the `fluently.mapped.save()` method may also be streamed, where only the
+    items between the indices are read from the mapping. The file is checked when called
+    but is only opened to be read once the first item is needed."""
+
+    if not (isinstance(start, int) and not isinstance(start, bool)):
+        raise TypeError("The 'start' argument must have an integer value!")
+    elif not start >= 0:
+        raise ValueError("The 'start' argument must have a value of 0 or more!")
+
+    if stop is None:
+        pass
+    elif not (isinstance(stop, int) and not isinstance(stop, bool)):
+        raise TypeError("The 'stop' argument, if specified, must be an integer!")
+    elif not stop >= start:
+        raise ValueError("The 'stop' argument must not be less than the 'start'!")
+
+    from fluently import mapped
+
+    with open(path, "rb") as file:
+        if file.read(len(mapped.signature)) == mapped.signature:
+            return _mapped(path, start, stop)
+
+        file.seek(0)
+
+        _header(file)
+
+    return _stream(path, start, stop)
+
+
+def describe(path: str) -> dict[str, object]:
+    """The describe method provides support for reading the description of a snapshot
+    written by the `save()` method, without decoding its items, returning a dictionary
+    holding the 'length', or count of the items, the count of the 'chunks', the name of
+    the 'compress' codec, or None, and the 'encodings' of the chunks, where each is an
+    array typecode for chunks of integers or floats, or 'p' for pickled chunks."""
+
+    with open(path, "rb") as file:
+        (length, chunks, compress) = _header(file)
+
+        encodings: list[str] = []
+
+        for _ in range(chunks):
+            (encoding, count, size) = chunkheader.unpack(file.read(chunkheader.size))
+
+            encodings.append(encoding.decode())
+
+            file.seek(size, os.SEEK_CUR)
+
+    return {
+        "length": length,
+        "chunks": chunks,
+        "compress": compress,
+        "encodings": encodings,
+    }
+
+
+def _encoding(chunk: list) -> str:
+    """Determines the encoding of the chunk, preferring the narrowest array typecode."""
+
+    types: set[type] = set(builtins.map(type, chunk))
+
+    if types == {int}:
+        (lowest, highest) = (builtins.min(chunk), builtins.max(chunk))
+
+        for typecode in "bhiq":
+            limit: int = 2 ** (8 * array(typecode).itemsize - 1)
+
+            if -limit <= lowest and highest < limit:
+                return typecode
+    elif types == {float}:
+        return "d"
+
+    return "p"
+
+
+def _header(file: object) -> tuple[int, int, str | None]:
+    """Reads the file header, returning the count of the items and chunks and the name
+    of the codec used to compress the chunks, or None; raises a ValueError if the file
+    is not a snapshot."""
+
+    try:
+        (marker, revision, compress, length, chunks) = header.unpack(
+            file.read(header.size)
+        )
+    except struct.error:
+        marker = revision = None
+
+    if not (marker == signature and revision == version):
+        raise ValueError(f"The file, {file.name}, is not a fluently snapshot!")
+
+    compress: str = compress.rstrip(b"\x00").decode() or None
+
+    if not (compress is None or compress in codecs):
+        raise ValueError(f"The snapshot codec, {compress}, is not supported!")
+
+    return (length, chunks, compress)
+
+
+def _chunks(file: object, described: tuple, start: int, stop: int | None):
+    """Yields the decoded items of each chunk of the snapshot holding any items between
+    the start and stop indices, trimmed to the indices, skipping any earlier chunks;
+    the file is positioned after its header, whose values are described."""
+
+    (length, chunks, compress) = described
+
+    codec: object = None if compress is None else codecs[compress]
+
+    if stop is None:
+        stop = length
+
+    position: int = 0
+
+    for _ in range(chunks):
+        if not position < stop:
+            break
+
+        (encoding, count, size) = chunkheader.unpack(file.read(chunkheader.size))
+
+        if position + count <= start:
+            file.seek(size, os.SEEK_CUR)
+
+            position += count
+
+            continue
+
+        payload: bytes = file.read(size)
+
+        if codec is not None:
+            payload = codec.decompress(payload)
+
+        encoding = encoding.decode()
+
+        if encoding == "p":
+            items: list = pickle.loads(payload)
+        else:
+            values = array(encoding)
+            values.frombytes(payload)
+            items: list = values.tolist()
+
+        if position < start or position + count > stop:
+            items = items[builtins.max(start - position, 0) : stop - position]
+
+        position += count
+
+        yield items
+
+
+def _stream(path: str, start: int, stop: int | None):
+    """Yields the items of each chunk in turn on behalf of stream, opening the file once
+    the first item is needed, and closing it once done, or once closed early."""
+
+    with open(path, "rb") as file:
+        for chunk in _chunks(file, _header(file), start, stop):
+            yield from chunk
+
+
+def _mapped(path: str, start: int, stop: int | None):
+    """Yields the items of a file written by `fluently.mapped.save()` on behalf of stream,
+    mapping the file once the first item is needed, where only the items between the
+    start and stop indices are read."""
+
+    from fluently.mapped import fluentmapped
+
+    with fluentmapped(path) as items:
+        yield from builtins.map(items._item, range(len(items))[start:stop])
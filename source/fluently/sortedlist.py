@@ -0,0 +1,563 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.list import fluentlist
+from fluently.utilities import filter
+from collections.abc import Sequence
+from itertools import accumulate, chain, islice
+
+import bisect
+import builtins
+
+logger = logger.getChild(__name__)
+
+
+class fluentsortedlist(Sequence):
+    """A self-sorting list with a fluent interface, which keeps its items ordered as they
+    are added, according to their natural ordering or the optional `key` callable.
+
+    The items are held in a list of sorted sublists, each of which holds a bounded number
+    of items, alongside the largest key of each sublist, so that an item is located by a
+    binary search of the sublists' maxima followed by a binary search within the sublist,
+    and insertions and removals only move the items within a single, short, sublist."""
+
+    # The target number of items held per sublist; sublists are split once they grow
+    # to twice this size, and are merged with their neighbour once they shrink below half
+    load: int = 1000
+
+    def __init__(self, iterable: object = None, key: callable = None):
+        if key is None:
+            pass
+        elif not callable(key):
+            raise TypeError(
+                "The 'key' argument, if specified, must reference a callable!"
+            )
+
+        self._key: callable = key
+        self._lists: list[list] = []
+        self._keys: list[list] = self._lists if key is None else []
+        self._maxes: list = []
+        self._offsets: list[int] = None
+        self._length: int = 0
+
+        if iterable is not None:
+            self.update(iterable)
+
+    @classmethod
+    def _fromsorted(cls, values: list, key: callable = None) -> fluentsortedlist:
+        """Creates a new sorted list from items which are already known to be sorted."""
+
+        instance = cls(key=key)
+
+        for start in range(0, len(values), cls.load):
+            sublist = values[start : start + cls.load]
+
+            instance._lists.append(sublist)
+
+            if key is not None:
+                instance._keys.append([key(value) for value in sublist])
+
+            instance._maxes.append(instance._keys[-1][-1])
+
+        instance._length = len(values)
+
+        return instance
+
+    def _index(self) -> list[int]:
+        """Returns the offsets of each sublist, rebuilding them if they are stale."""
+
+        if self._offsets is None:
+            self._offsets = [0] + list(accumulate(len(items) for items in self._lists))
+
+        return self._offsets
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Returns the sublist position and sublist index for the specified index."""
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("The fluentsortedlist index is out of range!")
+
+        position: int = bisect.bisect_right(self._index(), index) - 1
+
+        return (position, index - self._offsets[position])
+
+    def _expand(self, position: int):
+        """Splits the sublist at the specified position should it have grown too large."""
+
+        if len(self._lists[position]) > (self.load * 2):
+            items = self._lists[position]
+
+            self._lists.insert(position + 1, items[self.load :])
+            del items[self.load :]
+
+            if self._key is not None:
+                keys = self._keys[position]
+
+                self._keys.insert(position + 1, keys[self.load :])
+                del keys[self.load :]
+
+            self._maxes[position] = self._keys[position][-1]
+            self._maxes.insert(position + 1, self._keys[position + 1][-1])
+
+    def _contract(self, position: int):
+        """Removes or merges the sublist at the specified position should it have become
+        empty or too small relative to the target load."""
+
+        if len(self._lists[position]) == 0:
+            del self._lists[position]
+
+            if self._key is not None:
+                del self._keys[position]
+
+            del self._maxes[position]
+        elif len(self._lists[position]) < (self.load // 2) and len(self._lists) > 1:
+            if position == len(self._lists) - 1:
+                position -= 1
+
+            self._lists[position].extend(self._lists.pop(position + 1))
+
+            if self._key is not None:
+                self._keys[position].extend(self._keys.pop(position + 1))
+
+            del self._maxes[position]
+
+            self._maxes[position] = self._keys[position][-1]
+
+            self._expand(position)
+        else:
+            self._maxes[position] = self._keys[position][-1]
+
+    def _find(self, value: object) -> tuple[int, int] | None:
+        """Returns the sublist position and sublist index of the first occurrence of the
+        specified value, or None if the value is not present."""
+
+        key = value if self._key is None else self._key(value)
+
+        position: int = bisect.bisect_left(self._maxes, key)
+
+        while position < len(self._maxes):
+            keys = self._keys[position]
+            items = self._lists[position]
+
+            index: int = bisect.bisect_left(keys, key)
+
+            while index < len(keys) and not key < keys[index]:
+                if items[index] == value:
+                    return (position, index)
+
+                index += 1
+
+            if index < len(keys):
+                break
+
+            position += 1
+
+        return None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        return chain.from_iterable(reversed(items) for items in reversed(self._lists))
+
+    def __contains__(self, value: object) -> bool:
+        return self._find(value) is not None
+
+    def __getitem__(self, index: int | builtins.slice) -> object:
+        if isinstance(index, builtins.slice):
+            start, stop, step = index.indices(self._length)
+
+            if step == 1:
+                if start >= stop:
+                    return fluentlist()
+
+                (position, offset) = self._locate(start)
+
+                return fluentlist(
+                    islice(
+                        chain(
+                            islice(self._lists[position], offset, None),
+                            chain.from_iterable(self._lists[position + 1 :]),
+                        ),
+                        stop - start,
+                    )
+                )
+
+            return fluentlist(list(self)[index])
+
+        (position, offset) = self._locate(index)
+
+        return self._lists[position][offset]
+
+    def __delitem__(self, index: int):
+        self.pop(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                a == b for (a, b) in zip(self, other)
+            )
+
+        return NotImplemented
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """Supports pickling the sorted list compactly, as its items in sorted order and
+        its key, without its sublists, keys or offsets, which are rebuilt from the items
+        upon unpickling without needing to sort them again."""
+
+        return (self.__class__._fromsorted, (list(self), self._key))
+
+    def __repr__(self) -> str:
+        if self._key is None:
+            return f"{self.__class__.__name__}({list(self)!r})"
+        else:
+            return f"{self.__class__.__name__}({list(self)!r}, key={self._key!r})"
+
+    def length(self) -> int:
+        """Supports returning the count of the total number of items in the list."""
+
+        return self._length
+
+    def clone(self) -> fluentsortedlist[object]:
+        """Supports returning a cloned, independent copy of the current list."""
+
+        return self._fromsorted(list(self), key=self._key)
+
+    def add(self, item: object) -> fluentsortedlist[object]:
+        """Supports adding the specified item to the list at its sorted position."""
+
+        key = item if self._key is None else self._key(item)
+
+        if self._maxes:
+            position: int = bisect.bisect_right(self._maxes, key)
+
+            if position == len(self._maxes):
+                position -= 1
+                self._lists[position].append(item)
+
+                if self._key is not None:
+                    self._keys[position].append(key)
+
+                self._maxes[position] = key
+            else:
+                index: int = bisect.bisect_right(self._keys[position], key)
+
+                self._lists[position].insert(index, item)
+
+                if self._key is not None:
+                    self._keys[position].insert(index, key)
+
+            self._expand(position)
+        else:
+            self._lists.append([item])
+
+            if self._key is not None:
+                self._keys.append([key])
+
+            self._maxes.append(key)
+
+        self._length += 1
+        self._offsets = None
+
+        return self
+
+    def update(self, iterable: object) -> fluentsortedlist[object]:
+        """Supports adding each of the items from the specified iterable to the list;
+        large batches are merged with the existing items via a single sort."""
+
+        values: list = list(iterable)
+
+        if len(values) * 4 >= self._length:
+            values = list(chain(self, values))
+            values.sort(key=self._key)
+
+            sortedlist = self._fromsorted(values, key=self._key)
+
+            self._lists = sortedlist._lists
+            self._keys = sortedlist._keys
+            self._maxes = sortedlist._maxes
+            self._length = sortedlist._length
+            self._offsets = None
+        else:
+            for value in values:
+                self.add(value)
+
+        return self
+
+    def extend(self, iterable: object) -> fluentsortedlist[object]:
+        """Supports adding each of the items from the specified iterable to the list."""
+
+        return self.update(iterable)
+
+    def remove(self, item: object, raises: bool = True) -> fluentsortedlist[object]:
+        """Supports removing the first occurance of the specified item from the list."""
+
+        if not isinstance(raises, bool):
+            raise TypeError("The 'raises' argument must have a boolean value!")
+
+        location: tuple[int, int] = self._find(item)
+
+        if location is None:
+            exception = ValueError(f"{item!r} is not in the fluentsortedlist!")
+
+            if raises is True:
+                raise exception
+            else:
+                logger.error(str(exception))
+        else:
+            self._delete(*location)
+
+        return self
+
+    def discard(self, item: object) -> fluentsortedlist[object]:
+        """Supports removing the specified item from the list, without raising an error
+        should the item be found not to exist - consistent with behaviour of sets."""
+
+        location: tuple[int, int] = self._find(item)
+
+        if location is not None:
+            self._delete(*location)
+
+        return self
+
+    def _delete(self, position: int, index: int):
+        """Deletes the item held at the specified sublist position and index."""
+
+        del self._lists[position][index]
+
+        if self._key is not None:
+            del self._keys[position][index]
+
+        self._length -= 1
+        self._offsets = None
+
+        self._contract(position)
+
+    def pop(self, index: int = -1) -> object:
+        """Supports removing and returning the item at the specified index."""
+
+        (position, offset) = self._locate(index)
+
+        item = self._lists[position][offset]
+
+        self._delete(position, offset)
+
+        return item
+
+    def clear(self) -> fluentsortedlist[object]:
+        """Supports removing all of the items from the list."""
+
+        del self._lists[:]
+        del self._keys[:]
+        del self._maxes[:]
+
+        self._length = 0
+        self._offsets = None
+
+        return self
+
+    def bisect_left(self, item: object) -> int:
+        """Supports returning the index at which the specified item would be inserted
+        before any existing items with an equal sort key."""
+
+        key = item if self._key is None else self._key(item)
+
+        position: int = bisect.bisect_left(self._maxes, key)
+
+        if position == len(self._maxes):
+            return self._length
+
+        return self._index()[position] + bisect.bisect_left(self._keys[position], key)
+
+    def bisect_right(self, item: object) -> int:
+        """Supports returning the index at which the specified item would be inserted
+        after any existing items with an equal sort key."""
+
+        key = item if self._key is None else self._key(item)
+
+        position: int = bisect.bisect_right(self._maxes, key)
+
+        if position == len(self._maxes):
+            return self._length
+
+        return self._index()[position] + bisect.bisect_right(self._keys[position], key)
+
+    bisect = bisect_right
+
+    def index(self, item: object) -> int:
+        """Supports returning the index of the first occurrence of the specified item."""
+
+        location: tuple[int, int] = self._find(item)
+
+        if location is None:
+            raise ValueError(f"{item!r} is not in the fluentsortedlist!")
+
+        (position, index) = location
+
+        return self._index()[position] + index
+
+    def count(self, item: object) -> int:
+        """Supports returning a count of how many list items have the specified value."""
+
+        start: int = self.bisect_left(item)
+        stop: int = self.bisect_right(item)
+
+        return sum(1 for value in self[start:stop] if value == item)
+
+    def contains(self, item: object) -> bool:
+        """Supports returning if the list contains the specified value or not."""
+
+        return item in self
+
+    def between(
+        self,
+        minimum: object = None,
+        maximum: object = None,
+        inclusive: tuple[bool, bool] = (True, True),
+    ) -> fluentsortedlist[object]:
+        """Supports returning a new sorted list of the items whose sort keys fall between
+        the specified minimum and maximum keys; either bound may be omitted to leave the
+        range open-ended, and the `inclusive` pair controls whether items with keys equal
+        to the minimum and maximum respectively are included."""
+
+        if not (
+            isinstance(inclusive, tuple)
+            and len(inclusive) == 2
+            and all(isinstance(value, bool) for value in inclusive)
+        ):
+            raise TypeError(
+                "The 'inclusive' argument must be a pair of boolean values!"
+            )
+
+        start: int = 0
+        stop: int = self._length
+
+        if minimum is not None:
+            position = (bisect.bisect_left if inclusive[0] else bisect.bisect_right)(
+                self._maxes, minimum
+            )
+
+            if position == len(self._maxes):
+                start = self._length
+            else:
+                start = self._index()[position] + (
+                    bisect.bisect_left if inclusive[0] else bisect.bisect_right
+                )(self._keys[position], minimum)
+
+        if maximum is not None:
+            position = (bisect.bisect_right if inclusive[1] else bisect.bisect_left)(
+                self._maxes, maximum
+            )
+
+            if position < len(self._maxes):
+                stop = self._index()[position] + (
+                    bisect.bisect_right if inclusive[1] else bisect.bisect_left
+                )(self._keys[position], maximum)
+
+        return self._fromsorted(self[start:stop], key=self._key)
+
+    def slice(
+        self, start: int, stop: int = None, step: int = 1
+    ) -> fluentsortedlist[object]:
+        """Supports returning a new sorted list containing the sliced part of the list."""
+
+        if not isinstance(start, int):
+            raise TypeError("The 'start' argument must have an integer value!")
+
+        if stop is None:
+            pass
+        elif not isinstance(stop, int):
+            raise TypeError("The 'stop' argument must have an integer value!")
+
+        if not isinstance(step, int):
+            raise TypeError("The 'step' argument must have an integer value!")
+        elif not step >= 1:
+            raise ValueError("The 'step' argument must have a positive integer value!")
+
+        return self._fromsorted(self[builtins.slice(start, stop, step)], key=self._key)
+
+    def take(self, index: int) -> fluentsortedlist[object]:
+        """Supports returning a new sorted list containing the items from the start of
+        the list until the index specified; the original list remains unmodified."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return self.slice(start=0, stop=index)
+
+    def drop(self, index: int) -> fluentsortedlist[object]:
+        """Supports returning a new sorted list containing the items from the specified
+        index until the end of the list; the original list remains unmodified."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return self.slice(start=index)
+
+    def map(self, function: callable) -> fluentlist[object]:
+        """Supports running a callback on each item in the list returning a new list; as
+        the results may not be in sorted order, a regular fluentlist is returned."""
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        return fluentlist(builtins.map(function, self))
+
+    def filter(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> fluentsortedlist[object]:
+        """Provides a fluent interface for filtering the current list; as filtering keeps
+        the items in order, a new sorted list is returned without re-sorting."""
+
+        if predicate is None:
+            pass
+        elif not callable(predicate):
+            raise TypeError(
+                "The 'predicate' argument, if specified, must reference a callable!"
+            )
+
+        if predicate:
+            items = list(builtins.filter(predicate, self))
+        else:
+            items = filter(self, **filters)
+
+        return self._fromsorted(items, key=self._key)
+
+    def first(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> object | None:
+        """Supports returning the first element or None if the list is empty."""
+
+        if predicate is not None or len(filters) > 0:
+            items = self.filter(predicate=predicate, **filters)
+        else:
+            items = self
+
+        return items[0] if (len(items) >= 1) else None
+
+    def last(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> object | None:
+        """Supports returning the last element or None if the list is empty."""
+
+        if predicate is not None or len(filters) > 0:
+            items = self.filter(predicate=predicate, **filters)
+        else:
+            items = self
+
+        return items[-1] if (len(items) >= 1) else None
+
+    def tolist(self) -> fluentlist[object]:
+        """Supports returning the items of the sorted list in order as a new fluentlist."""
+
+        return fluentlist(self)
+
+
+# Shorthand aliases
+fsortedlist = flusortedlist = fluentsortedlist
@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from itertools import chain
+from operator import itemgetter
+
+import heapq
+import pickle
+import re
+import sys
+import tempfile
+
+logger = logger.getChild(__name__)
+
+# The number of items serialised together into each block written to a spill file
+blocksize: int = 4096
+
+# The most temporary files that items are hash-partitioned across, and the least memory
+# in bytes given to the write buffer of each partition when deriving how many to use
+partitioning: int = 64
+buffering: int = 64 * 1024
+
+# The most times that the items of a partition which exceeds the memory limit will be
+# hash-partitioned again, such as when a partition holds one very large group
+depth: int = 4
+
+# The multipliers for the memory size units that may be used to specify memory limits
+units: dict[str, int] = {
+    "": 1,
+    "B": 1,
+    "KB": 1000,
+    "MB": 1000**2,
+    "GB": 1000**3,
+    "TB": 1000**4,
+    "KIB": 1024,
+    "MIB": 1024**2,
+    "GIB": 1024**3,
+    "TIB": 1024**4,
+}
+
+
+def size(limit: int | str) -> int:
+    """The size method provides support for parsing a memory size, specified either as
+    an integer number of bytes or as a string such as "512MB" or "1.5GiB", into the
+    corresponding integer number of bytes."""
+
+    if isinstance(limit, bool):
+        raise TypeError("The 'limit' argument must have an integer or string value!")
+    elif isinstance(limit, int):
+        value = limit
+    elif isinstance(limit, str):
+        match = re.fullmatch(r"\s*([0-9]+(?:\.[0-9]+)?)\s*([A-Za-z]*)\s*", limit)
+
+        if match is None or not match.group(2).upper() in units:
+            raise ValueError(f"The memory size, '{limit}', is invalid!")
+
+        value = int(float(match.group(1)) * units[match.group(2).upper()])
+    else:
+        raise TypeError("The 'limit' argument must have an integer or string value!")
+
+    if not value > 0:
+        raise ValueError("The memory size must be greater than zero bytes!")
+
+    return value
+
+
+def footprint(item: object) -> int:
+    """The footprint method provides support for approximating the memory used by an
+    item, including the reference held to it by its container; the approximation is a
+    shallow one, so items holding references to other objects will be underestimated."""
+
+    return sys.getsizeof(item) + 8
+
+
+def spill(items: list, directory: str = None) -> tempfile.TemporaryFile:
+    """The spill method provides support for writing the specified items to a temporary
+    file, serialised in blocks via pickle, returning the file positioned at its start.
+    The file is anonymous, and is removed automatically once it has been closed."""
+
+    file = tempfile.TemporaryFile(dir=directory)
+
+    for start in range(0, len(items), blocksize):
+        pickle.dump(
+            items[start : start + blocksize], file, protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+    file.seek(0)
+
+    return file
+
+
+def stream(file: tempfile.TemporaryFile):
+    """The stream method provides support for reading back items written to a temporary
+    file by the spill method, one block at a time, closing the file once exhausted."""
+
+    try:
+        while True:
+            try:
+                block: list = pickle.load(file)
+            except EOFError:
+                break
+
+            yield from block
+    finally:
+        file.close()
+
+
+def sort(
+    iterable: object,
+    key: callable = None,
+    reverse: bool = False,
+    limit: int | str = None,
+    directory: str = None,
+):
+    """The sort method provides support for sorting items which may not fit in memory,
+    via an external merge sort: items are accumulated until the approximate memory used
+    reaches the specified limit, at which point they are sorted and spilled as a run to
+    a temporary file in the specified directory; the sorted runs are then streamed back
+    and combined via a k-way merge. The sort is stable, and the method returns an
+    iterator, yielding the sorted items as they are needed; if all of the items fit
+    within the memory limit, they are sorted in memory without using temporary files."""
+
+    if key is None:
+        pass
+    elif not callable(key):
+        raise TypeError("The 'key' argument, if specified, must reference a callable!")
+
+    if not isinstance(reverse, bool):
+        raise TypeError("The 'reverse' argument must have a boolean value!")
+
+    return _sort(iterable, key, reverse, size(limit), directory)
+
+
+def _sort(iterable: object, key: callable, reverse: bool, limit: int, directory: str):
+    """Performs the external merge sort as a generator on behalf of the sort method."""
+
+    files: list[tempfile.TemporaryFile] = []
+
+    try:
+        items: list = []
+        used: int = 0
+
+        for item in iterable:
+            items.append(item)
+
+            used += footprint(item)
+
+            if used >= limit:
+                items.sort(key=key, reverse=reverse)
+
+                files.append(spill(items, directory=directory))
+
+                logger.debug(
+                    "Spilled a sorted run of %d items to a temporary file", len(items)
+                )
+
+                items = []
+                used = 0
+
+        items.sort(key=key, reverse=reverse)
+
+        if len(files) == 0:
+            yield from items
+        else:
+            runs = [stream(file) for file in files]
+
+            yield from heapq.merge(*runs, items, key=key, reverse=reverse)
+    finally:
+        for file in files:
+            file.close()
+
+
+def fanout(limit: int) -> int:
+    """The fanout method provides support for deriving the number of temporary files
+    that items should be hash-partitioned across from the specified memory limit, so that
+    the write buffers of all of the partitions together remain within the limit."""
+
+    return max(2, min(partitioning, limit // buffering))
+
+
+def partition(
+    items: object,
+    hasher: callable,
+    count: int,
+    directory: str = None,
+    limit: int = None,
+    salt: int = 0,
+) -> list[tempfile.TemporaryFile]:
+    """The partition method provides support for distributing the specified items across
+    the specified number of temporary files, according to the hash of the value returned
+    by the hasher for each item, so that all items with equal hashed values are written
+    to the same file, in the order they are provided. If a memory limit is specified, it
+    is shared between the write buffers of the partitions, otherwise each buffer holds a
+    block of items; a non-zero salt varies the hash, for re-partitioning a partition."""
+
+    files: list[tempfile.TemporaryFile] = []
+
+    try:
+        for _ in range(count):
+            files.append(tempfile.TemporaryFile(dir=directory))
+
+        buffers: list[list] = [[] for _ in range(count)]
+        sizes: list[int] = [0] * count
+
+        share: int = None if limit is None else max(1, limit // count)
+
+        for item in items:
+            if salt == 0:
+                number: int = hash(hasher(item)) % count
+            else:
+                number: int = hash((salt, hasher(item))) % count
+
+            buffer = buffers[number]
+
+            buffer.append(item)
+
+            if share is None:
+                flush: bool = len(buffer) >= blocksize
+            else:
+                sizes[number] += footprint(item)
+
+                flush: bool = sizes[number] >= share
+
+            if flush:
+                pickle.dump(buffer, files[number], protocol=pickle.HIGHEST_PROTOCOL)
+
+                buffer.clear()
+
+                sizes[number] = 0
+
+        for buffer, file in zip(buffers, files):
+            if len(buffer) > 0:
+                pickle.dump(buffer, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            file.seek(0)
+    except BaseException:
+        for file in files:
+            file.close()
+
+        raise
+
+    return files
+
+
+def unique(
+    iterable: object,
+    limit: int | str = None,
+    directory: str = None,
+    partitions: int = None,
+):
+    """The unique method provides support for removing duplicate items from an iterable
+    whose distinct items may not fit in memory. The unique items are yielded directly
+    from memory, in the order of their first occurrence, until their approximate memory
+    use reaches the specified limit, after which the remaining items are hash-partitioned
+    across temporary files, with the number of partitions derived from the limit unless
+    specified, and each partition is deduplicated and yielded in turn, so that only one
+    partition's distinct items are held in memory at a time; the unique items of each
+    partition are yielded in the order of their first occurrence within the partition.
+    Any partition whose distinct items exceed the limit is itself hash-partitioned."""
+
+    limit = size(limit)
+
+    if partitions is None:
+        partitions = fanout(limit)
+    elif not isinstance(partitions, int) or isinstance(partitions, bool):
+        raise TypeError("The 'partitions' argument must have an integer value!")
+    elif not partitions >= 1:
+        raise ValueError(
+            "The 'partitions' argument must have an integer value of 1 or more!"
+        )
+
+    return _unique(iterable, limit, directory, partitions)
+
+
+def _unique(iterable: object, limit: int, directory: str, partitions: int):
+    """Performs the spilling deduplication as a generator on behalf of unique."""
+
+    iterator = iter(iterable)
+
+    seen: set = set()
+    used: int = 0
+
+    for item in iterator:
+        if not item in seen:
+            seen.add(item)
+
+            yield item
+
+            used += footprint(item)
+
+            if used >= limit:
+                break
+    else:
+        return
+
+    # The items seen so far have already been yielded, so are only needed to identify
+    # later duplicates; they are partitioned, flagged as yielded, along with the items
+    # that remain, so that the memory used to hold them can be released
+    items = chain(((True, item) for item in seen), ((False, item) for item in iterator))
+
+    del seen
+
+    yield from _deduplicate(items, limit, directory, partitions, 0)
+
+
+def _deduplicate(
+    items: object, limit: int, directory: str, partitions: int, level: int
+):
+    """Partitions the (yielded, item) pairs and yields the unique items of each of the
+    partitions in turn, where only one partition is read into memory at a time."""
+
+    files = partition(
+        items, itemgetter(1), partitions, directory=directory, limit=limit, salt=level
+    )
+
+    try:
+        for file in files:
+            seen: set = set()
+            used: int = 0
+
+            pairs = stream(file)
+
+            for yielded, item in pairs:
+                if item in seen:
+                    continue
+
+                seen.add(item)
+
+                # As equal items share a partition, which retains the order of the
+                # items, the first occurrence of an item in its partition is its first
+                if not yielded:
+                    yield item
+
+                used += footprint(item)
+
+                if used >= limit and level < depth:
+                    logger.debug("Partitioning a partition of %d items", len(seen))
+
+                    yield from _deduplicate(
+                        chain(((True, item) for item in seen), pairs),
+                        limit,
+                        directory,
+                        partitions,
+                        level + 1,
+                    )
+
+                    break
+
+            del seen
+    finally:
+        for file in files:
+            file.close()
+
+
+def group(
+    iterable: object,
+    key: callable,
+    limit: int | str = None,
+    directory: str = None,
+    partitions: int = None,
+):
+    """The group method provides support for grouping items by the value returned by
+    the specified key callable, where the groups may not all fit in memory together.
+    Once the items exceed the specified memory limit, they are hash-partitioned by their
+    keys across temporary files, with the number of partitions derived from the limit
+    unless specified, and the groups of each partition are built and yielded in turn, so
+    that only one partition's groups are held in memory at a time; the (key, items) pairs
+    of each partition are yielded in the order in which each key was first seen within
+    the partition, while the items of each group retain their order. If the items fit
+    within the memory limit, no files are used, and the groups are yielded in the order
+    in which each key was first seen. Any partition which exceeds the memory limit while
+    holding more than one group is itself hash-partitioned."""
+
+    if not callable(key):
+        raise TypeError("The 'key' argument must reference a callable!")
+
+    limit = size(limit)
+
+    if partitions is None:
+        partitions = fanout(limit)
+    elif not isinstance(partitions, int) or isinstance(partitions, bool):
+        raise TypeError("The 'partitions' argument must have an integer value!")
+    elif not partitions >= 1:
+        raise ValueError(
+            "The 'partitions' argument must have an integer value of 1 or more!"
+        )
+
+    return _group(iterable, key, limit, directory, partitions)
+
+
+def _group(
+    iterable: object, key: callable, limit: int, directory: str, partitions: int
+):
+    """Performs the spilling grouping as a generator on behalf of group."""
+
+    iterator = iter(iterable)
+
+    buffered: list = []
+    used: int = 0
+
+    for item in iterator:
+        buffered.append(item)
+
+        used += footprint(item)
+
+        if used >= limit:
+            break
+    else:
+        groups: dict[object, list] = {}
+
+        for item in buffered:
+            value = key(item)
+
+            if value in groups:
+                groups[value].append(item)
+            else:
+                groups[value] = [item]
+
+        yield from groups.items()
+
+        return
+
+    items = chain(buffered, iterator)
+
+    del buffered
+
+    yield from _regroup(items, key, limit, directory, partitions, 0)
+
+
+def _regroup(
+    items: object,
+    key: callable,
+    limit: int,
+    directory: str,
+    partitions: int,
+    level: int,
+):
+    """Partitions the items by key and yields the (key, items) groups of each of the
+    partitions in turn, where only one partition is read into memory at a time."""
+
+    files = partition(
+        items, key, partitions, directory=directory, limit=limit, salt=level
+    )
+
+    try:
+        for file in files:
+            groups: dict[object, list] = {}
+            used: int = 0
+
+            values = stream(file)
+
+            for item in values:
+                value = key(item)
+
+                if value in groups:
+                    groups[value].append(item)
+                else:
+                    groups[value] = [item]
+
+                used += footprint(item)
+
+                if used >= limit and level < depth and len(groups) > 1:
+                    logger.debug("Partitioning a partition of %d groups", len(groups))
+
+                    yield from _regroup(
+                        chain(chain.from_iterable(groups.values()), values),
+                        key,
+                        limit,
+                        directory,
+                        partitions,
+                        level + 1,
+                    )
+
+                    break
+            else:
+                yield from groups.items()
+
+            del groups
+    finally:
+        for file in files:
+            file.close()
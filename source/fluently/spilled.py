@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.list import fluentlist
+from fluently.utilities import filter, sortkey
+from fluently import spill
+from collections import OrderedDict
+from collections.abc import Sequence
+from itertools import chain, islice
+
+import builtins
+import os
+import pickle
+import tempfile
+
+logger = logger.getChild(__name__)
+
+
+class fluentspilledlist(Sequence):
+    """A list with a fluent interface and a memory budget, for accumulating more items
+    than fit in memory. The items are held in chunks of a fixed number of items; once the
+    approximate memory used by the chunks held in memory exceeds the budget, the least
+    recently used complete chunks are spilled, serialised via pickle, to an anonymous
+    temporary file in the optional `spill_dir` directory, and are paged back into memory
+    when their items are next accessed by index. Iteration reads spilled chunks from the
+    file one at a time, without paging them back in, so that a pass over the items only
+    needs memory for the budget and a single chunk.
+
+    Items may be appended, but not modified or removed, so each chunk is written to the
+    temporary file at most once. The approximate memory used is shallow, as per the
+    `fluently.spill.footprint()` method, so items which reference other objects will be
+    underestimated; the file is removed once the list is closed or garbage collected.
+
+    The lists derived from the list, such as via the `take()` or `map()` methods, do
+    not share its budget; each derived list gets its own budget of the same size, and
+    its own temporary file, so a pipeline of derived lists may use several budgets."""
+
+    def __init__(
+        self,
+        iterable: object = None,
+        memory_limit: int | str = "256MB",
+        spill_dir: str = None,
+        chunksize: int = None,
+    ):
+        if chunksize is None:
+            chunksize = spill.blocksize
+        elif not isinstance(chunksize, int) or isinstance(chunksize, bool):
+            raise TypeError("The 'chunksize' argument must have an integer value!")
+        elif not chunksize >= 1:
+            raise ValueError(
+                "The 'chunksize' argument must have an integer value of 1 or more!"
+            )
+
+        if spill_dir is None:
+            pass
+        elif not isinstance(spill_dir, (str, os.PathLike)):
+            raise TypeError(
+                "The 'spill_dir' argument, if specified, must have a string value!"
+            )
+
+        self._limit: int = spill.size(memory_limit)
+        self._directory: str = spill_dir
+        self._chunksize: int = chunksize
+        self._length: int = 0
+
+        # The chunks held in memory, or None for chunks which have been spilled, along
+        # with the position and size of each chunk in the file once it has been written,
+        # and the approximate memory used by each chunk
+        self._chunks: list[list | None] = []
+        self._locations: list[tuple[int, int] | None] = []
+        self._sizes: list[int] = []
+        self._used: int = 0
+
+        # The indices of the complete chunks held in memory, least recently used first
+        self._resident: OrderedDict[int, None] = OrderedDict()
+
+        self._file: tempfile.TemporaryFile = None
+
+        if iterable is not None:
+            self.extend(iterable)
+
+    def _new(self, iterable: object = None) -> fluentspilledlist:
+        """Creates a new list holding the specified items, with its own budget of the
+        same size as the current list's budget, rather than a share of its budget."""
+
+        return self.__class__(
+            iterable,
+            memory_limit=self._limit,
+            spill_dir=self._directory,
+            chunksize=self._chunksize,
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return self._iterate(0)
+
+    def __getitem__(self, index: int | slice) -> object | fluentlist[object]:
+        if isinstance(index, slice):
+            return fluentlist(
+                builtins.map(self.__getitem__, range(self._length)[index])
+            )
+        elif not isinstance(index, int):
+            raise TypeError("The fluentspilledlist indices must be integers or slices!")
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("The fluentspilledlist index is out of range!")
+
+        (position, offset) = divmod(index, self._chunksize)
+
+        return self._page(position)[offset]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                a == b for (a, b) in zip(self, other)
+            )
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(length={self._length}, "
+            f"spilled={self.spilled}, memory_limit={self._limit})"
+        )
+
+    def __enter__(self) -> fluentspilledlist:
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    @property
+    def spilled(self) -> int:
+        """Returns the count of the chunks currently held only in the temporary file."""
+
+        return self._chunks.count(None)
+
+    def _read(self, position: int) -> list:
+        """Reads the chunk at the specified position from the temporary file."""
+
+        (start, size) = self._locations[position]
+
+        self._file.seek(start)
+
+        return pickle.loads(self._file.read(size))
+
+    def _page(self, position: int) -> list:
+        """Returns the chunk at the specified position, paging it back into memory if it
+        has been spilled, and marking it as the most recently used chunk."""
+
+        chunk: list = self._chunks[position]
+
+        if chunk is None:
+            chunk = self._chunks[position] = self._read(position)
+
+            self._used += self._sizes[position]
+
+            logger.debug("Paged in chunk %d of %d items", position, len(chunk))
+
+        if position in self._resident:
+            self._resident.move_to_end(position)
+        elif len(chunk) == self._chunksize:
+            self._resident[position] = None
+
+        self._evict(keep=position)
+
+        return chunk
+
+    def _evict(self, keep: int = None):
+        """Spills the least recently used complete chunks, other than the chunk being
+        kept, until the memory used is within the budget, writing each chunk to the
+        temporary file, unless it was written when it was previously spilled."""
+
+        while self._used > self._limit:
+            position: int = next(
+                (index for index in self._resident if not index == keep), None
+            )
+
+            if position is None:
+                break
+
+            del self._resident[position]
+
+            if self._locations[position] is None:
+                if self._file is None:
+                    self._file = tempfile.TemporaryFile(dir=self._directory)
+
+                data: bytes = pickle.dumps(
+                    self._chunks[position], protocol=pickle.HIGHEST_PROTOCOL
+                )
+
+                self._file.seek(0, os.SEEK_END)
+
+                self._locations[position] = (self._file.tell(), len(data))
+
+                self._file.write(data)
+
+                logger.debug("Spilled chunk %d to a temporary file", position)
+
+            self._chunks[position] = None
+            self._used -= self._sizes[position]
+
+    def _iterate(self, start: int):
+        """Yields the items from the specified index, skipping any earlier chunks."""
+
+        (position, offset) = divmod(start, self._chunksize)
+
+        for chunk in self._chunked(position):
+            if offset > 0:
+                yield from islice(chunk, offset, None)
+
+                offset = 0
+            else:
+                yield from chunk
+
+    def length(self) -> int:
+        """Supports returning the count of the total number of items in the list."""
+
+        return self._length
+
+    def clone(self) -> fluentspilledlist[object]:
+        """Supports returning a cloned, independent copy of the current list, with its
+        own budget of the same size."""
+
+        return self._new(self)
+
+    def _tail(self) -> list:
+        """Returns the last chunk, starting a new chunk if the last chunk is complete."""
+
+        if len(self._chunks) == 0 or len(self._chunks[-1]) == self._chunksize:
+            if len(self._chunks) > 0:
+                # The previous chunk is now complete, and so may be spilled
+                self._resident[len(self._chunks) - 1] = None
+
+            self._chunks.append([])
+            self._locations.append(None)
+            self._sizes.append(0)
+
+        return self._chunks[-1]
+
+    def append(self, item: object) -> fluentspilledlist[object]:
+        """Supports appending the specified item to the end of the list, spilling the
+        least recently used chunks should the list then exceed its memory budget."""
+
+        size: int = spill.footprint(item)
+
+        self._tail().append(item)
+        self._sizes[-1] += size
+        self._used += size
+        self._length += 1
+
+        if self._used > self._limit:
+            self._evict()
+
+        return self
+
+    def extend(self, iterable: object) -> fluentspilledlist[object]:
+        """Supports extending the list with the specified items by appending them, where
+        the items are appended in batches which fill the last chunk."""
+
+        if iterable is self:
+            iterable = islice(self, self._length)
+
+        iterator = iter(iterable)
+
+        while True:
+            if len(self._chunks) == 0:
+                space: int = self._chunksize
+            else:
+                space: int = (
+                    self._chunksize - len(self._chunks[-1])
+                ) or self._chunksize
+
+            batch: list = list(islice(iterator, space))
+
+            if len(batch) == 0:
+                break
+
+            size: int = sum(builtins.map(spill.footprint, batch))
+
+            self._tail().extend(batch)
+            self._sizes[-1] += size
+            self._used += size
+            self._length += len(batch)
+
+            if self._used > self._limit:
+                self._evict()
+
+        return self
+
+    def take(self, index: int) -> fluentspilledlist[object]:
+        """Supports returning a new list, with its own budget of the same size, holding
+        the items from the start of the list until the index specified."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return self._new(islice(self, len(range(self._length)[:index])))
+
+    def drop(self, index: int) -> fluentspilledlist[object]:
+        """Supports returning a new list, with its own budget of the same size, holding
+        the items from the specified index until the end of the list."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return self._new(self._iterate(self._length - len(range(self._length)[index:])))
+
+    def filter(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> fluentspilledlist[object]:
+        """Supports returning a new list, with its own budget of the same size, holding
+        the items which match the predicate, or the specified attribute filters."""
+
+        if predicate is None:
+            pass
+        elif not callable(predicate):
+            raise TypeError(
+                "The 'predicate' argument, if specified, must reference a callable!"
+            )
+
+        if predicate:
+            return self._new(builtins.filter(predicate, self))
+        else:
+            return self._new(
+                chain.from_iterable(
+                    filter(chunk, **filters) for chunk in self._chunked()
+                )
+            )
+
+    def map(self, function: callable) -> fluentspilledlist[object]:
+        """Supports returning a new list, with its own budget of the same size, holding
+        the result of running the callback on each item in the list."""
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        return self._new(builtins.map(function, self))
+
+    def sorted(
+        self,
+        key: callable = None,
+        reverse: bool = False,
+        by: str | list[str] = None,
+        nones: str = "last",
+        lazy: bool = False,
+    ) -> fluentspilledlist[object]:
+        """Supports returning a new list, with its own budget of the same size, holding
+        the items in sorted order, according to the `key` callable, or the `by`
+        attributes as per the `fluentlist.sort()` method, via an external merge sort
+        whose sorted runs are also bounded by the budget. If `lazy` is set to `True`
+        then an iterator is returned instead, yielding the sorted items as needed."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        if by is not None:
+            if key is not None:
+                raise TypeError("The 'by' and 'key' arguments cannot be combined!")
+
+            (key, reverse) = sortkey(by, nones=nones, reverse=reverse)
+
+        items = spill.sort(
+            self, key=key, reverse=reverse, limit=self._limit, directory=self._directory
+        )
+
+        return items if lazy is True else self._new(items)
+
+    def first(self) -> object | None:
+        """Supports returning the first item, or None if the list is empty."""
+
+        return self[0] if self._length > 0 else None
+
+    def last(self) -> object | None:
+        """Supports returning the last item, or None if the list is empty."""
+
+        return self[-1] if self._length > 0 else None
+
+    def collect(self) -> fluentlist[object]:
+        """Supports reading all of the items into memory as a new fluentlist."""
+
+        return fluentlist(self)
+
+    def close(self) -> None:
+        """Supports removing all of the items, and the temporary file holding any which
+        have been spilled, after which the list is empty."""
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        self._chunks.clear()
+        self._locations.clear()
+        self._sizes.clear()
+        self._resident.clear()
+        self._used = 0
+        self._length = 0
+
+    def _chunked(self, position: int = 0):
+        """Yields each chunk in turn from the specified chunk position, where spilled
+        chunks are read from the temporary file without being paged back into memory."""
+
+        for index in range(position, len(self._chunks)):
+            chunk: list = self._chunks[index]
+
+            yield self._read(index) if chunk is None else chunk
+
+
+# Shorthand aliases
+fspilledlist = fluspilledlist = fluentspilledlist
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.utilities import accessor
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Sequence
+from fractions import Fraction
+from itertools import repeat
+from operator import mul, sub, truediv
+
+import math
+
+logger = logger.getChild(__name__)
+
+# The array typecodes which hold integer and floating point values respectively
+integers: str = "bBhHiIlLqQ"
+floats: str = "fd"
+
+
+def stats(
+    iterable: object,
+    key: str | callable = None,
+    bins: int | Sequence = None,
+    bounds: tuple[float, float] = None,
+) -> dict[str, object]:
+    """The stats method provides support for computing the count, sum, minimum, maximum,
+    mean, sample variance and standard deviation, and optionally a histogram, of a set
+    of numeric values in a single pass. The values are the items themselves, or those
+    obtained from each item via the specified key, an attribute name or a callable; as
+    with SQL aggregates, values of None are ignored. The sum is computed exactly, via a
+    running set of partial sums as per `math.fsum`, while the variance is computed via
+    Welford's algorithm to avoid the loss of precision inherent in summing squares. As
+    per `math.fsum`, infinities and NaNs are summed separately, so that the sum is an
+    infinity or NaN where there are any, and NaN where there are infinities of either
+    sign; should the partial sums overflow, the sum is instead computed exactly from
+    rational values, so that the sum is only infinite if the exact sum overflows.
+
+    Where the values are held in a sequence of only integers or only floats, such as an
+    `array.array`, and no key is specified, the aggregates are instead computed by the
+    C implementations of `math.fsum`, `min` and `max` over the sequence, avoiding any
+    per-item Python bytecode, with the variance computed exactly from the deviations.
+
+    If `bins` is specified, either as a number of equal width bins, or as a sequence of
+    bin edges, a histogram is also computed; equal width bins span the minimum to the
+    maximum value, unless `bounds` are specified. As per NumPy, each bin includes its
+    lower edge, and the last bin also includes its upper edge, while values outside of
+    the bins are not counted. The aggregates are returned as a dictionary with 'count',
+    'sum', 'min', 'max', 'mean', 'variance' and 'stdev' keys, along with a 'histogram'
+    key holding a dictionary of the bin 'edges' and the 'counts' of each bin."""
+
+    if key is not None:
+        key = accessor(key)
+
+    edges: list[float] = None
+
+    if bins is None:
+        if bounds is not None:
+            raise ValueError("The 'bounds' argument can only be used with 'bins'!")
+    elif isinstance(bins, int) and not isinstance(bins, bool):
+        if not bins >= 1:
+            raise ValueError(
+                "The 'bins' argument must have an integer value of 1 or more!"
+            )
+
+        if bounds is None:
+            pass
+        elif not (isinstance(bounds, tuple) and len(bounds) == 2):
+            raise TypeError("The 'bounds' argument must reference a 2-tuple!")
+        else:
+            edges = _edges(bins, *bounds)
+    elif isinstance(bins, Sequence) and not isinstance(bins, str):
+        if bounds is not None:
+            raise ValueError("The 'bounds' argument cannot be used with bin edges!")
+        elif len(bins) < 2:
+            raise ValueError("The 'bins' argument must specify at least two edges!")
+        elif any(lower >= upper for lower, upper in zip(bins, bins[1:])):
+            raise ValueError("The 'bins' edges must be in strictly increasing order!")
+
+        edges = list(bins)
+    else:
+        raise TypeError(
+            "The 'bins' argument, if specified, must have an integer or sequence value!"
+        )
+
+    if key is None and _homogeneous(iterable):
+        results = _vectorised(iterable)
+
+        values = iterable
+    else:
+        # The values are only retained if they are needed to compute the bin edges
+        values = None if (bins is None or edges is not None) else array("d")
+
+        results = _streamed(iterable, key, edges, values)
+
+    if bins is not None:
+        if edges is None:
+            if results["count"] == 0:
+                edges = _edges(bins, 0.0, 1.0)
+            else:
+                edges = _edges(bins, results["min"], results["max"])
+
+        if not "histogram" in results:
+            results["histogram"] = _histogram(values, edges)
+
+    return results
+
+
+def _homogeneous(iterable: object) -> bool:
+    """Determines if the iterable is a sequence holding only integers or only floats."""
+
+    if isinstance(iterable, array):
+        return iterable.typecode in integers or iterable.typecode in floats
+    elif isinstance(iterable, Sequence) and not isinstance(iterable, (str, bytes)):
+        return len(iterable) > 0 and set(map(type, iterable)) in ({int}, {float})
+    else:
+        return False
+
+
+def _vectorised(values: Sequence) -> dict[str, object]:
+    """Computes the aggregates of a homogeneous sequence of numbers on behalf of stats,
+    making C level passes over the sequence, rather than a Python level pass."""
+
+    count: int = len(values)
+
+    if count == 0:
+        return _results(0, 0, None, None, None)
+
+    if isinstance(values[0], int):
+        total = sum(values)
+    else:
+        total = _fsum(values)
+
+    mean: float = total / count
+
+    if count > 1:
+        # Where the sum of finite values overflows, the deviations are instead taken from
+        # a mean computed from the values divided by the count, which cannot overflow
+        if (
+            math.isinf(mean)
+            and math.isfinite(min(values))
+            and math.isfinite(max(values))
+        ):
+            center: float = math.fsum(map(truediv, values, repeat(count)))
+        else:
+            center: float = mean
+
+        deviations = (map(sub, values, repeat(center)) for _ in range(2))
+
+        try:
+            variance = math.fsum(map(mul, *deviations))
+        except OverflowError:
+            # As the squares are not negative, only a sum which overflows overflows
+            variance = math.inf
+
+        variance /= count - 1
+    else:
+        variance = None
+
+    return _results(count, total, min(values), max(values), variance)
+
+
+def _streamed(
+    iterable: object, key: callable, edges: list[float], values: array
+) -> dict[str, object]:
+    """Computes the aggregates in a single Python level pass on behalf of stats."""
+
+    count: int = 0
+    integral: int = 0
+    partials: list[float] = []
+    minimum = None
+    maximum = None
+
+    # The sum of any infinities and NaNs, which are not held by the partial sums, and the
+    # exact sum of the floats once the partial sums have overflowed, if they have
+    special: float = 0.0
+    exact: Fraction = None
+
+    isfinite: callable = math.isfinite
+
+    # The running mean and sum of squared deviations from it, as per Welford
+    mean: float = 0.0
+    squares: float = 0.0
+
+    if edges is not None:
+        (limits, counts) = _bins(edges)
+
+    for item in iterable:
+        value = item if key is None else key(item)
+
+        if value is None:
+            continue
+        elif isinstance(value, int):
+            integral += value
+        elif isinstance(value, float):
+            if not isfinite(value):
+                special += value
+            elif exact is not None:
+                exact += Fraction(value)
+            else:
+                # Maintain the non-overlapping partial sums of the float values exactly,
+                # as per Shewchuk's algorithm, as used by math.fsum
+                previous: list[float] = partials[:]
+
+                running: float = value
+                index: int = 0
+
+                for partial in partials:
+                    if abs(running) < abs(partial):
+                        (running, partial) = (partial, running)
+
+                    high: float = running + partial
+                    low: float = partial - (high - running)
+
+                    if low:
+                        partials[index] = low
+                        index += 1
+
+                    running = high
+
+                if isfinite(running):
+                    partials[index:] = [running]
+                else:
+                    # The partial sums have overflowed, so the floats are summed exactly
+                    # from here on, starting from the partial sums before the overflow
+                    exact = sum(map(Fraction, previous), Fraction(value))
+
+                    partials.clear()
+        else:
+            raise TypeError(
+                f"The stats values must be integers or floats, not {type(value)}!"
+            )
+
+        count += 1
+
+        if minimum is None or value < minimum:
+            minimum = value
+
+        if maximum is None or value > maximum:
+            maximum = value
+
+        delta: float = value - mean
+        mean += delta / count
+        squares += delta * (value - mean)
+
+        if edges is not None:
+            index: int = bisect_right(limits, value)
+
+            if 0 < index < len(limits):
+                counts[index - 1] += 1
+        elif values is not None:
+            values.append(value)
+
+    if not math.isfinite(special):
+        total = special
+    elif exact is not None:
+        total = _rational(exact + integral)
+    elif len(partials) == 0:
+        total = integral
+    else:
+        total = _fsum(partials + [integral])
+
+    variance: float = (squares / (count - 1)) if count > 1 else None
+
+    if variance is not None and math.isnan(variance) and math.isfinite(special):
+        # Where the values are all finite, the running deviations only give NaN once
+        # they have overflowed, whereupon the variance itself overflows
+        variance = math.inf
+
+    results = _results(count, total, minimum, maximum, variance)
+
+    if edges is not None:
+        results["histogram"] = {"edges": edges, "counts": counts}
+
+    return results
+
+
+def _fsum(values: Sequence) -> float:
+    """Returns the sum of the values as per `math.fsum`, except that infinities of either
+    sign sum to NaN, rather than raising a ValueError, and that where the partial sums
+    overflow, the sum is computed exactly from rational values."""
+
+    try:
+        return math.fsum(values)
+    except (ValueError, OverflowError):
+        specials: list[float] = [value for value in values if not math.isfinite(value)]
+
+        if len(specials) > 0:
+            return sum(specials)
+
+        return _rational(sum(map(Fraction, values), Fraction(0)))
+
+
+def _rational(total: Fraction) -> float:
+    """Returns the exact sum as the nearest float, or as an infinity of the same sign
+    where the sum is too large to be held as a float."""
+
+    try:
+        return float(total)
+    except OverflowError:
+        return math.inf if total > 0 else -math.inf
+
+
+def _results(
+    count: int, total: object, minimum: object, maximum: object, variance: float
+) -> dict[str, object]:
+    """Assembles the dictionary of aggregates returned by stats."""
+
+    return {
+        "count": count,
+        "sum": total,
+        "min": minimum,
+        "max": maximum,
+        "mean": (total / count) if count > 0 else None,
+        "variance": variance,
+        "stdev": None if variance is None else math.sqrt(variance),
+    }
+
+
+def _edges(bins: int, lower: float, upper: float) -> list[float]:
+    """Computes the edges of the specified number of equal width bins spanning the
+    specified bounds, widening the bounds by half either side if they are equal."""
+
+    if not lower <= upper:
+        raise ValueError("The 'bounds' lower bound must not exceed the upper bound!")
+    elif lower == upper:
+        (lower, upper) = (lower - 0.5, upper + 0.5)
+
+    width: float = (upper - lower) / bins
+
+    return [lower + index * width for index in range(bins)] + [upper]
+
+
+def _bins(edges: list[float]) -> tuple[list[float], list[int]]:
+    """Returns the limits used to locate each value's bin via bisection, where the upper
+    edge of the last bin is nudged upwards so that the last bin includes its upper edge,
+    along with a list holding a zero count for each bin."""
+
+    limits: list[float] = edges[:-1] + [math.nextafter(edges[-1], math.inf)]
+
+    return (limits, [0] * (len(edges) - 1))
+
+
+def _histogram(values: Sequence, edges: list[float]) -> dict[str, list]:
+    """Computes a histogram of the values over the specified bins, where the values are
+    assigned to the bins via C level bisection, and tallied via a Counter."""
+
+    (limits, counts) = _bins(edges)
+
+    for index, tally in Counter(map(bisect_right, repeat(limits), values)).items():
+        if 0 < index < len(limits):
+            counts[index - 1] += tally
+
+    return {"edges": edges, "counts": counts}
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from collections.abc import Mapping
+from itertools import islice, repeat
+from queue import Full, Queue
+
+import builtins
+import csv
+import json
+import os
+import tempfile
+import threading
+
+logger = logger.getChild(__name__)
+
+# The number of characters read from a file at a time, and thus the approximate size of
+# each batch of lines parsed together, balancing the count of reads against the memory
+# held by the batch
+buffersize: int = 1024**2
+
+# The number of items parsed or written together as a batch where the batch size is not
+# determined by the buffer size, such as for CSV rows, which may span lines
+batchsize: int = 4096
+
+# The number of parsed batches that the background thread may read ahead, bounding the
+# memory used when the items are parsed faster than they are consumed
+depth: int = 4
+
+
+def read_lines(path: str, encoding: str = "utf-8", threaded: bool = False):
+    """The read_lines method provides support for streaming the lines of a text file,
+    without their line endings, reading the file in large buffered blocks which are each
+    split into lines in a single pass, rather than reading the file a line at a time.
+    Returns an iterator which yields the lines as they are needed, reading the file as
+    it goes; if `threaded` is `True` the file is read ahead in a background thread."""
+
+    return _stream(_blocks, path, encoding, threaded)
+
+
+def read_jsonl(path: str, encoding: str = "utf-8", threaded: bool = False):
+    """The read_jsonl method provides support for streaming the items of a JSON Lines
+    file, where each non-blank line holds a JSON value. The file is read in large blocks
+    and the lines of each block are decoded in turn by a single reused JSON decoder, so
+    that each item must be decoded from exactly one line. Returns an iterator which yields
+    the decoded items as they are needed; if `threaded` is `True` the file is read and
+    decoded ahead in a background thread."""
+
+    return _stream(_jsonl, path, encoding, threaded)
+
+
+def read_csv(
+    path: str,
+    fields: list[str] = None,
+    encoding: str = "utf-8",
+    threaded: bool = False,
+    **formatting: dict[str, object],
+):
+    """The read_csv method provides support for streaming the rows of a CSV file, each
+    as a dictionary keyed by the field names, which are read from the first row of the
+    file unless specified; the values are returned as strings, as per the `csv` module,
+    which also accepts the formatting arguments, such as `delimiter`. Returns an iterator
+    which yields the rows as they are needed; if `threaded` is `True` the file is read
+    and parsed ahead in a background thread."""
+
+    if fields is None:
+        pass
+    elif not (
+        isinstance(fields, (list, tuple))
+        and all(isinstance(field, str) for field in fields)
+    ):
+        raise TypeError(
+            "The 'fields' argument, if specified, must reference a list of strings!"
+        )
+
+    return _stream(_csv, path, encoding, threaded, fields, formatting, newline="")
+
+
+def write_jsonl(items: object, path: str, encoding: str = "utf-8") -> str:
+    """The write_jsonl method provides support for writing the items to a JSON Lines
+    file, one JSON value per line, where objects other than those supported by the JSON
+    encoder are written as an object holding their public attributes. The items, which
+    may be any iterable including an iterator, are encoded and written in batches, to a
+    temporary file that then replaces any existing file. Returns the file's path."""
+
+    encoder: json.JSONEncoder = json.JSONEncoder(default=_serialisable)
+
+    def write(file: object):
+        for batch in _batches(items):
+            file.write("\n".join(builtins.map(encoder.encode, batch)))
+            file.write("\n")
+
+    return _write(path, encoding, write)
+
+
+def write_csv(
+    items: object,
+    path: str,
+    fields: list[str] = None,
+    encoding: str = "utf-8",
+    **formatting: dict[str, object],
+) -> str:
+    """The write_csv method provides support for writing the items to a CSV file, with
+    a header row of field names followed by a row for each item, holding the values of
+    the item's fields, taken from the keys of mappings or the attributes of any other
+    items; unless specified, the fields are those of the first item. The items are
+    written in batches, to a temporary file that then replaces any existing file, and
+    any formatting arguments are passed to the `csv` module. Returns the file's path."""
+
+    if fields is None:
+        pass
+    elif not (
+        isinstance(fields, (list, tuple))
+        and all(isinstance(field, str) for field in fields)
+    ):
+        raise TypeError(
+            "The 'fields' argument, if specified, must reference a list of strings!"
+        )
+
+    iterator = iter(items)
+
+    # The first item is used to determine the fields, and then written with the others
+    first: list = list(islice(iterator, 1))
+
+    if fields is None:
+        if len(first) == 0:
+            raise ValueError("The 'fields' argument must be specified if no items!")
+
+        fields = _fields(first[0])
+
+    def write(file: object):
+        writer = csv.writer(file, **formatting)
+
+        writer.writerow(fields)
+
+        for batch in _batches(first, iterator):
+            writer.writerows(builtins.map(_row, batch, repeat(fields)))
+
+    return _write(path, encoding, write, newline="")
+
+
+def _stream(
+    parser: callable,
+    path: str,
+    encoding: str,
+    threaded: bool,
+    *args,
+    newline: str = None,
+):
+    """Validates the arguments common to the readers, returning an iterator over the
+    batches of items produced by the parser, optionally via a background thread."""
+
+    if not isinstance(path, (str, os.PathLike)):
+        raise TypeError("The 'path' argument must have a string or path-like value!")
+
+    if not isinstance(encoding, str):
+        raise TypeError("The 'encoding' argument must have a string value!")
+
+    if not isinstance(threaded, bool):
+        raise TypeError("The 'threaded' argument must have a boolean value!")
+
+    # A missing file is reported at the call, while the file is only opened once the
+    # items are first needed, so that an iterator which is never used holds no file
+    os.stat(path)
+
+    batches = _opened(parser, path, encoding, newline, *args)
+
+    if threaded is True:
+        batches = _background(batches)
+
+    return _flatten(batches)
+
+
+def _opened(parser: callable, path: str, encoding: str, newline: str, *args):
+    """Opens the file once the first batch is needed, and yields the batches produced
+    by the parser for the file, closing the file once done, or once closed early."""
+
+    with open(path, encoding=encoding, newline=newline) as file:
+        yield from parser(file, *args)
+
+
+def _flatten(batches):
+    """Yields the items of each batch in turn, closing the batches once done."""
+
+    try:
+        for batch in batches:
+            yield from batch
+    finally:
+        batches.close()
+
+
+def _blocks(file: object):
+    """Yields the lines of the file in batches, reading the file a block at a time, and
+    carrying any partial line at the end of each block over to the following block."""
+
+    remainder: str = ""
+
+    while block := file.read(buffersize):
+        lines: list[str] = (remainder + block).split("\n")
+
+        remainder = lines.pop()
+
+        yield lines
+
+    if remainder:
+        yield [remainder]
+
+
+def _jsonl(file: object):
+    """Yields the decoded items of the file in batches on behalf of read_jsonl, where
+    the lines of each batch are decoded individually; should any line fail to decode,
+    such as a blank line, the lines are decoded once more, skipping the blank lines, so
+    that an invalid line is reported with its line number."""
+
+    decode: callable = json.JSONDecoder().decode
+
+    number: int = 0
+
+    for lines in _blocks(file):
+        try:
+            items = list(builtins.map(decode, lines))
+        except ValueError:
+            items = []
+
+            for offset, line in enumerate(lines, start=number + 1):
+                if line.strip():
+                    try:
+                        items.append(decode(line))
+                    except ValueError as exception:
+                        raise ValueError(
+                            f"The line {offset} of {file.name} is not valid JSON: "
+                            f"{exception}!"
+                        ) from exception
+
+        number += len(lines)
+
+        yield items
+
+
+def _csv(file: object, fields: list[str], formatting: dict[str, object]):
+    """Yields the rows of the file, as dictionaries, in batches on behalf of read_csv."""
+
+    rows = csv.DictReader(file, fieldnames=fields, **formatting)
+
+    while batch := list(islice(rows, batchsize)):
+        yield batch
+
+
+def _background(batches):
+    """Yields the batches produced by the iterator, where the iterator is run ahead in
+    a background thread, via a bounded queue; any exception raised by the iterator is
+    raised by the consumer, and the thread is stopped if the consumer stops early."""
+
+    queue: Queue = Queue(maxsize=depth)
+    stopped: threading.Event = threading.Event()
+
+    def put(entry: tuple) -> bool:
+        while not stopped.is_set():
+            try:
+                queue.put(entry, timeout=0.1)
+            except Full:
+                continue
+
+            return True
+
+        return False
+
+    def produce():
+        try:
+            for batch in batches:
+                if not put((batch, None)):
+                    break
+            else:
+                put((None, None))
+        except BaseException as exception:
+            put((None, exception))
+        finally:
+            batches.close()
+
+    thread = threading.Thread(target=produce, name="fluently-reader", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            (batch, exception) = queue.get()
+
+            if exception is not None:
+                raise exception
+            elif batch is None:
+                break
+
+            yield batch
+    finally:
+        # The producer checks the event between its attempts to add to a full queue
+        stopped.set()
+
+        thread.join()
+
+
+def _batches(*iterables: object):
+    """Yields the items of the iterables in lists of up to the batch size."""
+
+    for iterable in iterables:
+        iterator = iter(iterable)
+
+        while batch := list(islice(iterator, batchsize)):
+            yield batch
+
+
+def _write(path: str, encoding: str, write: callable, newline: str = None) -> str:
+    """Opens a temporary file alongside the specified path, with a large write buffer,
+    calls the write callable with the file, and then replaces the file at the path with
+    the temporary file, which is removed if the write fails. Returns the path."""
+
+    if not isinstance(path, (str, os.PathLike)):
+        raise TypeError("The 'path' argument must have a string or path-like value!")
+
+    if not isinstance(encoding, str):
+        raise TypeError("The 'encoding' argument must have a string value!")
+
+    path = os.fspath(path)
+
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        encoding=encoding,
+        newline=newline,
+        buffering=buffersize,
+        dir=os.path.dirname(os.path.abspath(path)),
+        suffix=".tmp",
+        delete=False,
+    ) as file:
+        try:
+            write(file)
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+
+    os.replace(file.name, path)
+
+    return path
+
+
+def _fields(item: object) -> list[str]:
+    """Determines the field names of an item, as the keys of a mapping or the names of
+    the public attributes of any other item."""
+
+    if isinstance(item, Mapping):
+        fields = list(item.keys())
+    elif hasattr(item, "__dict__"):
+        fields = [name for name in vars(item) if not name.startswith("_")]
+    else:
+        fields = []
+
+    if len(fields) == 0:
+        raise TypeError(
+            "The field names must be specified for items of type %s!"
+            % (type(item).__name__)
+        )
+
+    return fields
+
+
+def _row(item: object, fields: list[str]) -> list:
+    """Returns the values of the item's fields, where missing fields are None."""
+
+    if isinstance(item, Mapping):
+        return [item.get(field) for field in fields]
+    else:
+        return [getattr(item, field, None) for field in fields]
+
+
+def _serialisable(item: object) -> dict[str, object]:
+    """Returns the public attributes of an item that the JSON encoder cannot encode."""
+
+    if hasattr(item, "__dict__"):
+        return {
+            name: value
+            for name, value in vars(item).items()
+            if not name.startswith("_")
+        }
+
+    raise TypeError(f"Items of type {type(item).__name__} are not JSON serialisable!")
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.list import fluentlist
+from fluently.set import fluentset
+
+import bisect
+
+logger = logger.getChild(__name__)
+
+
+class fluentstringset(fluentset):
+    """A fluentset subclass for holding strings which maintains a sorted index of its
+    members alongside the set, supporting ordered iteration and efficient prefix search.
+
+    The sorted index is built lazily on first use, and is then maintained as strings
+    are added or removed: single strings are inserted or removed via a binary search of
+    the index, and batches of strings are merged into the index, without a re-sort."""
+
+    def __init__(self, iterable: object = None):
+        if iterable is None:
+            iterable = []
+
+        super().__init__(self._validate(item) for item in iterable)
+
+        self._sorted: list[str] = None
+
+    @staticmethod
+    def _validate(item: object) -> str:
+        """Ensure that the specified item is a string before it is added to the set."""
+
+        if not isinstance(item, str):
+            raise TypeError(
+                "The fluentstringset class only supports holding string values!"
+            )
+
+        return item
+
+    def __getstate__(self) -> dict[str, object]:
+        """Supports pickling the set without its sorted index, which is rebuilt as needed
+        once the set has been unpickled."""
+
+        return {**self.__dict__, "_sorted": None}
+
+    def _index(self) -> list[str]:
+        """Returns the sorted index of the set's members, rebuilding it if needed."""
+
+        if self._sorted is None:
+            self._sorted = sorted(super().__iter__())
+
+        return self._sorted
+
+    def _insert(self, items: list[str]):
+        """Inserts the new strings into the sorted index, if it has been built, via
+        binary insertion for a few strings, or otherwise by appending the sorted strings
+        and sorting the index, which merges the two sorted runs in one linear pass."""
+
+        if self._sorted is None or len(items) == 0:
+            pass
+        elif len(items) <= 8:
+            for item in items:
+                bisect.insort(self._sorted, item)
+        else:
+            self._sorted.extend(sorted(items))
+            self._sorted.sort()
+
+    def _delete(self, item: str):
+        """Removes the string from the sorted index, if it has been built, locating the
+        string via a binary search of the index."""
+
+        if self._sorted is not None:
+            del self._sorted[bisect.bisect_left(self._sorted, item)]
+
+    def _retain(self):
+        """Removes any strings no longer held by the set from the sorted index, if it
+        has been built, in a single pass which keeps the order of remaining strings."""
+
+        if self._sorted is not None:
+            self._sorted = [item for item in self._sorted if item in self]
+
+    def __iter__(self):
+        """Supports iterating over the members of the set in lexicographic order."""
+
+        return iter(self._index())
+
+    def __reversed__(self):
+        """Supports iterating over the members of the set in reverse lexicographic order."""
+
+        return reversed(self._index())
+
+    def clone(self) -> fluentstringset[str]:
+        """Supports returning a cloned, independent copy of the current set."""
+
+        return fluentstringset(self)
+
+    def add(self, item: str) -> fluentstringset[str]:
+        """Supports adding the specified string to the current set if not already present."""
+
+        if not item in self:
+            super().add(self._validate(item))
+            self._insert([item])
+
+        return self
+
+    def remove(self, item: str, raises: bool = True) -> fluentstringset[str]:
+        """Supports removing the specified string from the current set if present; see
+        the `fluentset.remove()` method for the behaviour of the `raises` argument."""
+
+        present: bool = item in self
+
+        super().remove(item, raises=raises)
+
+        if present:
+            self._delete(item)
+
+        return self
+
+    def discard(self, item: str) -> fluentstringset[str]:
+        """Supports removing the specified string from the set."""
+
+        if item in self:
+            super().discard(item)
+            self._delete(item)
+
+        return self
+
+    def clear(self) -> fluentstringset[str]:
+        """Supports removing all of the items from the set."""
+
+        super().clear()
+
+        self._sorted = None
+
+        return self
+
+    def pop(self) -> str:
+        """Supports removing and returning an arbitrary string from the set."""
+
+        item = super().pop()
+
+        self._delete(item)
+
+        return item
+
+    def update(self, *iterables: object) -> fluentstringset[str]:
+        """Supports adding the strings from each of the specified iterables to the set."""
+
+        for iterable in iterables:
+            items: list[str] = [
+                item for item in set(map(self._validate, iterable)) if not item in self
+            ]
+
+            super().update(items)
+
+            self._insert(items)
+
+        return self
+
+    def intersection_update(self, *iterables: object) -> fluentstringset[str]:
+        """Supports retaining only the strings also found in the specified iterables."""
+
+        super().intersection_update(*iterables)
+
+        self._retain()
+
+        return self
+
+    def difference_update(self, *iterables: object) -> fluentstringset[str]:
+        """Supports removing the strings found in any of the specified iterables."""
+
+        super().difference_update(*iterables)
+
+        self._retain()
+
+        return self
+
+    def symmetric_difference_update(self, iterable: object) -> fluentstringset[str]:
+        """Supports retaining the strings found in either but not both of the sets."""
+
+        items: set[str] = set(self._validate(item) for item in iterable)
+
+        added: list[str] = [item for item in items if not item in self]
+
+        super().symmetric_difference_update(items)
+
+        if len(added) < len(items):
+            self._retain()
+
+        self._insert(added)
+
+        return self
+
+    def __ior__(self, other: set[str]) -> fluentstringset[str]:
+        """Supports adding strings to the current set in-place via the '|=' syntax."""
+
+        return self.update(other)
+
+    def __iand__(self, other: set[str]) -> fluentstringset[str]:
+        """Supports intersecting the current set in-place via the '&=' syntax."""
+
+        return self.intersection_update(other)
+
+    def __isub__(self, other: set[str]) -> fluentstringset[str]:
+        """Supports removing strings from the current set in-place via the '-=' syntax."""
+
+        return self.difference_update(other)
+
+    def __ixor__(self, other: set[str]) -> fluentstringset[str]:
+        """Supports the symmetric difference of the set in-place via the '^=' syntax."""
+
+        return self.symmetric_difference_update(other)
+
+    def startswith(self, prefix: str) -> fluentlist[str]:
+        """Supports returning a new list, in lexicographic order, of the strings in the
+        set that start with the specified prefix; the matching strings are located via
+        a binary search of the sorted index so only the matching range is visited."""
+
+        if not isinstance(prefix, str):
+            raise TypeError("The 'prefix' argument must have a string value!")
+
+        index: list[str] = self._index()
+
+        start: int = bisect.bisect_left(index, prefix)
+        stop: int = start
+
+        while stop < len(index) and index[stop].startswith(prefix):
+            stop += 1
+
+        return fluentlist(index[start:stop])
+
+    def longest_prefix_of(self, value: str) -> str | None:
+        """Supports returning the longest string in the set which is a prefix of the
+        specified value, or None if no string in the set is a prefix of the value."""
+
+        if not isinstance(value, str):
+            raise TypeError("The 'value' argument must have a string value!")
+
+        for length in range(len(value), -1, -1):
+            if value[:length] in self:
+                return value[:length]
+
+        return None
+
+
+# Shorthand aliases
+fstringset = flustringset = fluentstringset
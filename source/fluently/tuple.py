@@ -2,11 +2,25 @@ from __future__ import annotations
 
 from fluently.logging import logger
 from fluently.list import fluentlist
+from fluently.grouping import fluentgroups
+from fluently.join import join
+from fluently.stats import stats
 from fluently.utilities import filter
+from fluently import sampling, snapshot
 from functools import reduce
+from itertools import islice
 
 import random
 import builtins
+import heapq
+import typing
+
+if typing.TYPE_CHECKING:
+    from fluently.bag import fluentbag
+    from fluently.mapped import fluentmapped
+    from fluently.shared import fluentshared
+    from fluently.numeric import fluentnumeric
+    from fluently.view import fluentview
 
 logger = logger.getChild(__name__)
 
@@ -83,10 +97,38 @@ class fluenttuple(tuple):
 
         return fluenttuple(fluentlist(self).reverse())
 
-    def shuffle(self) -> fluenttuple[object]:
-        """Supports randomly suffling the order of the items within a new tuple."""
+    def shuffle(
+        self, seed: int | str | bytes = None, rng: random.Random = None
+    ) -> fluenttuple[object]:
+        """Supports randomly suffling the order of the items within a new tuple,
+        optionally via a generator seeded with the seed, or via the given generator."""
+
+        return fluenttuple(fluentlist(self).shuffle(seed=seed, rng=rng))
 
-        return fluenttuple(fluentlist(self).shuffle())
+    def shuffled(
+        self,
+        k: int = None,
+        seed: int | str | bytes = None,
+        rng: random.Random = None,
+    ) -> fluenttuple[object]:
+        """Supports returning a new tuple holding the items of the tuple shuffled via a
+        partial Fisher-Yates shuffle, which only randomises the first k positions."""
+
+        return fluenttuple(sampling.shuffled(self, k=k, seed=seed, rng=rng))
+
+    def sample(
+        self,
+        k: int,
+        weights: str | callable | object = None,
+        seed: int | str | bytes = None,
+        rng: random.Random = None,
+    ) -> fluenttuple[object]:
+        """Supports returning a new tuple holding a random sample of k of the items of
+        the tuple, drawn without replacement, optionally weighted by the weights."""
+
+        return fluenttuple(
+            sampling.sample(self, k, weights=weights, seed=seed, rng=rng)
+        )
 
     def slice(self, start: int, stop: int = None, step: int = 1) -> fluenttuple[object]:
         """Supports returning a new tuple containing the sliced part of the tuple."""
@@ -102,7 +144,7 @@ class fluenttuple(tuple):
         if not isinstance(step, int):
             raise TypeError("The 'step' argument must have an integer value!")
 
-        return fluenttuple(fluentlist(self).slice(start, stop, step))
+        return fluenttuple(self[builtins.slice(start, stop, step)])
 
     def take(self, index: int) -> fluentlist[object]:
         """Supports returning a new list containing the items from the start of the
@@ -111,7 +153,7 @@ class fluenttuple(tuple):
         if not isinstance(index, int):
             raise TypeError("The 'index' argument must have an integer value!")
 
-        return fluenttuple(fluentlist(self).slice(start=0, stop=index))
+        return self.slice(start=0, stop=index)
 
     def drop(self, index: int) -> fluentlist[object]:
         """Supports returning a new list containing the items from the specified
@@ -120,7 +162,155 @@ class fluenttuple(tuple):
         if not isinstance(index, int):
             raise TypeError("The 'index' argument must have an integer value!")
 
-        return fluenttuple(fluentlist(self).slice(start=index))
+        return self.slice(start=index)
+
+    def view(self, start: int = None, stop: int = None, step: int = None) -> fluentview:
+        """Supports returning a read-only view onto the tuple, or the sliced part of it,
+        without copying any of its items; see the `fluentview` class for details."""
+
+        from fluently.view import fluentview
+
+        return fluentview(self, start, stop, step, factory=fluenttuple)
+
+    def save(
+        self, path: str, compress: str = None, chunksize: int = None
+    ) -> fluenttuple[object]:
+        """Supports saving the tuple's items to the specified file, in the format read by
+        the `mmap()` method; see the `fluently.mapped.save()` function for details. If a
+        compression codec, 'zlib', 'bz2' or 'lzma', or a chunk size is specified, the items
+        are instead saved as a chunked binary snapshot, which can be read via `load()`,
+        but not mapped; see the `fluently.snapshot.save()` function for details."""
+
+        if compress is None and chunksize is None:
+            from fluently.mapped import save
+
+            save(self, path)
+        else:
+            snapshot.save(self, path, compress=compress, chunksize=chunksize)
+
+        return self
+
+    @classmethod
+    def load(
+        cls, path: str, start: int = 0, stop: int = None, lazy: bool = False
+    ) -> fluenttuple[object]:
+        """Supports creating a new tuple holding the items of a file saved via `save()`,
+        either a mapped tuple file or a snapshot, optionally only those from the start
+        index until the stop index, where the chunks of a snapshot before the start are
+        skipped. If `lazy` is set to `True` then an iterator is returned instead, which
+        reads the items, or decodes each chunk of a snapshot, as they are needed."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        if start == 0 and stop is None and lazy is False:
+            return cls(snapshot.load(path))
+
+        items = snapshot.stream(path, start=start, stop=stop)
+
+        return items if lazy is True else cls(items)
+
+    @classmethod
+    def mmap(cls, path: str) -> fluentmapped:
+        """Supports memory-mapping a file saved via the `save()` method, returning a
+        read-only `fluentmapped` sequence whose items are read from the mapping as they
+        are accessed, rather than reading all of the items into memory."""
+
+        from fluently.mapped import fluentmapped
+
+        return fluentmapped(path)
+
+    def share(self, name: str = None) -> fluentshared:
+        """Supports copying the tuple's items into a new block of shared memory, returning
+        a read-only `fluentshared` sequence, which owns the block, and can be passed to
+        worker processes without copying the items; see `fluentshared` for details."""
+
+        from fluently.shared import fluentshared
+
+        return fluentshared.create(self, name=name)
+
+    def chunk(self, size: int):
+        """Supports returning an iterator which yields the items of the tuple in batches
+        of the specified size, each as a new tuple, where the last batch may be smaller;
+        each batch is only created as it is needed, and is read directly from a single
+        pass over the items, so batching a large tuple only copies each item once."""
+
+        if not isinstance(size, int):
+            raise TypeError("The 'size' argument must have an integer value!")
+        elif not size >= 1:
+            raise ValueError(
+                "The 'size' argument must have an integer value of 1 or more!"
+            )
+
+        iterator = iter(self)
+
+        return (fluenttuple(islice(iterator, size)) for _ in range(0, len(self), size))
+
+    def window(self, size: int, step: int = 1):
+        """Supports returning an iterator which yields sliding windows of the specified
+        size over the items of the tuple, each as a new tuple, where each window starts
+        the specified step number of items after the previous window; only complete
+        windows are yielded, so a tuple shorter than the window yields no windows; where
+        the windows do not overlap, they are read from a single pass over the items."""
+
+        if not isinstance(size, int):
+            raise TypeError("The 'size' argument must have an integer value!")
+        elif not size >= 1:
+            raise ValueError(
+                "The 'size' argument must have an integer value of 1 or more!"
+            )
+
+        if not isinstance(step, int):
+            raise TypeError("The 'step' argument must have an integer value!")
+        elif not step >= 1:
+            raise ValueError(
+                "The 'step' argument must have an integer value of 1 or more!"
+            )
+
+        if step >= size:
+            iterator = iter(self)
+
+            # Skip the items between windows, other than before the first window
+            return (
+                fluenttuple(
+                    islice(iterator, step - size, step)
+                    if index
+                    else islice(iterator, size)
+                )
+                for index in range(0, len(self) - size + 1, step)
+            )
+
+        return (
+            fluenttuple(self[index : index + size])
+            for index in range(0, len(self) - size + 1, step)
+        )
+
+    def partition(
+        self, predicate: callable
+    ) -> tuple[fluenttuple[object], fluenttuple[object]]:
+        """Supports splitting the tuple into two new tuples in a single pass, the first
+        holding the items for which the predicate returns True, and the second holding
+        the remaining items, with the items of each retaining their original order."""
+
+        if not callable(predicate):
+            raise TypeError("The 'predicate' argument must reference a callable!")
+
+        matches: list = []
+        others: list = []
+
+        for item in self:
+            (matches if predicate(item) else others).append(item)
+
+        return (fluenttuple(matches), fluenttuple(others))
+
+    def split_at(self, index: int) -> tuple[fluenttuple[object], fluenttuple[object]]:
+        """Supports splitting the tuple at the specified index into two new tuples, the
+        first holding the items before the index, and the second the remaining items."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return (fluenttuple(self[:index]), fluenttuple(self[index:]))
 
     def swap(self, source: int, target: int) -> fluentlist[object]:
         """Supports swapping the list items at the source and target indices."""
@@ -167,6 +357,34 @@ class fluenttuple(tuple):
 
         return found
 
+    def counts(self) -> fluentbag[object]:
+        """Supports returning a bag holding a count of how many times each distinct
+        value occurs in the tuple, computed in a single pass over the tuple."""
+
+        from fluently.bag import fluentbag
+
+        return fluentbag(self)
+
+    def stats(
+        self,
+        key: str | callable = None,
+        bins: int | list[float] = None,
+        bounds: tuple[float, float] = None,
+    ) -> dict[str, object]:
+        """Supports computing the count, sum, min, max, mean, variance and standard
+        deviation, and optionally a histogram, of the tuple's numeric values in a single
+        pass; see the `fluently.stats.stats()` function for details of the arguments."""
+
+        return stats(self, key=key, bins=bins, bounds=bounds)
+
+    def numeric(self, typecode: str = None, backend: str = None) -> fluentnumeric:
+        """Supports returning the tuple's values as a `fluentnumeric` sequence, whose
+        operations are vectorised via NumPy if the optional dependency is installed."""
+
+        from fluently.numeric import fluentnumeric
+
+        return fluentnumeric(self, typecode=typecode, backend=backend)
+
     def contains(self, value: object) -> bool:
         """Supports returning if the tuple contains the specified value or not."""
 
@@ -205,11 +423,51 @@ class fluenttuple(tuple):
 
         return fluenttuple(fluentlist(self).sort(*args, **kwargs))
 
-    def sorted(self, *args, **kwargs) -> fluenttuple[object]:
+    def sorted(self, *args, lazy: bool = False, **kwargs) -> fluenttuple[object]:
         """The sorted method provides a fluent interface for sorting the current tuple,
-        returning a new tuple with the items ordered according to the specified sort."""
+        returning a new tuple with the items ordered according to the specified sort, or
+        if `lazy` is set to `True`, an iterator which yields the sorted items."""
 
-        return fluenttuple(fluentlist(self).sorted(*args, **kwargs))
+        items = fluentlist(self).sorted(*args, lazy=lazy, **kwargs)
+
+        return items if lazy is True else fluenttuple(items)
+
+    def top(
+        self, k: int, key: callable = None, reverse: bool = False
+    ) -> fluenttuple[object]:
+        """Supports returning a new tuple of the tuple's first k items in sorted order."""
+
+        if not isinstance(k, int):
+            raise TypeError("The 'k' argument must have an integer value!")
+        elif not k >= 0:
+            raise ValueError(
+                "The 'k' argument must have an integer value of 0 or more!"
+            )
+
+        if key is None:
+            pass
+        elif not callable(key):
+            raise TypeError(
+                "The 'key' argument, if specified, must reference a callable!"
+            )
+
+        if not isinstance(reverse, bool):
+            raise TypeError("The 'reverse' argument must have a boolean value!")
+
+        if reverse is True:
+            return fluenttuple(heapq.nlargest(k, self, key=key))
+        else:
+            return fluenttuple(heapq.nsmallest(k, self, key=key))
+
+    def nsmallest(self, k: int, key: callable = None) -> fluenttuple[object]:
+        """Supports returning a new tuple of the k smallest items of the tuple."""
+
+        return self.top(k, key=key)
+
+    def nlargest(self, k: int, key: callable = None) -> fluenttuple[object]:
+        """Supports returning a new tuple of the k largest items of the tuple."""
+
+        return self.top(k, key=key, reverse=True)
 
     def filter(
         self, predicate: callable = None, **filters: dict[str, object]
@@ -228,6 +486,43 @@ class fluenttuple(tuple):
         else:
             return fluenttuple(filter(self, **filters))
 
+    def group_by(self, key: str | callable) -> fluentgroups[object, fluenttuple]:
+        """Supports grouping the items in the tuple by the value of the specified attribute
+        or by the value returned by the specified callable, returning a mapping of each
+        group's key to a new tuple of the group's items, in their original order."""
+
+        return fluentgroups(self, key=key, factory=fluenttuple)
+
+    def join(
+        self,
+        other: object,
+        on: str | callable = None,
+        left_key: str | callable = None,
+        right_key: str | callable = None,
+        how: str = "inner",
+        merge: callable = None,
+        presorted: bool = False,
+        lazy: bool = False,
+    ) -> fluenttuple[tuple[object, object]]:
+        """Supports joining the items of the tuple with those of the other iterable where
+        their keys are equal, returning a new tuple of (left, right) pairs."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        pairs = join(
+            self,
+            other,
+            on=on,
+            left_key=left_key,
+            right_key=right_key,
+            how=how,
+            merge=merge,
+            presorted=presorted,
+        )
+
+        return pairs if lazy is True else fluenttuple(pairs)
+
     def first(
         self, predicate: callable = None, **filters: dict[str, object]
     ) -> object | None:
@@ -1,3 +1,9 @@
+from __future__ import annotations
+
+import functools
+import operator
+
+
 def filter(container: list, **filters: dict[str, object]) -> list:
     """The filter method provides support for filtering lists based on matching the
     specified properties of their items."""
@@ -19,3 +25,111 @@ def filter(container: list, **filters: dict[str, object]) -> list:
             matches.append(item)
 
     return matches
+
+
+def accessor(key: str | callable) -> callable:
+    """The accessor method provides support for obtaining a callable that returns the
+    value of the specified attribute from an item, or which returns the result of the
+    specified callable for the item; missing attributes are returned as None."""
+
+    if callable(key):
+        return key
+    elif isinstance(key, str):
+        return lambda item: getattr(item, key, None)
+    else:
+        raise TypeError(
+            "The 'key' argument must have a string value or reference a callable!"
+        )
+
+
+class descending(object):
+    """The descending class wraps a sort key value, inverting its ordering, so that keys
+    sorted in different directions can be combined into a single sort key tuple."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object):
+        self.value = value
+
+    def __lt__(self, other: descending) -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: descending) -> bool:
+        return self.value == other.value
+
+
+@functools.lru_cache(maxsize=256)
+def _sortkey(by: tuple[str], nones: str, reverse: bool) -> tuple[callable, bool]:
+    """Compiles and caches the sort key function for the specified sort specification."""
+
+    fields: list[tuple[callable, bool]] = []
+
+    for name in by:
+        if not (isinstance(name, str) and len(name.lstrip("-")) > 0):
+            raise TypeError(
+                "The 'by' argument must reference one or more attribute names!"
+            )
+
+        fields.append((operator.attrgetter(name.lstrip("-")), name.startswith("-")))
+
+    directions: list[bool] = [(order is not reverse) for (_, order) in fields]
+
+    # When every field is sorted in the same direction, the sort itself can be reversed
+    # which avoids the overhead of wrapping key values to invert their ordering
+    if all(directions):
+        reverse = True
+    elif not any(directions):
+        reverse = False
+    else:
+        reverse = None
+
+    components: list[tuple[callable, bool, bool]] = []
+
+    for (getter, order), direction in zip(fields, directions):
+        # For each field, None values are placed first or last as specified, regardless
+        # of the direction the field is sorted in, by pairing them with a marker value
+        last: bool = (nones == "last") is not direction
+
+        components.append((getter, last, (reverse is None) and direction))
+
+    def key(item: object) -> tuple:
+        values: list = []
+
+        for getter, last, wrap in components:
+            value = getter(item)
+
+            if wrap is True:
+                values.append(descending(((value is None) is last, value)))
+            else:
+                values.append((value is None) is last)
+                values.append(value)
+
+        return tuple(values)
+
+    return (key, reverse is True)
+
+
+def sortkey(
+    by: str | list[str], nones: str = "last", reverse: bool = False
+) -> tuple[callable, bool]:
+    """The sortkey method provides support for sorting items by one or more attributes,
+    named in the order of precedence, where names prefixed with '-' are sorted in
+    descending order. It returns a key callable, which computes a key tuple once per
+    item using cached attribute getters, and the reverse flag to pass to the sort, so
+    that mixed ascending and descending orders are sorted in a single pass. Attributes
+    with None values are placed either "first" or "last" as specified by `nones`."""
+
+    if isinstance(by, str):
+        by = (by,)
+    elif isinstance(by, (list, tuple)) and len(by) > 0:
+        by = tuple(by)
+    else:
+        raise TypeError("The 'by' argument must reference one or more attribute names!")
+
+    if not nones in ("first", "last"):
+        raise ValueError("The 'nones' argument must have a value of 'first' or 'last'!")
+
+    if not isinstance(reverse, bool):
+        raise TypeError("The 'reverse' argument must have a boolean value!")
+
+    return _sortkey(by, nones, reverse)
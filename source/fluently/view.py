@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+from fluently.logging import logger
+from fluently.list import fluentlist
+from fluently.stats import stats
+from fluently.utilities import filter
+from collections.abc import Sequence
+from functools import reduce
+
+import builtins
+
+logger = logger.getChild(__name__)
+
+
+class fluentview(Sequence):
+    """A read-only, zero-copy view onto a range of the items of a fluent list or tuple,
+    as returned by their `view()` methods. A view holds a reference to its source along
+    with the start, stop and step of its range, so creating, slicing or reversing a view
+    does not copy any items; the view's items are obtained from the source as needed.
+
+    The read-only fluent methods are supported directly by the view, returning further
+    views where the result is a contiguous range of the source; the items are only
+    copied into a new container via `collect()`, or when a method that would modify the
+    items, such as `append()`, is called, in which case the method is called upon a
+    newly collected container, leaving the source unmodified. As the view refers to its
+    source, changes made to the source are reflected by the view."""
+
+    __slots__ = ("_source", "_range", "_factory")
+
+    def __init__(
+        self,
+        source: Sequence,
+        start: int = None,
+        stop: int = None,
+        step: int = None,
+        factory: type = None,
+    ):
+        if isinstance(source, fluentview):
+            self._source: Sequence = source._source
+            self._range: range = source._range[builtins.slice(start, stop, step)]
+            self._factory: type = factory or source._factory
+        elif isinstance(source, Sequence):
+            self._source: Sequence = source
+            self._range: range = range(len(source))[builtins.slice(start, stop, step)]
+            self._factory: type = factory or fluentlist
+        else:
+            raise TypeError("The 'source' argument must reference a sequence!")
+
+    def _derive(self, indices: range) -> fluentview:
+        """Creates a new view onto the same source over the specified range of indices."""
+
+        view = fluentview.__new__(fluentview)
+
+        view._source = self._source
+        view._range = indices
+        view._factory = self._factory
+
+        return view
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __iter__(self):
+        return builtins.map(self._source.__getitem__, self._range)
+
+    def __reversed__(self):
+        return builtins.map(self._source.__getitem__, reversed(self._range))
+
+    def __getitem__(self, index: int | builtins.slice) -> object:
+        if isinstance(index, builtins.slice):
+            return self._derive(self._range[index])
+
+        return self._source[self._range[index]]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                a == b for (a, b) in zip(self, other)
+            )
+
+        return NotImplemented
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """Supports pickling the view as a view over a collected copy of only its own
+        items, rather than pickling the whole of its source."""
+
+        return (self.__class__, (self.collect(), None, None, None, self._factory))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __getattr__(self, name: str) -> object:
+        """Supports calling the methods of the view's container type which are not
+        provided by the view itself, such as those which modify the items, by first
+        collecting the view's items into a new container of that type; the items are only
+        collected if the container type provides the named attribute."""
+
+        # The factory may be a partial, such as for arrays, so check its underlying type
+        container: type = getattr(self._factory, "func", self._factory)
+
+        if name.startswith("_") or not hasattr(container, name):
+            raise AttributeError(
+                f"The '{self.__class__.__name__}' has no '{name}' attribute!"
+            )
+
+        return getattr(self.collect(), name)
+
+    def collect(self) -> fluentlist[object]:
+        """Supports collecting the items of the view into a new container of the type
+        of the view's source, such as a new fluentlist or fluenttuple."""
+
+        return self._factory(self)
+
+    def length(self) -> int:
+        """Supports returning the count of the total number of items in the view."""
+
+        return len(self._range)
+
+    def view(self) -> fluentview[object]:
+        """Supports returning the view itself, as it is already a view."""
+
+        return self
+
+    def slice(self, start: int, stop: int = None, step: int = 1) -> fluentview[object]:
+        """Supports returning a new view onto the sliced part of the view."""
+
+        if not isinstance(start, int):
+            raise TypeError("The 'start' argument must have an integer value!")
+
+        if stop is None:
+            pass
+        elif not isinstance(stop, int):
+            raise TypeError("The 'stop' argument must have an integer value!")
+
+        if not isinstance(step, int):
+            raise TypeError("The 'step' argument must have an integer value!")
+
+        return self._derive(self._range[builtins.slice(start, stop, step)])
+
+    def take(self, index: int) -> fluentview[object]:
+        """Supports returning a new view onto the items from the start of the view until
+        the index specified."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return self.slice(start=0, stop=index)
+
+    def drop(self, index: int) -> fluentview[object]:
+        """Supports returning a new view onto the items from the specified index until
+        the end of the view."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        return self.slice(start=index)
+
+    def reverse(self) -> fluentview[object]:
+        """Supports returning a new view onto the items of the view in reverse order."""
+
+        return self._derive(self._range[::-1])
+
+    def chunk(self, size: int):
+        """Supports returning an iterator which yields views onto consecutive batches of
+        the specified size, where the last batch may be smaller."""
+
+        if not isinstance(size, int):
+            raise TypeError("The 'size' argument must have an integer value!")
+        elif not size >= 1:
+            raise ValueError(
+                "The 'size' argument must have an integer value of 1 or more!"
+            )
+
+        return (
+            self._derive(self._range[index : index + size])
+            for index in range(0, len(self), size)
+        )
+
+    def window(self, size: int, step: int = 1):
+        """Supports returning an iterator which yields views onto sliding windows of the
+        specified size, each starting the given step number of items after the last."""
+
+        if not isinstance(size, int):
+            raise TypeError("The 'size' argument must have an integer value!")
+        elif not size >= 1:
+            raise ValueError(
+                "The 'size' argument must have an integer value of 1 or more!"
+            )
+
+        if not isinstance(step, int):
+            raise TypeError("The 'step' argument must have an integer value!")
+        elif not step >= 1:
+            raise ValueError(
+                "The 'step' argument must have an integer value of 1 or more!"
+            )
+
+        return (
+            self._derive(self._range[index : index + size])
+            for index in range(0, len(self) - size + 1, step)
+        )
+
+    def count(self, value: object) -> int:
+        """Supports returning a count of how many items in the view have the value."""
+
+        found: int = 0
+
+        for item in self:
+            if item == value:
+                found += 1
+
+        return found
+
+    def contains(self, value: object) -> bool:
+        """Supports returning if the view contains the specified value or not."""
+
+        return value in self
+
+    def any(self, value: object) -> bool:
+        """Supports returning if the view contains the specified value at least once."""
+
+        return value in self
+
+    def all(self, value: object) -> bool:
+        """Supports returning if the view is completely filled with the specified value."""
+
+        return self.count(value) == self.length()
+
+    def stats(
+        self,
+        key: str | callable = None,
+        bins: int | list[float] = None,
+        bounds: tuple[float, float] = None,
+    ) -> dict[str, object]:
+        """Supports computing the count, sum, min, max, mean, variance and standard
+        deviation, and optionally a histogram, of the view's numeric values in a single
+        pass; see the `fluently.stats.stats()` function for details of the arguments."""
+
+        return stats(self, key=key, bins=bins, bounds=bounds)
+
+    def map(self, function: callable) -> fluentlist[object]:
+        """Supports running a callback on each item in the view returning a new container
+        of the type of the view's source holding the results."""
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        return self._factory(builtins.map(function, self))
+
+    def reduce(self, function: callable, initialiser=None) -> object:
+        """Supports running a callback on each item in the view returning the reduced value."""
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        if initialiser is None:
+            return reduce(function, self)
+        else:
+            return reduce(function, self, initialiser)
+
+    def unique(self) -> fluentlist[object]:
+        """Supports returning a new container of the unique items of the view."""
+
+        return self._factory(dict.fromkeys(self))
+
+    def sorted(self, *args, **kwargs) -> fluentlist[object]:
+        """Supports returning a new container holding the sorted items of the view; the
+        sort arguments are as per those of the `fluentlist.sorted()` method."""
+
+        return self._factory(fluentlist(self).sort(*args, **kwargs))
+
+    def filter(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> fluentlist[object]:
+        """Provides a fluent interface for filtering the items of the view into a new
+        container of the type of the view's source."""
+
+        if predicate is None:
+            pass
+        elif not callable(predicate):
+            raise TypeError(
+                "The 'predicate' argument, if specified, must reference a callable!"
+            )
+
+        if predicate:
+            return self._factory(builtins.filter(predicate, self))
+        else:
+            return self._factory(filter(self, **filters))
+
+    def first(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> object | None:
+        """Supports returning the first item or None if the view is empty."""
+
+        if predicate is not None or len(filters) > 0:
+            items = self.filter(predicate=predicate, **filters)
+        else:
+            items = self
+
+        return items[0] if (len(items) >= 1) else None
+
+    def last(
+        self, predicate: callable = None, **filters: dict[str, object]
+    ) -> object | None:
+        """Supports returning the last item or None if the view is empty."""
+
+        if predicate is not None or len(filters) > 0:
+            items = self.filter(predicate=predicate, **filters)
+        else:
+            items = self
+
+        return items[-1] if (len(items) >= 1) else None
+
+
+# Shorthand aliases
+fview = fluview = fluentview
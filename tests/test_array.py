@@ -0,0 +1,212 @@
+from fluently import fluentarray, fluarray, farray, fluentlist, fluentview
+from array import array
+
+import copy
+import pickle
+import pytest
+
+
+@pytest.fixture(name="numbers", scope="function")
+def fixture_numbers() -> fluentarray:
+    numbers = fluentarray("d", [3.0, 1.0, 2.0])
+
+    assert isinstance(numbers, fluentarray)
+    assert isinstance(numbers, array)
+
+    assert len(numbers) == 3
+
+    return numbers
+
+
+def test_fluent_array_alias():
+    """Test the 'fluarray' and 'farray' aliases for the 'fluentarray' class."""
+
+    assert fluentarray is fluarray
+    assert fluentarray is farray
+
+
+def test_fluent_array_initialisation():
+    """Test the creation of arrays of the supported typecodes."""
+
+    assert fluentarray().typecode == "d"
+    assert fluentarray().length() == 0
+
+    assert fluentarray("i", range(3)).tolist() == [0, 1, 2]
+    assert fluentarray("f", [1.5]).tolist() == [1.5]
+
+    with pytest.raises(ValueError):
+        fluentarray("u", "abc")
+
+    with pytest.raises(TypeError):
+        fluentarray(1)
+
+    # Ensure that values which do not fit the typecode are rejected, as per 'array'
+    with pytest.raises(TypeError):
+        fluentarray("i", [1.5])
+
+
+def test_fluent_array_mutation(numbers: fluentarray):
+    """Test the chainable methods of the 'fluentarray' class that modify the array."""
+
+    assert numbers.append(4.0) is numbers
+    assert numbers.prepend(0.0).extend([5.0, 6.0]).insert(1, 0.5) is numbers
+    assert numbers.tolist() == [0.0, 0.5, 3.0, 1.0, 2.0, 4.0, 5.0, 6.0]
+
+    assert numbers.remove(0.5).discard(9.0).tolist() == [
+        0.0,
+        3.0,
+        1.0,
+        2.0,
+        4.0,
+        5.0,
+        6.0,
+    ]
+
+    with pytest.raises(ValueError):
+        numbers.remove(9.0)
+
+    assert numbers.remove(9.0, raises=False) is numbers
+
+    assert numbers.reverse().take(2).tolist() == [6.0, 5.0]
+    assert numbers.sort().tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert numbers.sort(reverse=True).first() == 6.0
+
+    assert fluentarray("i", [1, 2]).repeat(3).tolist() == [1, 2, 1, 2, 1, 2]
+
+    assert numbers.clear().length() == 0
+
+
+def test_fluent_array_copies(numbers: fluentarray):
+    """Test the methods of the 'fluentarray' class that return new arrays."""
+
+    for result in [
+        numbers.clone(),
+        numbers.slice(0, 2),
+        numbers.take(1),
+        numbers.drop(1),
+        numbers.sorted(),
+        numbers.unique(),
+        numbers.filter(lambda number: number > 1),
+        numbers.map(lambda number: number * 2),
+        numbers + [4.0],
+        numbers * 2,
+        numbers - 1.0,
+        copy.copy(numbers),
+        copy.deepcopy(numbers),
+        pickle.loads(pickle.dumps(numbers)),
+    ]:
+        assert isinstance(result, fluentarray)
+        assert not result is numbers
+        assert result.typecode == "d"
+
+    assert numbers.slice(0, 3, 2).tolist() == [3.0, 2.0]
+    assert numbers.drop(1).tolist() == [1.0, 2.0]
+    assert numbers.sorted().tolist() == [1.0, 2.0, 3.0]
+    assert numbers.sorted(key=lambda number: -number).tolist() == [3.0, 2.0, 1.0]
+    assert fluentarray("i", [1, 2, 1, 3, 2]).unique().tolist() == [1, 2, 3]
+    assert numbers.filter(lambda number: number > 1).tolist() == [3.0, 2.0]
+    assert (numbers - 1.0).tolist() == [3.0, 2.0]
+    assert pickle.loads(pickle.dumps(numbers)) == numbers
+
+    # Ensure that the map method can produce values of another typecode
+    assert fluentarray("i", [1, 2]).map(lambda number: number / 2, "d").tolist() == [
+        0.5,
+        1.0,
+    ]
+
+    # Ensure that the original array remains unmodified
+    assert numbers.tolist() == [3.0, 1.0, 2.0]
+
+
+def test_fluent_array_in_place_operators(numbers: fluentarray):
+    """Test the in-place operator overloads of the 'fluentarray' class."""
+
+    original = numbers
+
+    numbers += [4.0]
+    numbers *= 2
+    numbers -= 3.0
+
+    assert numbers is original
+    assert numbers.tolist() == [1.0, 2.0, 4.0, 3.0, 1.0, 2.0, 4.0]
+
+
+def test_fluent_array_read_only_methods(numbers: fluentarray):
+    """Test the read-only methods of the 'fluentarray' class."""
+
+    assert numbers.count(1.0) == 1
+    assert numbers.contains(2.0) is True
+    assert numbers.any(9.0) is False
+    assert fluentarray("i", [7, 7]).all(7) is True
+    assert numbers.reduce(lambda a, b: a + b) == 6.0
+    assert numbers.reduce(lambda a, b: a + b, 10.0) == 16.0
+    assert numbers.first() == 3.0
+    assert numbers.last() == 2.0
+    assert numbers.first(lambda number: number < 3) == 1.0
+    assert fluentarray().first() is None
+
+    tolist = numbers.tolist()
+
+    assert isinstance(tolist, fluentlist)
+    assert tolist == [3.0, 1.0, 2.0]
+
+    results = numbers.stats()
+
+    assert results["sum"] == 6.0
+    assert results["mean"] == 2.0
+    assert results["variance"] == 1.0
+
+
+def test_fluent_array_buffer_protocol(numbers: fluentarray):
+    """Test that the array's memory can be shared without copying via the buffer protocol."""
+
+    memory = memoryview(numbers)
+
+    assert memory.format == "d"
+    assert memory.itemsize == 8
+    assert memory.tolist() == [3.0, 1.0, 2.0]
+
+    # Ensure that the memoryview shares the array's memory rather than a copy of it
+    memory[0] = 9.0
+
+    assert numbers[0] == 9.0
+
+    memory.release()
+
+
+def test_fluent_array_view(numbers: fluentarray):
+    """Test creating zero-copy views onto the 'fluentarray' class."""
+
+    view = numbers.view(1)
+
+    assert isinstance(view, fluentview)
+    assert view == [1.0, 2.0]
+
+    collected = view.collect()
+
+    assert isinstance(collected, fluentarray)
+    assert collected.typecode == "d"
+    assert collected.tolist() == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_fluent_array_pickling(numbers: fluentarray, protocol: int):
+    """Test pickling arrays via each protocol, including out-of-band buffers."""
+
+    result = pickle.loads(pickle.dumps(numbers, protocol=protocol))
+
+    assert isinstance(result, fluentarray)
+    assert result.typecode == "d"
+    assert result == numbers
+
+    if protocol >= 5:
+        buffers: list[pickle.PickleBuffer] = []
+
+        data = pickle.dumps(numbers, protocol=protocol, buffer_callback=buffers.append)
+
+        # The values are transferred out-of-band, so are not held within the pickle
+        assert len(buffers) == 1
+        assert buffers[0].raw().nbytes == 3 * 8
+        assert len(data) < 3 * 8 + 64
+
+        assert pickle.loads(data, buffers=buffers) == numbers
@@ -0,0 +1,157 @@
+from fluently import fluentbag, flubag, fbag, fluentlist, fluenttuple
+from collections import Counter
+
+import pytest
+
+
+@pytest.fixture(name="events", scope="function")
+def fixture_events() -> fluentbag[str]:
+    events = fluentbag(["click", "view", "click", "scroll", "click", "view"])
+
+    assert isinstance(events, fluentbag)
+    assert isinstance(events, Counter)
+
+    assert len(events) == 3
+
+    return events
+
+
+def test_fluent_bag_alias():
+    """Test the 'flubag' and 'fbag' aliases for the 'fluentbag' class have the same identity."""
+
+    assert fluentbag is flubag
+    assert fluentbag is fbag
+
+
+def test_fluent_bag_length(events: fluentbag[str]):
+    """Test the 'length' method of the 'fluentbag' class."""
+
+    assert events.length() == 3
+    assert events.total() == 6
+
+
+def test_fluent_bag_clone(events: fluentbag[str]):
+    """Test the 'clone' method of the 'fluentbag' class."""
+
+    cloned = events.clone()
+
+    assert isinstance(cloned, fluentbag)
+    assert not cloned is events
+    assert cloned == events
+
+
+def test_fluent_bag_add(events: fluentbag[str]):
+    """Test the 'add' method of the 'fluentbag' class."""
+
+    # Ensure that the .add() method returns a reference to the bag for chaining
+    assert events.add("submit") is events
+
+    assert events.count("submit") == 1
+
+    assert events.add("submit", count=3).count("submit") == 4
+
+    with pytest.raises(TypeError):
+        events.add("submit", count="1")
+
+    with pytest.raises(ValueError):
+        events.add("submit", count=0)
+
+
+def test_fluent_bag_remove(events: fluentbag[str]):
+    """Test the 'remove' method of the 'fluentbag' class."""
+
+    # Ensure that the .remove() method returns a reference to the bag for chaining
+    assert events.remove("click") is events
+
+    assert events.count("click") == 2
+
+    # Ensure that removing more occurrences than are present removes the item entirely
+    assert events.remove("click", count=5).contains("click") is False
+
+    with pytest.raises(KeyError):
+        events.remove("click")
+
+    assert events.remove("click", raises=False) is events
+
+
+def test_fluent_bag_discard_clear(events: fluentbag[str]):
+    """Test the 'discard' and 'clear' methods of the 'fluentbag' class."""
+
+    assert events.discard("click") is events
+    assert events.contains("click") is False
+
+    assert events.discard("missing") is events
+
+    assert events.clear() is events
+    assert events.length() == 0
+
+
+def test_fluent_bag_count(events: fluentbag[str]):
+    """Test the 'count' and 'contains' methods of the 'fluentbag' class."""
+
+    assert events.count("click") == 3
+    assert events.count("view") == 2
+    assert events.count("missing") == 0
+
+    assert events.contains("scroll") is True
+    assert events.contains("missing") is False
+
+    # Ensure that counting a missing item does not add it to the bag
+    assert events.length() == 3
+
+
+def test_fluent_bag_most_common(events: fluentbag[str]):
+    """Test the 'most_common' method of the 'fluentbag' class."""
+
+    common = events.most_common(2)
+
+    assert isinstance(common, fluentlist)
+
+    assert common == [("click", 3), ("view", 2)]
+
+    assert events.most_common().length() == 3
+
+
+def test_fluent_bag_union_intersect():
+    """Test the 'union' and 'intersect' methods of the 'fluentbag' class."""
+
+    a = fluentbag(["x", "x", "y"])
+    b = fluentbag(["x", "y", "y", "z"])
+
+    union = a.union(b)
+
+    assert isinstance(union, fluentbag)
+    assert union == {"x": 2, "y": 2, "z": 1}
+
+    intersection = a.intersect(b)
+
+    assert isinstance(intersection, fluentbag)
+    assert intersection == {"x": 1, "y": 1}
+
+    # Ensure that the original bags remain unmodified
+    assert a == {"x": 2, "y": 1}
+    assert b == {"x": 1, "y": 2, "z": 1}
+
+
+def test_fluent_bag_tolist(events: fluentbag[str]):
+    """Test the 'tolist' method of the 'fluentbag' class."""
+
+    items = events.tolist()
+
+    assert isinstance(items, fluentlist)
+
+    assert items == ["click", "click", "click", "view", "view", "scroll"]
+
+
+def test_fluent_list_and_tuple_counts():
+    """Test the 'counts' method of the 'fluentlist' and 'fluenttuple' classes."""
+
+    counts = fluentlist(["a", "b", "a"]).counts()
+
+    assert isinstance(counts, fluentbag)
+    assert counts == {"a": 2, "b": 1}
+
+    counts = fluenttuple(["a", "b", "a"]).counts()
+
+    assert isinstance(counts, fluentbag)
+    assert counts == {"a": 2, "b": 1}
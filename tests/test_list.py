@@ -1,7 +1,9 @@
-from fluently import fluentlist, flulist, flist
+from fluently import fluentlist, flulist, flist, fluentgroups
 from conftest import Thing
 
 import pytest
+import pickle
+import random
 
 
 @pytest.fixture(name="numbers", scope="module")
@@ -334,6 +336,31 @@ def test_fluent_list_shuffle(numbers: fluentlist[int]):
         assert item in newnumbers
 
 
+def test_fluent_list_shuffle_seeded():
+    """Test the 'seed' and 'rng' arguments of the 'shuffle' method of 'fluentlist'."""
+
+    numbers = fluentlist(range(100))
+
+    # Ensure that shuffling with the same seed reproduces the same order
+    shuffled = numbers.clone().shuffle(seed=7)
+
+    assert shuffled == numbers.clone().shuffle(seed=7)
+    assert shuffled != numbers.clone().shuffle(seed=8)
+    assert sorted(shuffled) == numbers
+
+    # Ensure that a generator may be provided, and is advanced by each shuffle
+    rng = random.Random(7)
+
+    assert numbers.clone().shuffle(rng=rng) == shuffled
+    assert numbers.clone().shuffle(rng=rng) != shuffled
+
+    with pytest.raises(ValueError):
+        numbers.shuffle(seed=7, rng=rng)
+
+    with pytest.raises(TypeError):
+        numbers.shuffle(rng=7)
+
+
 def test_fluent_list_unique(numbers: fluentlist[int]):
     """Test the 'unique' method of the 'fluentlist' class."""
 
@@ -1136,3 +1163,605 @@ def test_fluent_list_inline_add(numbers: fluentlist[int]):
 
     # Ensure that the subtracted list has the expected items in the expected order
     assert clonednumbers == [1, 3]
+
+
+def test_fluent_list_group_by():
+    """Test the 'group_by' method of the 'fluentlist' class."""
+
+    things = fluentlist(
+        [
+            Thing(kind="a", value=1),
+            Thing(kind="b", value=2),
+            Thing(kind="a", value=3),
+        ]
+    )
+
+    groups = things.group_by("kind")
+
+    assert isinstance(groups, fluentgroups)
+
+    # Ensure that the groups are keyed in the order in which the keys were first seen
+    assert list(groups) == ["a", "b"]
+    assert groups.length() == 2
+
+    # Ensure that each group is a new list holding the items in their original order
+    assert isinstance(groups["a"], fluentlist)
+    assert groups["a"] == [things[0], things[2]]
+    assert groups["b"] == [things[1]]
+
+    # Ensure that a callable can be used to compute the group key
+    groups = things.group_by(lambda thing: thing.value % 2)
+
+    assert groups[1].map(lambda thing: thing.value) == [1, 3]
+    assert groups[0].map(lambda thing: thing.value) == [2]
+
+    with pytest.raises(TypeError):
+        things.group_by(1)
+
+
+def test_fluent_list_group_by_agg():
+    """Test the 'agg' method of the grouping returned by the 'fluentlist' class."""
+
+    things = fluentlist(
+        [
+            Thing(kind="a", value=1),
+            Thing(kind="b", value=2),
+            Thing(kind="a", value=3),
+            Thing(kind="a", value=None),
+        ]
+    )
+
+    results = things.group_by("kind").agg(
+        count=True, sum="value", min="value", max="value", mean="value"
+    )
+
+    assert results == {
+        "a": {"count": 3, "sum": 4, "min": 1, "max": 3, "mean": 2.0},
+        "b": {"count": 1, "sum": 2, "min": 2, "max": 2, "mean": 2.0},
+    }
+
+    # Ensure that counting an attribute ignores None values as SQL aggregates do
+    results = things.group_by("kind").agg(count="value")
+
+    assert results == {"a": {"count": 2}, "b": {"count": 1}}
+
+    with pytest.raises(ValueError):
+        things.group_by("kind").agg(median="value")
+
+    with pytest.raises(ValueError):
+        things.group_by("kind").agg()
+
+
+def test_fluent_list_top():
+    """Test the 'top', 'nsmallest' and 'nlargest' methods of the 'fluentlist' class."""
+
+    numbers = fluentlist([5, 1, 4, 2, 3])
+
+    top = numbers.top(2)
+
+    assert isinstance(top, fluentlist)
+    assert top == [1, 2]
+
+    # Ensure that the results match sorting then taking the specified number of items
+    assert numbers.top(3, reverse=True) == numbers.sorted(reverse=True).take(3)
+    assert numbers.top(3, key=lambda n: -n) == [5, 4, 3]
+    assert numbers.top(10) == [1, 2, 3, 4, 5]
+    assert numbers.top(0) == []
+
+    assert numbers.nsmallest(2) == [1, 2]
+    assert numbers.nlargest(2) == [5, 4]
+
+    # Ensure that the original list remains unmodified
+    assert numbers == [5, 1, 4, 2, 3]
+
+    with pytest.raises(TypeError):
+        numbers.top("2")
+
+    with pytest.raises(ValueError):
+        numbers.top(-1)
+
+    with pytest.raises(TypeError):
+        numbers.top(2, key=1)
+
+
+def test_fluent_list_sorted_by():
+    """Test the 'sorted' and 'sort' methods of the 'fluentlist' class with 'by' specs."""
+
+    things = fluentlist(
+        [
+            Thing(name="a", priority=1, created=3),
+            Thing(name="b", priority=2, created=2),
+            Thing(name="c", priority=None, created=1),
+            Thing(name="d", priority=2, created=1),
+        ]
+    )
+
+    def names(items: fluentlist[Thing]) -> list[str]:
+        return [item.name for item in items]
+
+    # Ensure that a single attribute name can be specified
+    assert names(things.sorted(by="created")) == ["c", "d", "b", "a"]
+
+    # Ensure that mixed ascending and descending attributes are sorted as specified
+    assert names(things.sorted(by=["-priority", "created"])) == ["d", "b", "a", "c"]
+
+    # Ensure that the placement of None values can be configured
+    assert names(things.sorted(by=["-priority", "created"], nones="first")) == [
+        "c",
+        "d",
+        "b",
+        "a",
+    ]
+
+    assert names(things.sorted(by="priority")) == ["a", "b", "d", "c"]
+
+    # Ensure that the reverse argument reverses each of the specified directions
+    assert names(things.sorted(by=["-priority", "created"], reverse=True)) == [
+        "a",
+        "b",
+        "d",
+        "c",
+    ]
+
+    # Ensure that the original list remains unmodified by the .sorted() method
+    assert names(things) == ["a", "b", "c", "d"]
+
+    # Ensure that the .sort() method sorts in-place and returns the list for chaining
+    assert things.sort(by=["priority", "-created"]) is things
+
+    assert names(things) == ["a", "b", "d", "c"]
+
+    with pytest.raises(TypeError):
+        things.sorted(by="priority", key=lambda thing: thing.name)
+
+    with pytest.raises(ValueError):
+        things.sorted(by="priority", nones="middle")
+
+    with pytest.raises(TypeError):
+        things.sorted(by=[])
+
+
+def test_fluent_list_merge_sorted():
+    """Test the 'merge_sorted' method of the 'fluentlist' class."""
+
+    shard = fluentlist([1, 4, 7])
+
+    merged = shard.merge_sorted([2, 5, 8], fluentlist([3, 6, 9]))
+
+    assert isinstance(merged, fluentlist)
+    assert merged == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    # Ensure that the original list remains unmodified
+    assert shard == [1, 4, 7]
+
+    # Ensure that lists sorted in reverse or via a key can be merged
+    assert fluentlist([7, 4, 1]).merge_sorted([8, 2], reverse=True) == [8, 7, 4, 2, 1]
+
+    assert fluentlist(["a", "ccc"]).merge_sorted(["bb"], key=len) == ["a", "bb", "ccc"]
+
+    # Ensure that a lazy iterator can be obtained, yielding the items as needed
+    merged = shard.merge_sorted([2, 5, 8], lazy=True)
+
+    assert not isinstance(merged, list)
+    assert next(merged) == 1
+    assert list(merged) == [2, 4, 5, 7, 8]
+
+    with pytest.raises(TypeError):
+        shard.merge_sorted([2], key=1)
+
+
+def test_fluent_list_bisect_search_sorted():
+    """Test the 'bisect' and 'search_sorted' methods of the 'fluentlist' class."""
+
+    numbers = fluentlist([1, 3, 3, 5])
+
+    assert numbers.bisect(3) == 1
+    assert numbers.bisect(3, side="right") == 3
+    assert numbers.bisect(0) == 0
+    assert numbers.bisect(9) == 4
+
+    assert numbers.search_sorted(3) == 1
+    assert numbers.search_sorted(5) == 3
+    assert numbers.search_sorted(4) is None
+    assert numbers.search_sorted(9) is None
+
+    words = fluentlist(["a", "bb", "ccc"])
+
+    assert words.bisect(2, key=len) == 1
+    assert words.search_sorted(3, key=len) == 2
+
+    with pytest.raises(ValueError):
+        numbers.bisect(3, side="middle")
+
+
+def test_fluent_list_sorted_external(tmp_path):
+    """Test the 'sorted' method of the 'fluentlist' class with a memory limit."""
+
+    numbers = fluentlist([(index * 7919) % 1009 for index in range(1009)])
+
+    sortednumbers = numbers.sorted(memory_limit="4KB", spill_dir=tmp_path)
+
+    assert isinstance(sortednumbers, fluentlist)
+    assert sortednumbers == sorted(numbers)
+
+    # Ensure that the original list remains unmodified
+    assert numbers[0:3] == [0, 7919 % 1009, (2 * 7919) % 1009]
+
+    # Ensure that a lazy iterator can be obtained which streams the sorted items
+    sortednumbers = numbers.sorted(memory_limit=4096, reverse=True, lazy=True)
+
+    assert not isinstance(sortednumbers, list)
+    assert next(sortednumbers) == 1008
+
+    # Ensure that the 'by' sort specifications are supported with external sorts
+    things = fluentlist([Thing(a=value % 7, b=value) for value in numbers])
+
+    assert things.sorted(by=["-a", "b"], memory_limit=4096).map(
+        lambda thing: (thing.a, thing.b)
+    ) == sorted(((thing.a, thing.b) for thing in things), key=lambda t: (-t[0], t[1]))
+
+    with pytest.raises(TypeError):
+        numbers.sorted(memory_limit=4096, cmp=None)
+
+    with pytest.raises(ValueError):
+        numbers.sorted(memory_limit="lots")
+
+
+def test_fluent_list_unique_spilling(tmp_path):
+    """Test the 'unique' method of the 'fluentlist' class with a memory limit."""
+
+    numbers = fluentlist([(index * 7919) % 211 for index in range(2000)])
+
+    expected = list(dict.fromkeys(numbers))
+
+    uniquenumbers = numbers.unique(memory_limit=1024, spill_dir=tmp_path)
+
+    assert isinstance(uniquenumbers, fluentlist)
+    assert sorted(uniquenumbers) == sorted(expected)
+
+    uniquenumbers = numbers.unique(memory_limit="1KB", lazy=True)
+
+    assert not isinstance(uniquenumbers, list)
+    assert sorted(uniquenumbers) == sorted(expected)
+
+    # Ensure that the order of first occurrence is retained within the memory limit
+    assert numbers.unique(memory_limit="1MB") == expected
+
+    assert list(numbers.unique(lazy=True)) == expected
+
+
+def test_fluent_list_group_by_spilling(tmp_path):
+    """Test the 'group_by' method of the 'fluentlist' class with a memory limit."""
+
+    things = fluentlist([Thing(kind=index % 5, value=index) for index in range(500)])
+
+    groups = things.group_by("kind", memory_limit=1024, spill_dir=tmp_path)
+
+    streamed = list(groups.stream())
+
+    assert sorted(key for key, group in streamed) == [0, 1, 2, 3, 4]
+
+    for key, group in streamed:
+        assert isinstance(group, fluentlist)
+        assert [thing.value for thing in group] == list(range(key, 500, 5))
+
+    # Ensure that aggregation remains available alongside a memory limit
+    assert groups.agg(count=True)[4] == {"count": 100}
+
+    # Ensure that the groups of an unlimited grouping can also be streamed
+    assert list(things.group_by("kind").stream())[0][0] == 0
+
+
+def test_fluent_list_join():
+    """Test the 'join' method of the 'fluentlist' class."""
+
+    events = fluentlist(
+        [
+            Thing(id=1, user=10),
+            Thing(id=2, user=20),
+            Thing(id=3, user=10),
+            Thing(id=4, user=30),
+        ]
+    )
+
+    users = fluentlist([Thing(id=10, name="a"), Thing(id=20, name="b")])
+
+    joined = events.join(users, left_key="user", right_key="id")
+
+    assert isinstance(joined, fluentlist)
+
+    assert [(event.id, user.name) for (event, user) in joined] == [
+        (1, "a"),
+        (2, "b"),
+        (3, "a"),
+    ]
+
+    # Ensure that unmatched items are paired with None for left and outer joins
+    joined = events.join(users, left_key="user", right_key="id", how="left")
+
+    assert joined.length() == 4
+    assert joined.last() == (events[3], None)
+
+    joined = users.join(events, left_key="id", right_key="user", how="right")
+
+    assert joined.length() == 4
+    assert (None, events[3]) in joined
+
+    # Ensure that results can be merged into records and obtained lazily
+    joined = events.join(
+        users,
+        left_key="user",
+        right_key="id",
+        merge=lambda event, user: (event.id, user.name),
+        lazy=True,
+    )
+
+    assert not isinstance(joined, list)
+    assert list(joined) == [(1, "a"), (2, "b"), (3, "a")]
+
+    # Ensure that a sort-merge join can be used when both sides are sorted by key
+    joined = events.sorted(by="user").join(
+        users, left_key="user", right_key="id", how="outer", presorted=True
+    )
+
+    assert [(event and event.id, user and user.name) for (event, user) in joined] == [
+        (1, "a"),
+        (3, "a"),
+        (2, "b"),
+        (4, None),
+    ]
+
+    # Ensure that a sort-merge join treats None keys as unmatched, as a hash join does
+    lefts = fluentlist([(None, "a"), (1, "b"), (2, "c"), (None, "d")])
+    rights = fluentlist([(None, "x"), (2, "y"), (3, "z")])
+
+    for presorted in (True, False):
+        joined = lefts.join(
+            rights, on=lambda item: item[0], how="outer", presorted=presorted
+        )
+
+        pairs = [(left and left[1], right and right[1]) for (left, right) in joined]
+
+        assert sorted(pairs, key=repr) == sorted(
+            [
+                ("a", None),
+                ("b", None),
+                ("c", "y"),
+                ("d", None),
+                (None, "x"),
+                (None, "z"),
+            ],
+            key=repr,
+        )
+
+        assert lefts.join(rights, on=lambda item: item[0], presorted=presorted) == [
+            ((2, "c"), (2, "y"))
+        ]
+
+    # Ensure that the same key may be used for both sides via the 'on' argument
+    assert fluentlist([1, 2, 3]).join([2, 3, 4], on=lambda n: n) == [(2, 2), (3, 3)]
+
+    with pytest.raises(TypeError):
+        events.join(users)
+
+    with pytest.raises(TypeError):
+        events.join(users, on="id", left_key="user")
+
+    with pytest.raises(ValueError):
+        events.join(users, on="id", how="cross")
+
+
+def test_fluent_list_chunk_window():
+    """Test the 'chunk' and 'window' methods of the 'fluentlist' class."""
+
+    numbers = fluentlist(range(1, 8))
+
+    chunks = numbers.chunk(3)
+
+    # Ensure that the chunks are produced lazily via an iterator
+    assert not isinstance(chunks, list)
+
+    chunks = list(chunks)
+
+    assert all(isinstance(chunk, fluentlist) for chunk in chunks)
+    assert chunks == [[1, 2, 3], [4, 5, 6], [7]]
+
+    assert list(numbers.window(3)) == [
+        [1, 2, 3],
+        [2, 3, 4],
+        [3, 4, 5],
+        [4, 5, 6],
+        [5, 6, 7],
+    ]
+
+    assert list(numbers.window(3, step=2)) == [[1, 2, 3], [3, 4, 5], [5, 6, 7]]
+
+    # Ensure that windows which do not overlap skip the items between the windows
+    assert list(numbers.window(2, step=3)) == [[1, 2], [4, 5]]
+    assert list(numbers.window(3, step=3)) == [[1, 2, 3], [4, 5, 6]]
+    assert all(isinstance(window, fluentlist) for window in numbers.window(2, step=2))
+
+    assert list(numbers.window(10)) == []
+    assert list(numbers.window(10, step=10)) == []
+
+    with pytest.raises(ValueError):
+        numbers.chunk(0)
+
+    with pytest.raises(TypeError):
+        numbers.window(2, step="1")
+
+
+def test_fluent_list_partition_split_at():
+    """Test the 'partition' and 'split_at' methods of the 'fluentlist' class."""
+
+    numbers = fluentlist(range(1, 8))
+
+    (evens, odds) = numbers.partition(lambda number: number % 2 == 0)
+
+    assert isinstance(evens, fluentlist)
+    assert isinstance(odds, fluentlist)
+
+    assert evens == [2, 4, 6]
+    assert odds == [1, 3, 5, 7]
+
+    (head, tail) = numbers.split_at(2)
+
+    assert isinstance(head, fluentlist)
+    assert head == [1, 2]
+    assert tail == [3, 4, 5, 6, 7]
+
+    assert numbers.split_at(-1) == ([1, 2, 3, 4, 5, 6], [7])
+
+    with pytest.raises(TypeError):
+        numbers.partition(None)
+
+
+def test_fluent_list_sample_shuffled():
+    """Test the 'sample' and 'shuffled' methods of the 'fluentlist' class."""
+
+    numbers = fluentlist(range(100))
+
+    sample = numbers.sample(5, seed=1)
+
+    assert isinstance(sample, fluentlist)
+    assert len(sample) == 5
+    assert all(number in numbers for number in sample)
+    assert numbers.sample(5, seed=1) == sample
+
+    weighted = numbers.sample(3, weights=lambda number: 1 if number < 3 else 0)
+
+    assert sorted(weighted) == [0, 1, 2]
+
+    shuffled = numbers.shuffled(seed=1)
+
+    assert isinstance(shuffled, fluentlist)
+    assert sorted(shuffled) == numbers
+    assert numbers.shuffled(3, seed=1)[:3] == shuffled[:3]
+
+    # Ensure that the original list remains unmodified
+    assert numbers == list(range(100))
+
+
+def test_fluent_list_stats():
+    """Test the 'stats' method of the 'fluentlist' class."""
+
+    numbers = fluentlist([1.5, 2.5, 3.5, 4.5])
+
+    results = numbers.stats(bins=2)
+
+    assert results["count"] == 4
+    assert results["sum"] == 12.0
+    assert results["mean"] == 3.0
+    assert results["min"] == 1.5
+    assert results["max"] == 4.5
+    assert results["histogram"]["counts"] == [2, 2]
+
+    things = fluentlist([Thing(age=20), Thing(age=30)])
+
+    assert things.stats(key="age")["mean"] == 25.0
+
+
+def test_fluent_list_pickling():
+    """Test that lists, including their attributes, round-trip through pickle."""
+
+    data = fluentlist([1, "two", 3.0, fluentlist([4])])
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        result = pickle.loads(pickle.dumps(data, protocol=protocol))
+
+        assert isinstance(result, fluentlist)
+        assert isinstance(result[3], fluentlist)
+        assert result == data
+
+    assert pickle.dumps(data) == pickle.dumps(fluentlist(list(data)))
+
+    data.label = "items"
+
+    assert pickle.loads(pickle.dumps(data)).label == "items"
+
+
+def test_fluent_list_jsonl(tmp_path):
+    """Test the 'to_jsonl' and 'from_jsonl' methods of the 'fluentlist' class."""
+
+    path = tmp_path / "items.jsonl"
+
+    data = fluentlist([{"id": index, "even": index % 2 == 0} for index in range(100)])
+
+    assert data.to_jsonl(path) is data
+
+    result = fluentlist.from_jsonl(path)
+
+    assert isinstance(result, fluentlist)
+    assert result == data
+
+    # Ensure that lazy reading yields the items as they are read, for streaming
+    items = fluentlist.from_jsonl(path, lazy=True, threaded=True)
+
+    assert not isinstance(items, list)
+
+    assert fluentlist(item for item in items if item["even"]).length() == 50
+
+    with pytest.raises(TypeError):
+        fluentlist.from_jsonl(path, lazy=1)
+
+
+def test_fluent_list_csv(tmp_path):
+    """Test the 'to_csv' and 'from_csv' methods of the 'fluentlist' class."""
+
+    path = tmp_path / "things.csv"
+
+    things = fluentlist([Thing(id=1, name="one"), Thing(id=2, name="two")])
+
+    assert things.to_csv(path, fields=["id", "name"]) is things
+
+    result = fluentlist.from_csv(path)
+
+    assert isinstance(result, fluentlist)
+    assert result == [{"id": "1", "name": "one"}, {"id": "2", "name": "two"}]
+
+    # Ensure that the fields must be specified where they cannot be determined
+    with pytest.raises(TypeError):
+        things.to_csv(path)
+
+
+def test_fluent_list_from_lines(tmp_path):
+    """Test the 'from_lines' method of the 'fluentlist' class."""
+
+    path = tmp_path / "lines.txt"
+
+    path.write_text("first\nsecond\nthird\n")
+
+    lines = fluentlist.from_lines(path)
+
+    assert isinstance(lines, fluentlist)
+    assert lines == ["first", "second", "third"]
+
+    assert list(fluentlist.from_lines(path, lazy=True)) == lines
+
+
+def test_fluent_list_save_load(tmp_path):
+    """Test the 'save' and 'load' methods of the 'fluentlist' class."""
+
+    path = tmp_path / "items.snapshot"
+
+    data = fluentlist(range(1000)).extend(["one", "two", None])
+
+    assert data.save(path, compress="zlib", chunksize=100) is data
+
+    result = fluentlist.load(path)
+
+    assert isinstance(result, fluentlist)
+    assert result == data
+
+    partial = fluentlist.load(path, start=450, stop=550)
+
+    assert isinstance(partial, fluentlist)
+    assert partial == data[450:550]
+
+    items = fluentlist.load(path, start=1000, lazy=True)
+
+    assert not isinstance(items, list)
+    assert list(items) == ["one", "two", None]
+
+    with pytest.raises(TypeError):
+        fluentlist.load(path, lazy=1)
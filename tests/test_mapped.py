@@ -0,0 +1,163 @@
+from fluently import fluentmapped, flumapped, fmapped, fluenttuple, fluentview
+from fluently import mapped
+
+import pickle
+import pytest
+
+
+@pytest.fixture(name="path", scope="function")
+def fixture_path(tmp_path) -> str:
+    return str(tmp_path / "items.fluently")
+
+
+def test_fluent_mapped_alias():
+    """Test the 'flumapped' and 'fmapped' aliases for the 'fluentmapped' class."""
+
+    assert fluentmapped is flumapped
+    assert fluentmapped is fmapped
+
+
+@pytest.mark.parametrize(
+    "items, encoding",
+    [
+        ((3, -1, 4, 1, 5, 9, 2, 6, 5, 3, 5), "q"),
+        ((0.5, 1.25, -2.0, 0.5), "d"),
+        (("apple", "", "bañana", "apple", "an", "a"), "s"),
+        ((b"\x00\x01", b"", b"\x01", b"\x00\x01"), "y"),
+        ((1, "two", 3.0, None, (4, 5), {"six": 6}), "p"),
+        ((2**64, 1), "p"),
+        ((True, False, True), "p"),
+        ((), "q"),
+    ],
+)
+def test_fluent_mapped_round_trip(path: str, items: tuple, encoding: str):
+    """Test saving tuples of each encoding and accessing them via the mapping."""
+
+    data = fluenttuple(items)
+
+    assert data.save(path) is data
+
+    with fluenttuple.mmap(path) as mapping:
+        assert isinstance(mapping, fluentmapped)
+        assert mapping._encoding == encoding
+
+        assert mapping.length() == len(mapping) == len(items)
+        assert mapping == items
+        assert list(mapping) == list(items)
+        assert mapping.collect() == items
+        assert isinstance(mapping.collect(), fluenttuple)
+
+        for index in range(-len(items), len(items)):
+            assert mapping[index] == items[index]
+
+        for item in items:
+            assert mapping.contains(item) is True
+            assert item in mapping
+            assert mapping.count(item) == items.count(item)
+
+        assert mapping.contains("missing") is False
+        assert mapping.count("missing") == 0
+
+        with pytest.raises(IndexError):
+            mapping[len(items)]
+
+
+def test_fluent_mapped_substrings(path: str):
+    """Test that counting strings only matches whole items, not parts of other items."""
+
+    items = ("ab", "", "a", "ba", "", "b", "aba", "ab")
+
+    fluenttuple(items).save(path)
+
+    mapping = fluenttuple.mmap(path)
+
+    for value in ("a", "b", "ab", "ba", "aba", "", "bab", "abab"):
+        assert mapping.count(value) == items.count(value)
+        assert mapping.contains(value) is (value in items)
+
+    assert mapping.count(b"ab") == 0
+
+
+def test_fluent_mapped_slicing(path: str):
+    """Test that slicing and the 'view' method return views onto the mapping."""
+
+    fluenttuple(range(10)).save(path)
+
+    mapping = fluenttuple.mmap(path)
+
+    assert isinstance(mapping[2:5], fluentview)
+    assert mapping[2:5] == [2, 3, 4]
+    assert mapping[::-3] == [9, 6, 3, 0]
+    assert mapping.view(7) == [7, 8, 9]
+
+    assert isinstance(mapping[2:5].collect(), fluenttuple)
+
+
+def test_fluent_mapped_filter(path: str):
+    """Test the 'filter', 'first' and 'last' methods."""
+
+    fluenttuple(range(10)).save(path)
+
+    mapping = fluenttuple.mmap(path)
+
+    evens = mapping.filter(lambda value: value % 2 == 0)
+
+    assert isinstance(evens, fluenttuple)
+    assert evens == (0, 2, 4, 6, 8)
+
+    assert mapping.first() == 0
+    assert mapping.last(lambda value: value < 5) == 4
+    assert mapping.first(lambda value: value > 10) is None
+
+    with pytest.raises(TypeError):
+        mapping.filter(5)
+
+    mapped.save([Kind("a", 1), Kind("b", 2), Kind("a", 3)], path)
+
+    mapping = fluentmapped(path)
+
+    assert mapping.filter(kind="a").map(lambda item: item.size) == (1, 3)
+
+
+class Kind(object):
+    """A simple picklable data type class for the mapped filter tests."""
+
+    def __init__(self, kind: str, size: int):
+        self.kind = kind
+        self.size = size
+
+
+def test_fluent_mapped_pickling(path: str):
+    """Test that the mapping is pickled by its path, rather than by its items."""
+
+    fluenttuple(["a", "b", "c"]).save(path)
+
+    mapping = fluenttuple.mmap(path)
+
+    data = pickle.dumps(mapping)
+
+    assert len(data) < 200
+
+    assert pickle.loads(data) == ("a", "b", "c")
+
+
+def test_fluent_mapped_invalid(tmp_path, path: str):
+    """Test that files not written by 'save' cannot be mapped."""
+
+    with open(path, "wb") as file:
+        file.write(b"not a fluently file")
+
+    with pytest.raises(ValueError):
+        fluentmapped(path)
+
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+
+    with pytest.raises(ValueError):
+        fluentmapped(str(empty))
+
+    with pytest.raises(TypeError):
+        fluentmapped(123)
+
+    with pytest.raises(TypeError):
+        fluenttuple().save(123)
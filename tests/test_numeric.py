@@ -0,0 +1,206 @@
+from fluently import fluentnumeric, flunumeric, fnumeric, fluentlist, fluentarray
+from fluently import fluenttuple, numeric
+
+import math
+import pickle
+import pytest
+
+# Test each of the backends available within the current environment
+backends = ["numpy", "python"] if numeric.available else ["python"]
+
+
+@pytest.fixture(name="numbers", scope="function", params=backends)
+def fixture_numbers(request) -> fluentnumeric:
+    numbers = fluentlist([3, 1, 4, 1, 5, 9, 2, 6]).numeric(backend=request.param)
+
+    assert isinstance(numbers, fluentnumeric)
+    assert numbers.backend == request.param
+
+    assert len(numbers) == 8
+
+    return numbers
+
+
+def test_fluent_numeric_alias():
+    """Test the 'flunumeric' and 'fnumeric' aliases for the 'fluentnumeric' class."""
+
+    assert fluentnumeric is flunumeric
+    assert fluentnumeric is fnumeric
+
+
+@pytest.mark.parametrize("backend", backends)
+def test_fluent_numeric_initialisation(backend: str):
+    """Test the creation of numeric sequences from the fluent containers."""
+
+    assert fluenttuple([1.5, 2.5]).numeric(backend=backend) == [1.5, 2.5]
+    assert fluentarray("i", [1, 2]).numeric(backend=backend) == [1, 2]
+    assert fluentnumeric(iter([1, 2.5]), backend=backend) == [1.0, 2.5]
+    assert fluentnumeric([1, 2], typecode="d", backend=backend)[0] == 1.0
+
+    with pytest.raises(TypeError):
+        fluentnumeric(["a", "b"], backend=backend)
+
+    with pytest.raises(ValueError):
+        fluentnumeric([1], backend="other")
+
+
+@pytest.mark.parametrize("backend", backends)
+def test_fluent_numeric_copies_source(backend: str):
+    """Test that numeric sequences copy the values of the source array on each backend."""
+
+    values = fluentarray("d", [1, 2])
+
+    numbers = values.numeric(backend=backend)
+    sliced = numbers[0:1]
+
+    # Ensure that the source may still be modified and resized while the sequences exist
+    assert values.append(3) is values
+    assert values.extend([4, 5]) is values
+
+    values[0] = 10.0
+
+    assert numbers == [1.0, 2.0]
+    assert sliced == [1.0]
+    assert not numbers.values is values
+
+
+def test_fluent_numeric_default_backend():
+    """Test that the numpy backend is used by default where NumPy is available."""
+
+    numbers = fluentnumeric([1, 2, 3])
+
+    assert numbers.backend == ("numpy" if numeric.available else "python")
+
+
+def test_fluent_numeric_fallback(monkeypatch):
+    """Test the graceful fallback to the python backend where NumPy is unavailable."""
+
+    monkeypatch.setattr(numeric, "available", False)
+
+    numbers = fluentlist([1.5, 2.5]).numeric()
+
+    assert numbers.backend == "python"
+    assert isinstance(numbers.values, fluentarray)
+    assert numbers.map(lambda x: x * 2) == [3.0, 5.0]
+
+    with pytest.raises(ImportError):
+        fluentnumeric([1, 2, 3], backend="numpy")
+
+
+def test_fluent_numeric_indexing(numbers: fluentnumeric):
+    """Test indexing, slicing and iterating over numeric sequences."""
+
+    assert numbers[0] == 3
+    assert isinstance(numbers[0], int)
+    assert numbers[-1] == 6
+
+    assert isinstance(numbers[1:3], fluentnumeric)
+    assert numbers[1:3] == [1, 4]
+    assert list(numbers) == [3, 1, 4, 1, 5, 9, 2, 6]
+
+    tolist = numbers.tolist()
+
+    assert isinstance(tolist, fluentlist)
+    assert tolist == [3, 1, 4, 1, 5, 9, 2, 6]
+
+    toarray = numbers.toarray()
+
+    assert isinstance(toarray, fluentarray)
+    assert toarray.tolist() == [3, 1, 4, 1, 5, 9, 2, 6]
+
+
+def test_fluent_numeric_map(numbers: fluentnumeric):
+    """Test mapping functions that can and cannot be vectorised over the values."""
+
+    # Arithmetic lambdas are applied to all of the values at once where possible
+    assert numbers.map(lambda x: x * 2 + 1) == [7, 3, 9, 3, 11, 19, 5, 13]
+
+    # Functions which only accept single values are applied to each value in turn
+    assert numbers.map(lambda x: math.sqrt(x))[1] == 1.0
+    assert numbers.map(math.sqrt)[0] == math.sqrt(3)
+    assert numbers.map(lambda x: x if x > 3 else 0) == [0, 0, 4, 0, 5, 9, 0, 6]
+
+    assert numbers.map(lambda x: x / 2).map(lambda x: x * 4)[0] == 6.0
+
+    with pytest.raises(TypeError):
+        numbers.map(None)
+
+
+def test_fluent_numeric_filter(numbers: fluentnumeric):
+    """Test filtering via predicates that can and cannot be vectorised as a mask."""
+
+    assert numbers.filter(lambda x: x > 3) == [4, 5, 9, 6]
+    assert numbers.filter(lambda x: x % 2 == 0) == [4, 2, 6]
+    assert numbers.filter(lambda x: 2 < x and x < 6) == [3, 4, 5]
+
+    with pytest.raises(TypeError):
+        numbers.filter(None)
+
+
+def test_fluent_numeric_sorted_unique_count(numbers: fluentnumeric):
+    """Test the 'sorted', 'unique' and 'count' methods of numeric sequences."""
+
+    assert numbers.sorted() == [1, 1, 2, 3, 4, 5, 6, 9]
+    assert numbers.sorted(reverse=True) == [9, 6, 5, 4, 3, 2, 1, 1]
+
+    # Ensure that the unique values are retained in order of their first appearance
+    assert numbers.unique() == [3, 1, 4, 5, 9, 2, 6]
+
+    assert numbers.count(1) == 2
+    assert numbers.count(7) == 0
+
+
+def test_fluent_numeric_aggregates(numbers: fluentnumeric):
+    """Test the 'reduce' and aggregate methods of numeric sequences."""
+
+    assert numbers.reduce(lambda a, b: a + b) == 31
+    assert numbers.reduce(lambda a, b: a + b, 10) == 41
+    assert numbers.sum() == 31
+    assert numbers.min() == 1
+    assert numbers.max() == 9
+    assert numbers.mean() == 3.875
+
+    results = numbers.stats(bins=4)
+
+    assert results["count"] == 8
+    assert results["sum"] == 31
+    assert results["variance"] == pytest.approx(7.553571428571429)
+    assert results["histogram"]["counts"] == [3, 2, 2, 1]
+
+    empty = numbers.filter(lambda x: x > 100)
+
+    assert empty.length() == 0
+    assert empty.min() is None
+    assert empty.mean() is None
+    assert empty.stats()["count"] == 0
+
+
+def test_fluent_numeric_ufunc_reduce():
+    """Test that NumPy ufuncs are reduced by NumPy on the numpy backend."""
+
+    numpy = pytest.importorskip("numpy")
+
+    numbers = fluentnumeric([3, 1, 4], backend="numpy")
+
+    assert numbers.reduce(numpy.add) == 8
+    assert numbers.reduce(numpy.maximum) == 4
+    assert numbers.reduce(numpy.add, 10) == 18
+    assert numbers.map(numpy.negative) == [-3, -1, -4]
+
+
+def test_fluent_numeric_pickling(numbers: fluentnumeric):
+    """Test pickling numeric sequences, with their values transferred out-of-band."""
+
+    result = pickle.loads(pickle.dumps(numbers))
+
+    assert isinstance(result, fluentnumeric)
+    assert result.backend == numbers.backend
+    assert result == numbers
+
+    buffers: list[pickle.PickleBuffer] = []
+
+    data = pickle.dumps(numbers, protocol=5, buffer_callback=buffers.append)
+
+    assert len(buffers) == 1
+
+    assert pickle.loads(data, buffers=buffers) == numbers
@@ -0,0 +1,332 @@
+from fluently import fluentrecords, flurecords, frecords, fluentrecord, fluentlist
+from fluently import records
+from conftest import Thing
+
+import pickle
+import pytest
+
+
+@pytest.fixture(name="people", scope="function")
+def fixture_people() -> fluentrecords:
+    people = fluentrecords(
+        [
+            {"name": "Alice", "age": 30, "city": "London"},
+            {"name": "Bob", "age": 25, "city": "Paris"},
+            {"name": "Carol", "age": 35, "city": "London"},
+            {"name": "Dave", "age": None, "city": "Paris"},
+            {"name": "Eve", "age": 25, "city": "Berlin"},
+        ]
+    )
+
+    assert isinstance(people, fluentrecords)
+
+    assert len(people) == 5
+
+    return people
+
+
+def test_fluent_records_alias():
+    """Test the 'flurecords' and 'frecords' aliases for the 'fluentrecords' class."""
+
+    assert fluentrecords is flurecords
+    assert fluentrecords is frecords
+
+
+def test_fluent_records_initialisation():
+    """Test the creation of records from dictionaries, objects and columns."""
+
+    records = fluentrecords([{"a": 1, "b": 2}, {"a": 3}])
+
+    assert records.fields == ["a", "b"]
+    assert records.column("b") == [2, None]
+
+    things = fluentrecords([Thing(x=1, y=2), Thing(x=3)], fields=["x", "y"])
+
+    assert things.todicts() == [{"x": 1, "y": 2}, {"x": 3, "y": None}]
+
+    columns = fluentrecords.from_columns({"a": [1, 2], "b": ["x", "y"]})
+
+    assert columns == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+
+    with pytest.raises(ValueError):
+        fluentrecords.from_columns({"a": [1, 2], "b": [1]})
+
+    with pytest.raises(TypeError):
+        fluentrecords([], fields="a")
+
+    with pytest.raises(TypeError):
+        fluentrecords([Thing(x=1)])
+
+
+def test_fluent_records_row_proxies(people: fluentrecords):
+    """Test the row proxies yielded by iterating over and indexing into the records."""
+
+    row = people[1]
+
+    assert isinstance(row, fluentrecord)
+    assert row.name == "Bob"
+    assert row["age"] == 25
+    assert row.todict() == {"name": "Bob", "age": 25, "city": "Paris"}
+    assert people[-1].name == "Eve"
+
+    assert not hasattr(row, "height")
+
+    with pytest.raises(IndexError):
+        people[5]
+
+    assert [row.name for row in people] == ["Alice", "Bob", "Carol", "Dave", "Eve"]
+
+    # The proxies hold no copy of the values, so reflect changes to the columns
+    people._columns["name"][1] = "Robert"
+
+    assert row.name == "Robert"
+
+
+def test_fluent_records_slicing(people: fluentrecords):
+    """Test the 'slice', 'take' and 'drop' methods and slice indexing."""
+
+    assert people[1:3].column("name") == ["Bob", "Carol"]
+    assert people.slice(0, 5, 2).column("name") == ["Alice", "Carol", "Eve"]
+    assert people.take(2).column("name") == ["Alice", "Bob"]
+    assert people.drop(3).column("name") == ["Dave", "Eve"]
+
+    with pytest.raises(TypeError):
+        people.take("2")
+
+
+def test_fluent_records_append_extend(people: fluentrecords):
+    """Test the 'append' and 'extend' methods."""
+
+    assert people.append({"name": "Frank", "age": 40}) is people
+    assert people.length() == 6
+    assert people.last().todict() == {"name": "Frank", "age": 40, "city": None}
+
+    people.extend([Thing(name="Grace", age=22, city="Rome")])
+
+    assert people[6].city == "Rome"
+
+
+def test_fluent_records_new_fields():
+    """Test that fields first seen in later records are added as backfilled columns."""
+
+    records = fluentrecords([{"a": 1}, {"a": 2, "b": 3}])
+
+    assert records.fields == ["a", "b"]
+    assert records.column("b") == [None, 3]
+
+    records.append({"c": 4})
+
+    assert records.todicts() == [
+        {"a": 1, "b": None, "c": None},
+        {"a": 2, "b": 3, "c": None},
+        {"a": None, "b": None, "c": 4},
+    ]
+
+    # Ensure that specified fields are not extended by the fields of later records
+    things = fluentrecords([Thing(x=1)], fields=["x"]).append({"x": 2, "y": 3})
+
+    assert things.fields == ["x"]
+
+
+def test_fluent_records_filter_absent():
+    """Test that records lacking a field never match a filter on it, as per fluentlist."""
+
+    rows = [{"a": 1}, {"a": None, "b": 2}, {"b": 3}, {"a": None}]
+
+    data = fluentrecords(rows)
+
+    assert data.filter(a=None).todicts() == [
+        {"a": None, "b": 2},
+        {"a": None, "b": None},
+    ]
+    assert data.filter(b=None).length() == 0
+    assert data.filter(a=None, b=2).length() == 1
+
+    # Ensure that the absent fields are retained by derived and pickled records
+    assert data[1:].filter(a=None).length() == 2
+    assert data.sorted(by="b").filter(b=None).length() == 0
+    assert data.clone().filter(b=None).length() == 0
+    assert pickle.loads(pickle.dumps(data)).filter(b=None).length() == 0
+
+    class Row(object):
+        def __init__(self, **fields):
+            self.__dict__.update(fields)
+
+    items = fluentlist(Row(**row) for row in rows)
+
+    for filters in [{"a": None}, {"b": None}, {"a": None, "b": 2}, {"a": 1}]:
+        assert data.filter(**filters).length() == items.filter(**filters).length()
+
+
+def test_fluent_records_filter(people: fluentrecords):
+    """Test the column-at-a-time 'filter' method."""
+
+    londoners = people.filter(city="London")
+
+    assert isinstance(londoners, fluentrecords)
+    assert londoners.column("name") == ["Alice", "Carol"]
+
+    assert people.filter(city="Paris", age=25).column("name") == ["Bob"]
+    assert people.filter(age=None).column("name") == ["Dave"]
+    assert people.filter(height=180).length() == 0
+    assert people.filter(city="Rome").length() == 0
+
+    assert people.filter(lambda row: row.name.startswith("C")).column("name") == [
+        "Carol"
+    ]
+
+    assert people.filter(lambda row: row.age > 25, city="London").column("name") == [
+        "Alice",
+        "Carol",
+    ]
+
+    with pytest.raises(TypeError):
+        people.filter("London")
+
+
+def test_fluent_records_first_last(people: fluentrecords):
+    """Test the 'first' and 'last' methods."""
+
+    assert people.first().name == "Alice"
+    assert people.last().name == "Eve"
+    assert people.first(city="Paris").name == "Bob"
+    assert people.last(city="Paris").name == "Dave"
+    assert people.first(city="Rome") is None
+    assert fluentrecords().last() is None
+
+
+def test_fluent_records_sorted(people: fluentrecords):
+    """Test the 'sorted' method with multiple fields, directions and None values."""
+
+    assert people.sorted(by="age").column("name") == [
+        "Bob",
+        "Eve",
+        "Alice",
+        "Carol",
+        "Dave",
+    ]
+
+    assert people.sorted(by="age", nones="first").column("name") == [
+        "Dave",
+        "Bob",
+        "Eve",
+        "Alice",
+        "Carol",
+    ]
+
+    assert people.sorted(by=["age", "-name"]).column("name") == [
+        "Eve",
+        "Bob",
+        "Alice",
+        "Carol",
+        "Dave",
+    ]
+
+    assert people.sorted(by=["city", "-age"]).column("name") == [
+        "Eve",
+        "Carol",
+        "Alice",
+        "Bob",
+        "Dave",
+    ]
+
+    assert people.sorted(by="age", reverse=True).column("name") == [
+        "Carol",
+        "Alice",
+        "Bob",
+        "Eve",
+        "Dave",
+    ]
+
+    with pytest.raises(KeyError):
+        people.sorted(by="height")
+
+    with pytest.raises(ValueError):
+        people.sorted(by="age", nones="middle")
+
+
+def test_fluent_records_map(people: fluentrecords):
+    """Test the 'map' method with and without field names."""
+
+    names = people.map(str.upper, "name")
+
+    assert isinstance(names, fluentlist)
+    assert names == ["ALICE", "BOB", "CAROL", "DAVE", "EVE"]
+
+    assert people.map(lambda name, city: f"{name}@{city}", "name", "city")[0] == (
+        "Alice@London"
+    )
+
+    assert people.map(lambda row: row.city[0]) == ["L", "P", "L", "P", "B"]
+
+    with pytest.raises(KeyError):
+        people.map(str, "height")
+
+
+def test_fluent_records_group_by(people: fluentrecords):
+    """Test the 'group_by' method and column-wise aggregation of the groups."""
+
+    groups = people.group_by("city")
+
+    assert list(groups) == ["London", "Paris", "Berlin"]
+    assert isinstance(groups["Paris"], fluentrecords)
+    assert groups["Paris"].column("name") == ["Bob", "Dave"]
+
+    assert people.group_by(lambda row: row.age is None)[True].column("name") == ["Dave"]
+
+    assert groups.agg(count=True, mean="age", max="name") == {
+        "London": {"count": 2, "mean": 32.5, "max": "Carol"},
+        "Paris": {"count": 2, "mean": 25.0, "max": "Dave"},
+        "Berlin": {"count": 1, "mean": 25.0, "max": "Eve"},
+    }
+
+
+@pytest.mark.parametrize("vectorised", [True, False])
+def test_fluent_records_filter_masks(monkeypatch, vectorised: bool):
+    """Test that the filters compiled into masks match the row-by-row list filter, with
+    and without NumPy, for selective, unselective, sparse and unhashable criteria."""
+
+    if not vectorised:
+        monkeypatch.setattr(records, "numpy", None)
+
+    rows = [
+        {"a": index % 10, "b": index % 7, "c": "xyz"[index % 3], "d": [index % 2]}
+        for index in range(1000)
+    ]
+
+    data = fluentrecords(rows)
+    items = fluentlist(Thing(**row) for row in rows)
+
+    for filters in [
+        {"a": 3},
+        {"a": 3, "b": 5},
+        {"c": "x", "a": 3.0},
+        {"c": "y", "b": 2, "a": 1},
+        {"d": [1], "a": 5},
+        {"a": 11, "c": "x"},
+        {"a": "3"},
+        {"a": None},
+    ]:
+        assert data.filter(**filters).todicts() == [
+            item._data for item in items.filter(**filters)
+        ]
+
+    # The cached column statistics are discarded when records are appended
+    assert data.filter(a=10).length() == 0
+
+    data.append({"a": 10, "b": 0, "c": "x", "d": [0]})
+
+    assert data.filter(a=10, c="x").length() == 1
+
+
+def test_fluent_records_pickling(people: fluentrecords):
+    """Test that records are pickled as their columns, without their cached state."""
+
+    assert people.filter(city="London", age=30).length() == 1
+
+    result = pickle.loads(pickle.dumps(people))
+
+    assert isinstance(result, fluentrecords)
+    assert result == people
+    assert result._frequencies == {}
+    assert result.filter(city="London", age=30).length() == 1
@@ -0,0 +1,194 @@
+from fluently import sampling
+from collections import Counter
+from conftest import Thing
+
+import pytest
+import random
+
+
+def test_sampling_generator():
+    """Test the selection of the random number generator used for sampling."""
+
+    assert sampling.generator() is random
+
+    rng = sampling.generator(42)
+
+    assert isinstance(rng, random.Random)
+    assert rng.random() == random.Random(42).random()
+
+    with pytest.raises(TypeError):
+        sampling.generator(1.5)
+
+    with pytest.raises(TypeError):
+        sampling.generator(True)
+
+    # Ensure that a specified generator is used as-is
+    assert sampling.generator(rng=rng) is rng
+
+    with pytest.raises(TypeError):
+        sampling.generator(rng=42)
+
+    with pytest.raises(ValueError):
+        sampling.generator(42, rng=rng)
+
+
+def test_sampling_spawn():
+    """Test the creation of independent generators for parallel workers."""
+
+    generators = sampling.spawn(42, 4)
+
+    assert len(generators) == 4
+    assert all(isinstance(rng, random.Random) for rng in generators)
+
+    # Ensure that each generator produces a distinct stream of values
+    streams = [[rng.random() for _ in range(5)] for rng in generators]
+
+    assert len(set(map(tuple, streams))) == 4
+
+    # Ensure that the generators are reproducible from the same root seed
+    assert [
+        [rng.random() for _ in range(5)] for rng in sampling.spawn(42, 4)
+    ] == streams
+
+    # Ensure that generators spawned from different root seeds differ
+    assert sampling.spawn(43, 1)[0].random() != streams[0][0]
+
+    # Ensure that the first generators are unaffected by how many are spawned
+    assert sampling.spawn(42, 1)[0].random() == streams[0][0]
+
+    assert len(sampling.spawn(count=2)) == 2
+
+    with pytest.raises(TypeError):
+        sampling.spawn(1.5)
+
+    with pytest.raises(ValueError):
+        sampling.spawn(42, 0)
+
+
+def test_sampling_sample_sequence():
+    """Test sampling from a sequence, which draws random indices directly."""
+
+    sample = sampling.sample(range(100), 10, seed=1)
+
+    assert len(sample) == 10
+    assert len(set(sample)) == 10
+    assert all(0 <= item < 100 for item in sample)
+
+    # Ensure that the same seed produces the same sample
+    assert sampling.sample(range(100), 10, seed=1) == sample
+
+    # Ensure that a sample larger than the population returns all of the items
+    assert sorted(sampling.sample([1, 2, 3], 5, seed=1)) == [1, 2, 3]
+
+    assert sampling.sample([1, 2, 3], 0) == []
+
+    with pytest.raises(TypeError):
+        sampling.sample([1, 2, 3], "1")
+
+    with pytest.raises(ValueError):
+        sampling.sample([1, 2, 3], -1)
+
+
+def test_sampling_sample_stream():
+    """Test sampling from a stream, which uses a reservoir via Algorithm L."""
+
+    stream = (number for number in range(100_000))
+
+    sample = sampling.sample(stream, 10, seed=2)
+
+    assert len(sample) == 10
+    assert len(set(sample)) == 10
+    assert all(0 <= item < 100_000 for item in sample)
+
+    # Ensure that the same seed produces the same sample from an equivalent stream
+    assert sampling.sample(iter(range(100_000)), 10, seed=2) == sample
+
+    # Ensure that a stream shorter than the reservoir returns all of the items
+    assert sorted(sampling.sample(iter([3, 1, 2]), 5, seed=2)) == [1, 2, 3]
+
+
+def test_sampling_sample_stream_uniformity():
+    """Test that each item of a stream is sampled with roughly equal probability."""
+
+    rounds = 4000
+
+    counts = Counter()
+
+    for seed in range(rounds):
+        counts.update(sampling.sample(iter(range(20)), 5, seed=seed))
+
+    # Each item is expected to be sampled in one quarter of the rounds
+    for item in range(20):
+        assert abs(counts[item] - rounds / 4) < rounds / 4 * 0.15
+
+
+def test_sampling_sample_weighted():
+    """Test weighted sampling via weights given as attributes, callables or iterables."""
+
+    things = [
+        Thing(name="a", weight=0),
+        Thing(name="b", weight=1),
+        Thing(name="c", weight=100),
+    ]
+
+    sample = sampling.sample(things, 2, weights="weight", seed=3)
+
+    assert len(sample) == 2
+
+    # Ensure that items with a weight of zero are never sampled
+    assert set(thing.name for thing in sample) == {"b", "c"}
+
+    assert (
+        sampling.sample(things, 2, weights=lambda thing: thing.weight, seed=3) == sample
+    )
+
+    assert sampling.sample(things, 3, weights=[0, 1, 100], seed=3) == sample
+
+    # Ensure that heavily weighted items are sampled far more often
+    counts = Counter()
+
+    for seed in range(1000):
+        counts.update(sampling.sample("abc", 1, weights=[1, 1, 8], seed=seed))
+
+    assert counts["c"] > counts["a"] + counts["b"]
+
+    with pytest.raises(ValueError):
+        sampling.sample([1, 2], 1, weights=[1, -1])
+
+    with pytest.raises(TypeError):
+        sampling.sample([1, 2], 1, weights=[1, "1"])
+
+    with pytest.raises(ValueError):
+        sampling.sample([1, 2], 1, weights=[1])
+
+
+def test_sampling_shuffled():
+    """Test the partial Fisher-Yates shuffle."""
+
+    items = list(range(100))
+
+    shuffled = sampling.shuffled(items, seed=4)
+
+    assert sorted(shuffled) == items
+    assert shuffled != items
+    assert shuffled == sampling.shuffled(items, seed=4)
+
+    # Ensure that the original items are not modified
+    assert items == list(range(100))
+
+    # Ensure that only the first k positions are randomised
+    partial = sampling.shuffled(items, 5, seed=4)
+
+    assert sorted(partial) == items
+    assert partial[:5] == shuffled[:5]
+
+    assert sampling.shuffled([], 3) == []
+
+    # Ensure that a specified generator is used for the shuffle
+    assert sampling.shuffled(items, rng=random.Random(4)) == shuffled
+
+    with pytest.raises(TypeError):
+        sampling.shuffled(items, "5")
+
+    with pytest.raises(ValueError):
+        sampling.shuffled(items, -5)
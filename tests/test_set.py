@@ -1,6 +1,7 @@
-from fluently import fluentset, fluset, fset
+from fluently import fluentset, fluset, fset, fluentlist
 from conftest import Thing
 
+import pickle
 import pytest
 
 
@@ -215,3 +216,50 @@ def test_fluent_set_contains():
 
     # Ensure that the contains method returns the expected result
     assert letters.contains("D") is False
+
+
+def test_fluent_set_top():
+    """Test the 'top', 'nsmallest' and 'nlargest' methods of the 'fluentset' class."""
+
+    numbers = fluentset([5, 1, 4, 2, 3])
+
+    top = numbers.top(2)
+
+    assert isinstance(top, fluentlist)
+    assert top == [1, 2]
+
+    assert numbers.top(2, reverse=True) == [5, 4]
+    assert numbers.nsmallest(3) == [1, 2, 3]
+    assert numbers.nlargest(3) == [5, 4, 3]
+
+
+def test_fluent_set_pickling():
+    """Test that sets are pickled as their class and a plain list of their items."""
+
+    data = fluentset([1, "two", 3.0])
+
+    data.label = "items"
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        result = pickle.loads(pickle.dumps(data, protocol=protocol))
+
+        assert isinstance(result, fluentset)
+        assert result == data
+
+        # Ensure that the attributes of the instance are retained
+        assert result.label == "items"
+
+
+def test_fluent_set_save_load(tmp_path):
+    """Test the 'save' and 'load' methods of the 'fluentset' class."""
+
+    path = tmp_path / "items.snapshot"
+
+    data = fluentset(range(100)).add("one")
+
+    assert data.save(path, compress="lzma") is data
+
+    result = fluentset.load(path)
+
+    assert isinstance(result, fluentset)
+    assert result == data
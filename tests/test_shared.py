@@ -0,0 +1,146 @@
+from fluently import fluentshared, flushared, fshared, fluenttuple, fluentarray
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import pickle
+import pytest
+
+
+def test_fluent_shared_alias():
+    """Test the 'flushared' and 'fshared' aliases for the 'fluentshared' class."""
+
+    assert fluentshared is flushared
+    assert fluentshared is fshared
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        fluenttuple([3, 1, 4, 1, 5, 9, 2, 6]),
+        fluenttuple([0.5, 1.5, 0.5]),
+        fluenttuple(["apple", "", "banana", "apple"]),
+        fluenttuple([b"\x00", b"\x01\x02", b"\x00"]),
+        fluenttuple([1, "two", 3.0, None, (4, 5)]),
+        fluenttuple(),
+    ],
+)
+def test_fluent_shared_tuple(items: fluenttuple):
+    """Test sharing tuples of each encoding and accessing them via the shared memory."""
+
+    with items.share() as shared:
+        assert isinstance(shared, fluentshared)
+        assert shared.owner is True
+
+        assert shared.length() == len(items)
+        assert shared == items
+        assert shared.collect() == items
+
+        for index in range(-len(items), len(items)):
+            assert shared[index] == items[index]
+
+        for item in items:
+            assert shared.contains(item) is True
+            assert shared.count(item) == items.count(item)
+
+        assert shared.contains("missing") is False
+        assert shared[1:3] == items[1:3]
+
+
+def test_fluent_shared_array():
+    """Test sharing an array, where its values are held with the array's typecode."""
+
+    data = fluentarray("i", [5, 3, 5, 1])
+
+    with data.share() as shared:
+        assert shared._encoding == "i"
+        assert shared == [5, 3, 5, 1]
+        assert shared.count(5) == 2
+        assert shared.filter(lambda value: value > 2) == (5, 3, 5)
+
+        array = shared.toarray()
+
+        assert isinstance(array, fluentarray)
+        assert array.typecode == "i"
+        assert array == data
+
+
+def test_fluent_shared_attach():
+    """Test attaching to a block by name, and via pickling, without owning the block."""
+
+    with fluenttuple(["a", "b", "c"]).share() as shared:
+        attached = fluentshared(shared.name)
+
+        assert attached.owner is False
+        assert attached == ("a", "b", "c")
+
+        attached.close()
+
+        data = pickle.dumps(shared)
+
+        assert len(data) < 200
+
+        unpickled = pickle.loads(data)
+
+        assert unpickled.owner is False
+        assert unpickled.name == shared.name
+        assert unpickled.last() == "c"
+
+        unpickled.close()
+
+    # Once the owner has unlinked the block, it can no longer be attached to
+    with pytest.raises(FileNotFoundError):
+        fluentshared(shared.name)
+
+
+def test_fluent_shared_attach_threads():
+    """Test attaching to a block from several threads at once, which must leave the
+    resource tracker's register function as it was found."""
+
+    register = resource_tracker.register
+
+    with fluenttuple(range(10)).share() as shared:
+
+        def attach(_) -> int:
+            with fluentshared(shared.name) as attached:
+                return attached.last()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert list(executor.map(attach, range(64))) == [9] * 64
+
+    assert resource_tracker.register is register
+
+
+def count(shared: fluentshared) -> int:
+    """Counts the even values in the shared sequence within a worker process."""
+
+    return len(shared.filter(lambda value: value % 2 == 0))
+
+
+def test_fluent_shared_workers():
+    """Test passing a shared sequence to worker processes, which attach to the block."""
+
+    with fluenttuple(range(100)).share() as shared:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            assert list(executor.map(count, [shared] * 4)) == [50] * 4
+
+        assert shared.length() == 100
+
+
+def test_fluent_shared_invalid():
+    """Test the validation of the names used to create and attach to blocks."""
+
+    with pytest.raises(TypeError):
+        fluentshared(123)
+
+    with pytest.raises(TypeError):
+        fluenttuple([1]).share(name=123)
+
+    memory = SharedMemory(create=True, size=64)
+
+    try:
+        with pytest.raises(ValueError):
+            fluentshared(memory.name)
+    finally:
+        memory.close()
+        memory.unlink()
@@ -0,0 +1,139 @@
+from fluently import snapshot, fluenttuple
+
+import os
+import pytest
+
+
+@pytest.mark.parametrize("compress", [None, "zlib", "bz2", "lzma"])
+def test_snapshot_save_load(tmp_path, compress: str):
+    """Test the 'save' and 'load' methods of the 'snapshot' module round-trip items."""
+
+    path = tmp_path / "items.snapshot"
+
+    items = (
+        list(range(-100, 100))
+        + [2**40, -(2**40)]
+        + [index / 4 for index in range(100)]
+        + ["item %d" % (index) for index in range(100)]
+        + [None, True, (1, 2), {"key": "value"}, 2**70]
+    )
+
+    assert snapshot.save(iter(items), path, compress=compress, chunksize=64) == str(
+        path
+    )
+
+    assert snapshot.load(path) == items
+
+    # Ensure that no temporary files remain alongside the written file
+    assert os.listdir(tmp_path) == ["items.snapshot"]
+
+    # Ensure that the values are restored with their types
+    loaded = snapshot.load(path)
+
+    assert [type(item) for item in loaded] == [type(item) for item in items]
+
+
+def test_snapshot_encodings(tmp_path):
+    """Test that the 'save' method of the 'snapshot' module encodes chunks by type."""
+
+    path = tmp_path / "items.snapshot"
+
+    items = [1, 2] + [-300, 300] + [2**20, 3] + [2**40, 1] + [0.5, 1.5] + ["a", 1]
+
+    snapshot.save(items, path, compress="zlib", chunksize=2)
+
+    assert snapshot.describe(path) == {
+        "length": 12,
+        "chunks": 6,
+        "compress": "zlib",
+        "encodings": ["b", "h", "i", "q", "d", "p"],
+    }
+
+    snapshot.save([], path)
+
+    assert snapshot.load(path) == []
+
+    assert snapshot.describe(path)["chunks"] == 0
+
+
+def test_snapshot_stream(tmp_path):
+    """Test the 'stream' method of the 'snapshot' module reads partial ranges."""
+
+    path = tmp_path / "items.snapshot"
+
+    items = list(range(1000))
+
+    snapshot.save(items, path, compress="zlib", chunksize=100)
+
+    stream = snapshot.stream(path)
+
+    assert not isinstance(stream, list)
+
+    assert list(stream) == items
+
+    assert list(snapshot.stream(path, start=250, stop=420)) == items[250:420]
+    assert list(snapshot.stream(path, start=900)) == items[900:]
+    assert list(snapshot.stream(path, start=300, stop=300)) == []
+    assert list(snapshot.stream(path, start=990, stop=2000)) == items[990:]
+
+    with pytest.raises(ValueError):
+        snapshot.stream(path, start=-1)
+
+    with pytest.raises(ValueError):
+        snapshot.stream(path, start=10, stop=5)
+
+    with pytest.raises(TypeError):
+        snapshot.stream(path, stop="10")
+
+
+def test_snapshot_invalid(tmp_path):
+    """Test that the 'snapshot' module rejects invalid arguments and files."""
+
+    path = tmp_path / "items.snapshot"
+
+    with pytest.raises(ValueError):
+        snapshot.save([1], path, compress="zip")
+
+    with pytest.raises(TypeError):
+        snapshot.save([1], path, compress=True)
+
+    with pytest.raises(ValueError):
+        snapshot.save([1], path, chunksize=0)
+
+    path.write_bytes(b"not a snapshot")
+
+    with pytest.raises(ValueError):
+        snapshot.load(path)
+
+    with pytest.raises(ValueError):
+        snapshot.stream(path)
+
+
+def test_snapshot_load_mapped(tmp_path):
+    """Test that the 'load' method of the 'snapshot' module reads mapped tuple files."""
+
+    path = tmp_path / "items.fluently"
+
+    fluenttuple(range(10)).save(path)
+
+    assert snapshot.load(path) == list(range(10))
+
+    fluenttuple(["a", "b"]).save(path)
+
+    assert snapshot.load(path) == ["a", "b"]
+
+
+def test_snapshot_stream_mapped(tmp_path):
+    """Test that the 'stream' method of the 'snapshot' module reads mapped tuple files."""
+
+    path = tmp_path / "items.fluently"
+
+    fluenttuple(range(10)).save(path)
+
+    assert list(snapshot.stream(path)) == list(range(10))
+    assert list(snapshot.stream(path, start=4, stop=7)) == [4, 5, 6]
+    assert list(snapshot.stream(path, start=8, stop=20)) == [8, 9]
+
+    fluenttuple(["a", (1, 2), None]).save(path)
+
+    assert list(snapshot.stream(path, start=1)) == [(1, 2), None]
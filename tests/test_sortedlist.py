@@ -0,0 +1,217 @@
+from fluently import fluentsortedlist, flusortedlist, fsortedlist, fluentlist
+from conftest import Thing
+
+import pickle
+import pytest
+
+
+@pytest.fixture(name="numbers", scope="function")
+def fixture_numbers() -> fluentsortedlist[int]:
+    numbers = fluentsortedlist([5, 3, 1, 4, 2])
+
+    assert isinstance(numbers, fluentsortedlist)
+
+    assert len(numbers) == 5
+
+    return numbers
+
+
+@pytest.fixture(name="sublists", scope="function")
+def fixture_sublists(monkeypatch):
+    """Reduce the sublist load so that the tests exercise splitting and merging."""
+
+    monkeypatch.setattr(fluentsortedlist, "load", 4)
+
+
+def test_fluent_sorted_list_alias():
+    """Test the 'flusortedlist' and 'fsortedlist' aliases for the 'fluentsortedlist' class."""
+
+    assert fluentsortedlist is flusortedlist
+    assert fluentsortedlist is fsortedlist
+
+
+def test_fluent_sorted_list_initialisation(numbers: fluentsortedlist[int]):
+    """Test that the 'fluentsortedlist' class sorts its initial items."""
+
+    assert list(numbers) == [1, 2, 3, 4, 5]
+    assert numbers == [1, 2, 3, 4, 5]
+    assert numbers.length() == 5
+
+    assert list(reversed(numbers)) == [5, 4, 3, 2, 1]
+
+    with pytest.raises(TypeError):
+        fluentsortedlist(key=1)
+
+
+def test_fluent_sorted_list_add(numbers: fluentsortedlist[int]):
+    """Test the 'add' and 'update' methods of the 'fluentsortedlist' class."""
+
+    # Ensure that the .add() method returns a reference to the list for chaining
+    assert numbers.add(0) is numbers
+    assert numbers.add(3).add(9) == [0, 1, 2, 3, 3, 4, 5, 9]
+
+    assert numbers.update([8, 6, 7]) is numbers
+    assert numbers == [0, 1, 2, 3, 3, 4, 5, 6, 7, 8, 9]
+
+
+def test_fluent_sorted_list_remove(numbers: fluentsortedlist[int]):
+    """Test the 'remove', 'discard' and 'pop' methods of the 'fluentsortedlist' class."""
+
+    assert numbers.remove(3) is numbers
+    assert numbers == [1, 2, 4, 5]
+
+    with pytest.raises(ValueError):
+        numbers.remove(3)
+
+    assert numbers.remove(3, raises=False) is numbers
+
+    assert numbers.discard(4).discard(10) == [1, 2, 5]
+
+    assert numbers.pop() == 5
+    assert numbers.pop(0) == 1
+    assert numbers == [2]
+
+    assert numbers.clear() is numbers
+    assert numbers.length() == 0
+
+
+def test_fluent_sorted_list_indexing(numbers: fluentsortedlist[int]):
+    """Test indexing, slicing and the 'index' method of the 'fluentsortedlist' class."""
+
+    assert numbers[0] == 1
+    assert numbers[-1] == 5
+    assert numbers[1:3] == [2, 3]
+    assert numbers[::2] == [1, 3, 5]
+
+    assert numbers.index(4) == 3
+
+    with pytest.raises(ValueError):
+        numbers.index(10)
+
+    with pytest.raises(IndexError):
+        numbers[5]
+
+
+def test_fluent_sorted_list_bisect(numbers: fluentsortedlist[int]):
+    """Test the 'bisect' methods of the 'fluentsortedlist' class."""
+
+    numbers.add(3)
+
+    assert numbers.bisect_left(3) == 2
+    assert numbers.bisect_right(3) == 4
+    assert numbers.bisect(3) == 4
+    assert numbers.bisect_left(0) == 0
+    assert numbers.bisect_right(10) == 6
+
+    assert numbers.count(3) == 2
+    assert numbers.contains(3) is True
+    assert numbers.contains(10) is False
+
+
+def test_fluent_sorted_list_between(numbers: fluentsortedlist[int]):
+    """Test the 'between' method of the 'fluentsortedlist' class."""
+
+    between = numbers.between(2, 4)
+
+    assert isinstance(between, fluentsortedlist)
+    assert between == [2, 3, 4]
+
+    assert numbers.between(2, 4, inclusive=(False, False)) == [3]
+    assert numbers.between(minimum=4) == [4, 5]
+    assert numbers.between(maximum=2) == [1, 2]
+    assert numbers.between(6, 9) == []
+
+
+def test_fluent_sorted_list_key():
+    """Test the 'fluentsortedlist' class when sorting via a key callable."""
+
+    things = fluentsortedlist(key=lambda thing: thing.score)
+
+    things.add(Thing(name="b", score=20)).add(Thing(name="a", score=10))
+    things.add(Thing(name="c", score=30)).add(Thing(name="d", score=20))
+
+    # Ensure that items with equal keys are kept in the order they were added
+    assert things.map(lambda thing: thing.name) == ["a", "b", "d", "c"]
+
+    assert things.between(15, 25).map(lambda thing: thing.name) == ["b", "d"]
+
+    assert things.first(name="d").score == 20
+    assert things.last().name == "c"
+
+    things.discard(things[1])
+
+    assert things.map(lambda thing: thing.name) == ["a", "d", "c"]
+
+
+def test_fluent_sorted_list_fluent_interface(numbers: fluentsortedlist[int]):
+    """Test the fluent 'take', 'drop', 'first', 'last', 'map' and 'filter' methods."""
+
+    taken = numbers.take(2)
+
+    assert isinstance(taken, fluentsortedlist)
+    assert taken == [1, 2]
+
+    assert numbers.drop(3) == [4, 5]
+
+    assert numbers.first() == 1
+    assert numbers.last() == 5
+    assert numbers.first(lambda number: number > 2) == 3
+    assert fluentsortedlist().first() is None
+
+    mapped = numbers.map(lambda number: -number)
+
+    assert isinstance(mapped, fluentlist)
+    assert mapped == [-1, -2, -3, -4, -5]
+
+    filtered = numbers.filter(lambda number: number % 2)
+
+    assert isinstance(filtered, fluentsortedlist)
+    assert filtered == [1, 3, 5]
+
+    # Ensure that a filtered list remains sorted as items are added to it
+    assert filtered.add(2) == [1, 2, 3, 5]
+
+    cloned = numbers.clone()
+
+    assert not cloned is numbers
+    assert cloned == numbers
+
+
+def test_fluent_sorted_list_sublists(sublists):
+    """Test that the 'fluentsortedlist' class remains ordered as sublists are split
+    and merged following many additions and removals."""
+
+    numbers = fluentsortedlist()
+
+    values = [(index * 7919) % 101 for index in range(101)]
+
+    for value in values:
+        numbers.add(value)
+
+    assert numbers == sorted(values)
+    assert len(numbers._lists) > 1
+
+    for value in values[::2]:
+        numbers.remove(value)
+
+    remaining = sorted(values[1::2])
+
+    assert numbers == remaining
+    assert [numbers[index] for index in range(len(remaining))] == remaining
+    assert [numbers.index(value) for value in remaining] == list(range(len(remaining)))
+
+
+def test_fluent_sorted_list_pickling():
+    """Test that sorted lists are pickled as their sorted items, without their index."""
+
+    data = fluentsortedlist(range(2500, 0, -1))
+
+    result = pickle.loads(pickle.dumps(data))
+
+    assert isinstance(result, fluentsortedlist)
+    assert result == data
+    assert len(result._lists) == 3
+
+    assert result.add(0)[0] == 0
+
+    assert b"_maxes" not in pickle.dumps(data)
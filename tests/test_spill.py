@@ -0,0 +1,158 @@
+from fluently import spill
+
+import os
+import pytest
+
+
+def test_spill_size():
+    """Test the 'size' method of the 'spill' module."""
+
+    assert spill.size(1024) == 1024
+    assert spill.size("1024") == 1024
+    assert spill.size("2KB") == 2000
+    assert spill.size("1.5 KiB") == 1536
+    assert spill.size("512mb") == 512 * 1000**2
+
+    with pytest.raises(ValueError):
+        spill.size("12 parsecs")
+
+    with pytest.raises(ValueError):
+        spill.size(0)
+
+    with pytest.raises(TypeError):
+        spill.size(1.5)
+
+
+def test_spill_sort(tmp_path):
+    """Test the 'sort' method of the 'spill' module spills runs and merges them."""
+
+    values = [(index * 7919) % 1009 for index in range(1009)]
+
+    # Ensure that sorting is lazy, and that no spill files exist before iterating
+    items = spill.sort(values, limit="4KB", directory=tmp_path)
+
+    assert not isinstance(items, list)
+
+    assert list(items) == sorted(values)
+
+    assert list(spill.sort(values, reverse=True, limit=4096)) == sorted(
+        values, reverse=True
+    )
+
+    # Ensure that the temporary spill files have been removed from the directory
+    assert os.listdir(tmp_path) == []
+
+    # Ensure that the sort is stable across spilled runs
+    pairs = [(value % 10, index) for index, value in enumerate(values)]
+
+    assert list(spill.sort(pairs, key=lambda pair: pair[0], limit=4096)) == sorted(
+        pairs, key=lambda pair: pair[0]
+    )
+
+    with pytest.raises(TypeError):
+        spill.sort(values, key=1, limit=4096)
+
+
+def test_spill_unique(tmp_path):
+    """Test the 'unique' method of the 'spill' module yields each distinct item once."""
+
+    values = [(index * 7919) % 211 for index in range(2000)]
+
+    expected = list(dict.fromkeys(values))
+
+    items = spill.unique(values, limit=1024, directory=tmp_path, partitions=4)
+
+    assert not isinstance(items, list)
+
+    items = list(items)
+
+    assert len(items) == len(expected)
+    assert set(items) == set(expected)
+
+    # Ensure that the items yielded before the limit was reached retain their order
+    assert items[:10] == expected[:10]
+
+    # Ensure that the number of partitions may be derived from the limit
+    assert sorted(spill.unique(values, limit=1024)) == sorted(expected)
+
+    # Ensure that the temporary partition files have been removed from the directory
+    assert os.listdir(tmp_path) == []
+
+    # Ensure that items are deduplicated in memory when they fit within the limit
+    assert list(spill.unique(values, limit="1MB")) == expected
+
+    with pytest.raises(ValueError):
+        spill.unique(values, limit=1024, partitions=0)
+
+
+def test_spill_group(tmp_path):
+    """Test the 'group' method of the 'spill' module groups the items of each key."""
+
+    values = [(index * 7919) % 211 for index in range(2000)]
+
+    expected: dict[int, list[int]] = {}
+
+    for value in values:
+        expected.setdefault(value % 13, []).append(value)
+
+    groups = spill.group(
+        values, lambda value: value % 13, limit=1024, directory=tmp_path, partitions=4
+    )
+
+    assert dict(groups) == expected
+
+    assert os.listdir(tmp_path) == []
+
+    assert list(spill.group(values, lambda value: value % 13, limit="1MB")) == list(
+        expected.items()
+    )
+
+    with pytest.raises(TypeError):
+        spill.group(values, "key", limit=1024)
+
+
+def test_spill_partitions():
+    """Test the 'fanout' and 'partition' methods of the 'spill' module."""
+
+    assert spill.fanout(1024) == 2
+    assert spill.fanout(spill.buffering * 8) == 8
+    assert spill.fanout(spill.size("1GB")) == spill.partitioning
+
+    files = spill.partition(range(1000), lambda item: item % 10, 3, limit=1024)
+
+    blocks: list[list[int]] = []
+
+    for file in files:
+        blocks.append(list(spill.stream(file)))
+
+    # Ensure that equal hashed values share a partition, retaining their order
+    assert sorted(item for block in blocks for item in block) == list(range(1000))
+
+    for block in blocks:
+        assert block == sorted(block)
+
+    for key in range(10):
+        assert sum(any(item % 10 == key for item in block) for block in blocks) == 1
+
+
+def test_spill_group_large_partition(tmp_path):
+    """Test that the 'group' method of the 'spill' module partitions large partitions."""
+
+    values = list(range(5000))
+
+    groups = dict(
+        spill.group(
+            values,
+            lambda value: value % 97,
+            limit=2048,
+            directory=tmp_path,
+            partitions=2,
+        )
+    )
+
+    assert len(groups) == 97
+
+    for key, group in groups.items():
+        assert group == list(range(key, 5000, 97))
+
+    assert os.listdir(tmp_path) == []
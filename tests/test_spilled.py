@@ -0,0 +1,164 @@
+from fluently import fluentspilledlist, fluspilledlist, fspilledlist, fluentlist
+from conftest import Thing
+
+import os
+import pytest
+
+
+@pytest.fixture(name="numbers", scope="function")
+def fixture_numbers(tmp_path) -> fluentspilledlist[int]:
+    """Create a list whose budget holds only a few chunks of ten items in memory."""
+
+    numbers = fluentspilledlist(
+        range(1000), memory_limit="2KB", spill_dir=tmp_path, chunksize=10
+    )
+
+    assert isinstance(numbers, fluentspilledlist)
+
+    return numbers
+
+
+def test_fluent_spilled_list_alias():
+    """Test the 'fluspilledlist' and 'fspilledlist' aliases for the 'fluentspilledlist' class."""
+
+    assert fluentspilledlist is fluspilledlist
+    assert fluentspilledlist is fspilledlist
+
+
+def test_fluent_spilled_list_spilling(numbers: fluentspilledlist[int]):
+    """Test that the 'fluentspilledlist' class spills chunks beyond its memory budget."""
+
+    assert numbers.length() == 1000
+    assert len(numbers) == 1000
+
+    # Ensure that most chunks have been spilled, and that the budget has been honoured
+    assert numbers.spilled > 90
+    assert numbers._used <= 2000 + 10 * 40
+
+    assert list(numbers) == list(range(1000))
+    assert numbers == list(range(1000))
+
+    # Ensure that iterating does not page the spilled chunks back into memory
+    assert numbers.spilled > 90
+
+
+def test_fluent_spilled_list_indexing(numbers: fluentspilledlist[int]):
+    """Test that the 'fluentspilledlist' class pages spilled chunks back in on access."""
+
+    spilled: int = numbers.spilled
+
+    assert numbers[5] == 5
+    assert numbers[-1] == 999
+    assert numbers[123] == 123
+
+    assert numbers[10:15] == [10, 11, 12, 13, 14]
+    assert isinstance(numbers[10:15], fluentlist)
+
+    # Ensure that paging chunks in spills others, so the count of spilled chunks holds
+    assert numbers.spilled == spilled
+
+    assert numbers.first() == 0
+    assert numbers.last() == 999
+
+    with pytest.raises(IndexError):
+        numbers[1000]
+
+    with pytest.raises(TypeError):
+        numbers["1"]
+
+
+def test_fluent_spilled_list_append_extend(tmp_path):
+    """Test the 'append' and 'extend' methods of the 'fluentspilledlist' class."""
+
+    items = fluentspilledlist(memory_limit=1024, spill_dir=tmp_path, chunksize=8)
+
+    assert items.append("a") is items
+    assert items.extend(["b", "c"]) is items
+
+    assert items == ["a", "b", "c"]
+
+    items.extend(str(index) for index in range(100))
+
+    assert items.spilled > 0
+    assert items[3:6] == ["0", "1", "2"]
+
+    # Ensure that a list may be extended with itself
+    assert items.extend(items).length() == 206
+
+    assert items[103:106] == ["a", "b", "c"]
+
+
+def test_fluent_spilled_list_operations(numbers: fluentspilledlist[int]):
+    """Test the 'take', 'drop', 'filter' and 'map' methods of the 'fluentspilledlist' class."""
+
+    taken = numbers.take(25)
+
+    assert isinstance(taken, fluentspilledlist)
+    assert taken == list(range(25))
+    assert numbers.take(-995) == [0, 1, 2, 3, 4]
+
+    assert numbers.drop(995) == [995, 996, 997, 998, 999]
+    assert numbers.drop(-3) == [997, 998, 999]
+
+    evens = numbers.filter(lambda value: value % 2 == 0)
+
+    assert isinstance(evens, fluentspilledlist)
+    assert evens == list(range(0, 1000, 2))
+
+    doubled = numbers.map(lambda value: value * 2)
+
+    assert isinstance(doubled, fluentspilledlist)
+    assert doubled.length() == 1000
+    assert doubled[500] == 1000
+
+    assert numbers.clone() == numbers
+
+    # Ensure that each derived list has its own budget of the same size, and its own file
+    assert doubled._limit == numbers._limit
+    assert doubled.spilled > 0
+    assert not doubled._file is numbers._file
+
+    things = fluentspilledlist(
+        [Thing(kind="a"), Thing(kind="b"), Thing(kind="a")], chunksize=2
+    )
+
+    assert things.filter(kind="a").length() == 2
+
+
+def test_fluent_spilled_list_sorted(numbers: fluentspilledlist[int]):
+    """Test the 'sorted' method of the 'fluentspilledlist' class."""
+
+    shuffled = numbers.map(lambda value: (value * 7919) % 1000)
+
+    result = shuffled.sorted()
+
+    assert isinstance(result, fluentspilledlist)
+    assert result == list(range(1000))
+
+    assert list(shuffled.sorted(reverse=True, lazy=True)) == list(range(999, -1, -1))
+
+    things = fluentspilledlist([Thing(age=30), Thing(age=10), Thing(age=20)])
+
+    assert [thing.age for thing in things.sorted(by="-age")] == [30, 20, 10]
+
+    with pytest.raises(TypeError):
+        things.sorted(key=len, by="age")
+
+
+def test_fluent_spilled_list_close(tmp_path):
+    """Test that closing the 'fluentspilledlist' class removes its temporary file."""
+
+    with fluentspilledlist(
+        range(1000), memory_limit="1KB", spill_dir=tmp_path, chunksize=10
+    ) as numbers:
+        assert numbers.spilled > 0
+
+    assert numbers.length() == 0
+
+    assert os.listdir(tmp_path) == []
+
+    with pytest.raises(ValueError):
+        fluentspilledlist(chunksize=0)
+
+    with pytest.raises(ValueError):
+        fluentspilledlist(memory_limit="lots")
@@ -0,0 +1,167 @@
+from fluently.stats import stats
+from conftest import Thing
+from array import array
+
+import math
+import pytest
+import random
+import statistics
+
+
+@pytest.fixture(name="samples", scope="module")
+def fixture_samples() -> list[float]:
+    rng = random.Random(40)
+
+    # Values with a large mean and small spread, for which naive variances are inexact
+    return [rng.gauss(1e6, 3.0) for _ in range(5000)]
+
+
+def test_stats_aggregates():
+    """Test the aggregates computed for a simple sequence of integers."""
+
+    results = stats([2, 4, 4, 4, 5, 5, 7, 9])
+
+    assert results == {
+        "count": 8,
+        "sum": 40,
+        "min": 2,
+        "max": 9,
+        "mean": 5.0,
+        "variance": 32 / 7,
+        "stdev": math.sqrt(32 / 7),
+    }
+
+
+def test_stats_paths_agree(samples: list[float]):
+    """Test that the vectorised and streamed paths compute the same aggregates."""
+
+    expected_mean = statistics.fmean(samples)
+    expected_variance = statistics.variance(samples)
+
+    # A list of floats, or an array, with no key is handled by the vectorised path,
+    # while a key, or a stream of values, forces the single pass streamed path
+    for values, key in [
+        (samples, None),
+        (array("d", samples), None),
+        (samples, lambda value: value),
+        (iter(samples), None),
+    ]:
+        results = stats(values, key=key)
+
+        assert results["count"] == 5000
+        assert results["sum"] == math.fsum(samples)
+        assert results["min"] == min(samples)
+        assert results["max"] == max(samples)
+        assert results["mean"] == pytest.approx(expected_mean, rel=1e-15)
+        assert results["variance"] == pytest.approx(expected_variance, rel=1e-9)
+
+
+def test_stats_exact_sum():
+    """Test that float sums are computed exactly, as per 'math.fsum'."""
+
+    values = [0.1] * 10 + [1e100, 1.0, -1e100]
+
+    assert stats(values)["sum"] == math.fsum(values)
+    assert stats(iter(values))["sum"] == math.fsum(values)
+
+    # Ensure that mixed integers and floats are summed exactly
+    assert stats(iter([1, 0.5, 2, 0.25]))["sum"] == 3.75
+
+
+@pytest.mark.parametrize("streamed", [False, True])
+def test_stats_non_finite_sum(streamed: bool):
+    """Test that infinities, NaNs and overflowing partial sums are summed as per fsum."""
+
+    def aggregate(values: list) -> dict:
+        return stats(iter(values) if streamed else values)
+
+    assert aggregate([math.inf, 1.0, 2.0])["sum"] == math.inf
+    assert aggregate([1.0, -math.inf])["sum"] == -math.inf
+    assert math.isnan(aggregate([math.inf, -math.inf, 1.0])["sum"])
+    assert math.isnan(aggregate([math.nan, 1.0])["sum"])
+
+    # Ensure that the partial sums overflowing does not prevent an exact finite sum
+    results = aggregate([1e308, 1e308, -1e308, 1.0])
+
+    assert results["sum"] == 1e308
+    assert results["variance"] == math.inf
+
+    assert aggregate([1e308, 1e308])["sum"] == math.inf
+    assert aggregate([1e308, 1e308])["variance"] == 0.0
+    assert aggregate([-1e308, -1e308, 5.0])["sum"] == -math.inf
+
+    # Ensure that integers are included in the exact sum once the partial sums overflow
+    assert aggregate([1e308, 1e308, -1e308, -1e308, 3, 0.5])["sum"] == 3.5
+
+
+def test_stats_key_and_nones():
+    """Test obtaining values via a key, where values of None are ignored."""
+
+    things = [Thing(size=1), Thing(size=None), Thing(size=3), Thing()]
+
+    results = stats(things, key="size")
+
+    assert results["count"] == 2
+    assert results["sum"] == 4
+    assert results["mean"] == 2.0
+
+    assert stats([1, None, 3])["count"] == 2
+
+    with pytest.raises(TypeError):
+        stats(["1", "2"])
+
+
+def test_stats_empty_and_single():
+    """Test the aggregates of empty and single value inputs."""
+
+    assert stats([]) == {
+        "count": 0,
+        "sum": 0,
+        "min": None,
+        "max": None,
+        "mean": None,
+        "variance": None,
+        "stdev": None,
+    }
+
+    results = stats([5.0])
+
+    assert results["mean"] == 5.0
+    assert results["variance"] is None
+
+
+def test_stats_histogram():
+    """Test the histograms computed over equal width bins and over specified edges."""
+
+    values = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    for items in (values, iter(values)):
+        histogram = stats(items, bins=5)["histogram"]
+
+        assert histogram["edges"] == [0, 2, 4, 6, 8, 10]
+
+        # The last bin includes its upper edge
+        assert histogram["counts"] == [2, 2, 2, 2, 3]
+
+    # Ensure that values outside of the bounds are not counted
+    histogram = stats(values, bins=2, bounds=(2, 6))["histogram"]
+
+    assert histogram == {"edges": [2, 4, 6], "counts": [2, 3]}
+
+    histogram = stats(iter(values), bins=[0, 5, 20])["histogram"]
+
+    assert histogram == {"edges": [0, 5, 20], "counts": [5, 6]}
+
+    assert stats([1, 1, 1], bins=2)["histogram"]["counts"] == [0, 3]
+
+    with pytest.raises(ValueError):
+        stats(values, bins=0)
+
+    with pytest.raises(ValueError):
+        stats(values, bins=[3, 1])
+
+    with pytest.raises(ValueError):
+        stats(values, bounds=(0, 1))
+
+    with pytest.raises(TypeError):
+        stats(values, bins="5")
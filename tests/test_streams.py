@@ -0,0 +1,203 @@
+from fluently import streams
+from conftest import Thing
+
+import json
+import os
+import pytest
+import threading
+
+
+@pytest.fixture(name="blocks")
+def fixture_blocks(monkeypatch):
+    """Reduce the buffer and batch sizes, so that lines span the blocks read."""
+
+    monkeypatch.setattr(streams, "buffersize", 64)
+    monkeypatch.setattr(streams, "batchsize", 7)
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_streams_read_lines(tmp_path, blocks, threaded: bool):
+    """Test the 'read_lines' method of the 'streams' module across blocks."""
+
+    path = tmp_path / "lines.txt"
+
+    lines = ["line %d" % (index) * (index % 5) for index in range(100)]
+
+    path.write_text("\n".join(lines))
+
+    items = streams.read_lines(path, threaded=threaded)
+
+    assert not isinstance(items, list)
+
+    assert list(items) == lines
+
+    path.write_text("first\r\nsecond\n\nthird\n")
+
+    assert list(streams.read_lines(path, threaded=threaded)) == [
+        "first",
+        "second",
+        "",
+        "third",
+    ]
+
+    with pytest.raises(FileNotFoundError):
+        streams.read_lines(tmp_path / "missing.txt")
+
+    with pytest.raises(TypeError):
+        streams.read_lines(path, threaded=1)
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_streams_read_jsonl(tmp_path, blocks, threaded: bool):
+    """Test the 'read_jsonl' method of the 'streams' module decodes batches of lines."""
+
+    path = tmp_path / "items.jsonl"
+
+    items = [{"id": index, "name": "item %d" % (index)} for index in range(100)]
+
+    path.write_text("\n".join(map(json.dumps, items)) + "\n\n  \n[1, 2]\n")
+
+    assert list(streams.read_jsonl(path, threaded=threaded)) == items + [[1, 2]]
+
+    # Ensure that lines holding more than one value are not decoded as several items
+    path.write_text('{"id": 1}\n1, 2\n')
+
+    with pytest.raises(ValueError) as error:
+        list(streams.read_jsonl(path, threaded=threaded))
+
+    assert "line 2" in str(error.value)
+
+    # Ensure that values spanning lines are not decoded, even where the count of the
+    # values decoded would equal the count of the lines
+    path.write_text("[1\n2]\n3,4\n")
+
+    with pytest.raises(ValueError) as error:
+        list(streams.read_jsonl(path, threaded=threaded))
+
+    assert "line 1" in str(error.value)
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_streams_read_csv(tmp_path, blocks, threaded: bool):
+    """Test the 'read_csv' method of the 'streams' module, including multi-line values."""
+
+    path = tmp_path / "items.csv"
+
+    path.write_text('id,name\n1,"first\nitem"\n2,second\n', newline="")
+
+    assert list(streams.read_csv(path, threaded=threaded)) == [
+        {"id": "1", "name": "first\nitem"},
+        {"id": "2", "name": "second"},
+    ]
+
+    path.write_text("1;first\n2;second\n")
+
+    rows = streams.read_csv(path, fields=["id", "name"], delimiter=";")
+
+    assert list(rows) == [
+        {"id": "1", "name": "first"},
+        {"id": "2", "name": "second"},
+    ]
+
+    with pytest.raises(TypeError):
+        streams.read_csv(path, fields="id")
+
+
+def test_streams_lazy_open(tmp_path):
+    """Test that the readers of the 'streams' module only open files once iterated."""
+
+    path = tmp_path / "lines.txt"
+
+    path.write_text("first\nsecond\n")
+
+    items = streams.read_lines(path)
+
+    # As the file has not yet been opened, removing it causes the iteration to fail
+    os.remove(path)
+
+    with pytest.raises(FileNotFoundError):
+        next(items)
+
+    path.write_text("first\nsecond\n")
+
+    items = streams.read_lines(path)
+
+    assert next(items) == "first"
+
+    os.remove(path)
+
+    assert next(items) == "second"
+
+
+def test_streams_background_early_exit(tmp_path, blocks):
+    """Test that a threaded reader stops its background thread when closed early."""
+
+    path = tmp_path / "lines.txt"
+
+    path.write_text("\n".join(map(str, range(10000))))
+
+    items = streams.read_lines(path, threaded=True)
+
+    assert next(items) == "0"
+
+    items.close()
+
+    assert not any(thread.name == "fluently-reader" for thread in threading.enumerate())
+
+    assert list(streams.read_lines(path, threaded=True))[-1] == "9999"
+
+
+def test_streams_write_jsonl(tmp_path, blocks):
+    """Test the 'write_jsonl' method of the 'streams' module writes batches of items."""
+
+    class Point(object):
+        def __init__(self, x: int, y: int):
+            self.x = x
+            self.y = y
+            self._cache = None
+
+    path = tmp_path / "items.jsonl"
+
+    items = [{"id": index} for index in range(20)] + [Point(1, 2)]
+
+    assert streams.write_jsonl(iter(items), path) == str(path)
+
+    # Ensure that objects are written as an object holding their public attributes
+    assert list(streams.read_jsonl(path)) == items[:20] + [{"x": 1, "y": 2}]
+
+    # Ensure that no temporary files remain alongside the written file
+    assert os.listdir(tmp_path) == ["items.jsonl"]
+
+    # Ensure that a failed write leaves the existing file in place
+    with pytest.raises(TypeError):
+        streams.write_jsonl([{"id": 1}, object()], path)
+
+    assert len(list(streams.read_jsonl(path))) == 21
+
+    assert os.listdir(tmp_path) == ["items.jsonl"]
+
+
+def test_streams_write_csv(tmp_path, blocks):
+    """Test the 'write_csv' method of the 'streams' module writes a header and rows."""
+
+    path = tmp_path / "items.csv"
+
+    items = [{"id": index, "name": "item\n%d" % (index)} for index in range(20)]
+
+    streams.write_csv(items, path)
+
+    assert list(streams.read_csv(path)) == [
+        {"id": str(item["id"]), "name": item["name"]} for item in items
+    ]
+
+    streams.write_csv(
+        [Thing(id=1, name="one"), Thing(id=2)], path, fields=["id", "name"]
+    )
+
+    assert path.read_text() == "id,name\n1,one\n2,\n"
+
+    with pytest.raises(ValueError):
+        streams.write_csv([], path)
+
+    with pytest.raises(TypeError):
+        streams.write_csv([object()], path)
@@ -0,0 +1,179 @@
+from fluently import fluentstringset, flustringset, fstringset, fluentset, fluentlist
+
+import pickle
+import pytest
+
+
+@pytest.fixture(name="hosts", scope="function")
+def fixture_hosts() -> fluentstringset[str]:
+    hosts = fluentstringset(
+        [
+            "www.example.com",
+            "api.example.com",
+            "api.example.org",
+            "mail.example.com",
+            "api",
+        ]
+    )
+
+    assert isinstance(hosts, fluentstringset)
+    assert isinstance(hosts, fluentset)
+    assert isinstance(hosts, set)
+
+    assert len(hosts) == 5
+
+    return hosts
+
+
+def test_fluent_string_set_alias():
+    """Test the 'flustringset' and 'fstringset' aliases for the 'fluentstringset' class."""
+
+    assert fluentstringset is flustringset
+    assert fluentstringset is fstringset
+
+
+def test_fluent_string_set_initialisation_requires_strings():
+    """Test that the 'fluentstringset' class only accepts string values."""
+
+    assert fluentstringset().length() == 0
+
+    with pytest.raises(TypeError):
+        fluentstringset(["A", 1])
+
+    with pytest.raises(TypeError):
+        fluentstringset().add(1)
+
+    with pytest.raises(TypeError):
+        fluentstringset().update([1])
+
+
+def test_fluent_string_set_ordered_iteration(hosts: fluentstringset[str]):
+    """Test that iterating over a 'fluentstringset' yields its members in order."""
+
+    assert list(hosts) == [
+        "api",
+        "api.example.com",
+        "api.example.org",
+        "mail.example.com",
+        "www.example.com",
+    ]
+
+    assert list(reversed(hosts)) == list(reversed(list(hosts)))
+
+    # Ensure that the order is maintained after mutating the set
+    hosts.add("admin.example.com").discard("www.example.com")
+
+    assert list(hosts) == [
+        "admin.example.com",
+        "api",
+        "api.example.com",
+        "api.example.org",
+        "mail.example.com",
+    ]
+
+
+def test_fluent_string_set_startswith(hosts: fluentstringset[str]):
+    """Test the 'startswith' method of the 'fluentstringset' class."""
+
+    matches = hosts.startswith("api.")
+
+    assert isinstance(matches, fluentlist)
+
+    assert matches == ["api.example.com", "api.example.org"]
+
+    assert hosts.startswith("api") == ["api", "api.example.com", "api.example.org"]
+
+    assert hosts.startswith("zzz") == []
+
+    assert hosts.startswith("").length() == hosts.length()
+
+    # Ensure that the prefix search reflects in-place set operations
+    hosts |= {"api.example.net"}
+    hosts -= {"api.example.org"}
+
+    assert hosts.startswith("api.") == ["api.example.com", "api.example.net"]
+
+    with pytest.raises(TypeError):
+        hosts.startswith(1)
+
+
+def test_fluent_string_set_longest_prefix_of(hosts: fluentstringset[str]):
+    """Test the 'longest_prefix_of' method of the 'fluentstringset' class."""
+
+    assert hosts.longest_prefix_of("api.example.com/v1") == "api.example.com"
+
+    assert hosts.longest_prefix_of("api.example.net") == "api"
+
+    assert hosts.longest_prefix_of("ftp.example.com") is None
+
+    assert hosts.clone().add("").longest_prefix_of("ftp") == ""
+
+
+def test_fluent_string_set_fluent_interface(hosts: fluentstringset[str]):
+    """Test that the 'fluentstringset' mutation methods support chaining."""
+
+    cloned = hosts.clone()
+
+    assert isinstance(cloned, fluentstringset)
+    assert not cloned is hosts
+    assert cloned == hosts
+
+    assert cloned.remove("api") is cloned
+    assert not cloned.contains("api")
+    assert hosts.contains("api")
+
+    assert cloned.remove("api", raises=False) is cloned
+
+    with pytest.raises(KeyError):
+        cloned.remove("api")
+
+    assert cloned.clear() is cloned
+    assert cloned.length() == 0
+    assert list(cloned) == []
+
+
+def test_fluent_string_set_maintained_index(hosts: fluentstringset[str]):
+    """Test that the 'fluentstringset' class maintains its sorted index once built."""
+
+    assert list(hosts) == sorted(hosts)
+
+    index = hosts._sorted
+
+    assert index is not None
+
+    hosts.add("ftp.example.com").add("api").discard("api.example.org")
+    hosts.update(["z%02d" % (number) for number in range(20)], ["a", "api"])
+
+    assert hosts._sorted is not None
+    assert list(hosts) == sorted(set(hosts))
+
+    hosts.difference_update(["z%02d" % (number) for number in range(10)])
+    hosts.intersection_update(hosts - {"a"})
+    hosts.symmetric_difference_update(["www.example.com", "b", "z15"])
+    hosts.remove("api")
+
+    assert not hosts.pop() in hosts
+
+    assert hosts._sorted is not None
+    assert hosts._sorted == sorted(set(hosts))
+
+    with pytest.raises(TypeError):
+        hosts.update(["c", 1])
+
+
+def test_fluent_string_set_pickling():
+    """Test that string sets are pickled without their cached sorted index."""
+
+    data = fluentstringset(["banana", "apple", "cherry"])
+
+    assert list(data) == ["apple", "banana", "cherry"]
+
+    data.label = "fruits"
+
+    result = pickle.loads(pickle.dumps(data))
+
+    assert isinstance(result, fluentstringset)
+    assert result._sorted is None
+    assert result.label == "fruits"
+    assert data._sorted == ["apple", "banana", "cherry"]
+    assert list(result) == ["apple", "banana", "cherry"]
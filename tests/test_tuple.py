@@ -1,7 +1,9 @@
-from fluently import fluenttuple, flutuple, ftuple
+from fluently import fluenttuple, flutuple, ftuple, fluentgroups, fluentlist
 from conftest import Thing
 
 import pytest
+import pickle
+import random
 
 
 @pytest.fixture(name="numbers", scope="module")
@@ -292,6 +294,22 @@ def test_fluent_tuple_shuffle(numbers: fluenttuple[int]):
         assert item in newnumbers
 
 
+def test_fluent_tuple_shuffle_seeded():
+    """Test the 'seed' and 'rng' arguments of the 'shuffle' method of 'fluenttuple'."""
+
+    numbers = fluenttuple(range(100))
+
+    shuffled = numbers.shuffle(seed=7)
+
+    assert isinstance(shuffled, fluenttuple)
+    assert shuffled == numbers.shuffle(seed=7)
+    assert shuffled == numbers.shuffle(rng=random.Random(7))
+    assert sorted(shuffled) == list(numbers)
+
+    # Ensure that the tuple is shuffled into the same order as an equivalent list
+    assert list(shuffled) == fluentlist(range(100)).shuffle(seed=7)
+
+
 def test_fluent_tuple_unique():
     """Test the 'unique' method of the 'fluenttuple' class."""
 
@@ -526,6 +544,15 @@ def test_fluent_tuple_sorted(numbers: fluenttuple[int]):
     # Ensure that the tuple contains the values in the expected order
     assert newnumbers == tuple([1, 2, 3])
 
+    # Ensure that an iterator of the sorted items is returned when lazy is set
+    items = clonednumbers.sorted(reverse=True, lazy=True)
+
+    assert not isinstance(items, tuple)
+    assert list(items) == [3, 2, 1]
+
+    with pytest.raises(TypeError):
+        clonednumbers.sorted(lazy="yes")
+
 
 def test_fluent_tuple_slice(numbers: fluenttuple[int]):
     """Test the 'slice' method of the 'fluenttuple' class."""
@@ -761,3 +788,166 @@ def test_fluent_tuple_last_with_empty_tuple(things: fluenttuple[Thing]):
 
     # When the tuple is empty, we expect .last() to return None
     assert thing is None
+
+
+def test_fluent_tuple_group_by(things: fluenttuple[Thing]):
+    """Test the 'group_by' method of the 'fluenttuple' class."""
+
+    groups = things.group_by("b")
+
+    assert isinstance(groups, fluentgroups)
+
+    assert list(groups) == [2, 3]
+
+    # Ensure that each group is a new tuple holding the items in their original order
+    assert isinstance(groups[3], fluenttuple)
+    assert groups[3] == (things[1], things[2])
+
+    assert things.group_by("a").agg(count=True, sum="c") == {1: {"count": 3, "sum": 6}}
+
+
+def test_fluent_tuple_top():
+    """Test the 'top', 'nsmallest' and 'nlargest' methods of the 'fluenttuple' class."""
+
+    numbers = fluenttuple([5, 1, 4, 2, 3])
+
+    top = numbers.top(2)
+
+    assert isinstance(top, fluenttuple)
+    assert top == (1, 2)
+
+    assert numbers.top(2, reverse=True) == (5, 4)
+    assert numbers.nsmallest(3) == (1, 2, 3)
+    assert numbers.nlargest(3, key=lambda n: -n) == (1, 2, 3)
+
+
+def test_fluent_tuple_sorted_by(things: fluenttuple[Thing]):
+    """Test the 'sorted' method of the 'fluenttuple' class with 'by' specs."""
+
+    sortedthings = things.sorted(by=["a", "-b", "c"])
+
+    assert isinstance(sortedthings, fluenttuple)
+
+    assert sortedthings == (things[2], things[1], things[0])
+
+
+def test_fluent_tuple_join(things: fluenttuple[Thing]):
+    """Test the 'join' method of the 'fluenttuple' class."""
+
+    joined = things.join([Thing(c=1, label="one")], on="c", how="left")
+
+    assert isinstance(joined, fluenttuple)
+
+    assert joined.length() == 3
+    assert [right and right.label for (left, right) in joined] == [None, None, "one"]
+
+
+def test_fluent_tuple_chunk_window_partition():
+    """Test the 'chunk', 'window', 'partition' and 'split_at' methods of 'fluenttuple'."""
+
+    numbers = fluenttuple(range(1, 6))
+
+    chunks = list(numbers.chunk(2))
+
+    assert all(isinstance(chunk, fluenttuple) for chunk in chunks)
+    assert chunks == [(1, 2), (3, 4), (5,)]
+
+    assert list(numbers.window(4)) == [(1, 2, 3, 4), (2, 3, 4, 5)]
+    assert list(numbers.window(2, step=3)) == [(1, 2), (4, 5)]
+
+    assert numbers.partition(lambda number: number > 3) == ((4, 5), (1, 2, 3))
+
+    assert numbers.split_at(3) == ((1, 2, 3), (4, 5))
+
+
+def test_fluent_tuple_sample_shuffled():
+    """Test the 'sample' and 'shuffled' methods of the 'fluenttuple' class."""
+
+    numbers = fluenttuple(range(100))
+
+    sample = numbers.sample(5, seed=1)
+
+    assert isinstance(sample, fluenttuple)
+    assert len(sample) == 5
+    assert all(number in numbers for number in sample)
+    assert numbers.sample(5, seed=1) == sample
+
+    shuffled = numbers.shuffled(seed=1)
+
+    assert isinstance(shuffled, fluenttuple)
+    assert sorted(shuffled) == list(numbers)
+    assert numbers.shuffled(3, seed=1)[:3] == shuffled[:3]
+
+
+def test_fluent_tuple_stats():
+    """Test the 'stats' method of the 'fluenttuple' class."""
+
+    numbers = fluenttuple([1, 2, 3, 4])
+
+    results = numbers.stats()
+
+    assert results["count"] == 4
+    assert results["sum"] == 10
+    assert results["mean"] == 2.5
+    assert results["variance"] == pytest.approx(5 / 3)
+
+    assert numbers.view(2).stats()["sum"] == 7
+
+
+def test_fluent_tuple_pickling():
+    """Test that tuples, including their attributes, round-trip through pickle."""
+
+    data = fluenttuple([1, "two", 3.0, fluenttuple([4])])
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        result = pickle.loads(pickle.dumps(data, protocol=protocol))
+
+        assert isinstance(result, fluenttuple)
+        assert isinstance(result[3], fluenttuple)
+        assert result == data
+
+    data.label = "items"
+
+    assert pickle.loads(pickle.dumps(data)).label == "items"
+
+
+def test_fluent_tuple_save_load(tmp_path):
+    """Test the 'save' and 'load' methods of the 'fluenttuple' class."""
+
+    data = fluenttuple(index / 2 for index in range(100))
+
+    # Without a codec or chunk size the tuple is saved in the memory-mappable format
+    mapped = tmp_path / "items.fluently"
+
+    assert data.save(mapped) is data
+
+    result = fluenttuple.load(mapped)
+
+    assert isinstance(result, fluenttuple)
+    assert result == data
+
+    # Ensure that the mapped format may also be loaded lazily or in part
+    items = fluenttuple.load(mapped, lazy=True)
+
+    assert not isinstance(items, tuple)
+    assert fluenttuple(items) == data
+
+    assert fluenttuple.load(mapped, start=5) == data[5:]
+    assert fluenttuple.load(mapped, start=5, stop=8) == data[5:8]
+    assert list(fluenttuple.load(mapped, start=98, stop=200, lazy=True)) == [49.0, 49.5]
+
+    fluenttuple(["a", "b", "c"]).save(mapped)
+
+    assert list(fluenttuple.load(mapped, start=1, lazy=True)) == ["b", "c"]
+
+    # With a codec the tuple is saved as a compressed snapshot
+    compressed = tmp_path / "items.snapshot"
+
+    data.save(compressed, compress="bz2", chunksize=10)
+
+    assert fluenttuple.load(compressed) == data
+    assert fluenttuple.load(compressed, start=95) == data[95:]
+    assert list(fluenttuple.load(compressed, start=95, lazy=True)) == list(data[95:])
+
+    with pytest.raises(ValueError):
+        fluenttuple.mmap(compressed)
@@ -0,0 +1,263 @@
+from fluently import fluentview, fluview, fview, fluentlist, fluenttuple, fluentarray
+from conftest import Thing
+
+import pickle
+import pytest
+
+
+@pytest.fixture(name="numbers", scope="function")
+def fixture_numbers() -> fluentlist[int]:
+    numbers = fluentlist([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+
+    assert isinstance(numbers, fluentlist)
+
+    assert len(numbers) == 10
+
+    return numbers
+
+
+def test_fluent_view_alias():
+    """Test the 'fluview' and 'fview' aliases for the 'fluentview' class."""
+
+    assert fluentview is fluview
+    assert fluentview is fview
+
+
+def test_fluent_view_initialisation(numbers: fluentlist[int]):
+    """Test the creation of views via the 'view' methods and the class constructor."""
+
+    view = numbers.view()
+
+    assert isinstance(view, fluentview)
+    assert view.length() == 10
+    assert view == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    assert numbers.view(2, 5) == [3, 4, 5]
+    assert numbers.view(step=3) == [1, 4, 7, 10]
+    assert numbers.view(-2) == [9, 10]
+
+    assert fluentview(numbers, 8) == [9, 10]
+    assert fluentview((1, 2, 3), stop=2) == [1, 2]
+
+    with pytest.raises(TypeError):
+        fluentview(1)
+
+
+def test_fluent_view_indexing(numbers: fluentlist[int]):
+    """Test indexing, slicing and iterating over a view."""
+
+    view = numbers.view(2, 8)
+
+    assert view[0] == 3
+    assert view[-1] == 8
+    assert list(view) == [3, 4, 5, 6, 7, 8]
+    assert list(reversed(view)) == [8, 7, 6, 5, 4, 3]
+
+    # Ensure that slicing a view returns a further view onto the same source
+    assert isinstance(view[1:3], fluentview)
+    assert view[1:3] == [4, 5]
+    assert view[::-2] == [8, 6, 4]
+    assert view[1:][1:][1:] == [6, 7, 8]
+
+    assert 5 in view
+    assert not 1 in view
+
+    with pytest.raises(IndexError):
+        view[6]
+
+
+def test_fluent_view_zero_copy(numbers: fluentlist[int]):
+    """Test that views reference rather than copy the items of their source."""
+
+    view = numbers.view(0, 3)
+
+    assert view._source is numbers
+    assert view.take(2)._source is numbers
+    assert view.reverse()._source is numbers
+
+    # Ensure that changes to the source are reflected by the view
+    numbers[0] = 100
+
+    assert view == [100, 2, 3]
+
+
+def test_fluent_view_slice_take_drop(numbers: fluentlist[int]):
+    """Test the 'slice', 'take', 'drop' and 'reverse' methods of a view."""
+
+    view = numbers.view()
+
+    assert isinstance(view.slice(2, 4), fluentview)
+    assert view.slice(2, 4) == [3, 4]
+    assert view.slice(0, step=5) == [1, 6]
+    assert view.take(3) == [1, 2, 3]
+    assert view.drop(7) == [8, 9, 10]
+    assert view.drop(2).take(3) == [3, 4, 5]
+
+    assert isinstance(view.reverse(), fluentview)
+    assert view.reverse() == [10, 9, 8, 7, 6, 5, 4, 3, 2, 1]
+    assert view.reverse().take(2) == [10, 9]
+    assert view.take(3).reverse() == [3, 2, 1]
+    assert view.reverse().reverse() == view
+
+    # Ensure that the source remains unmodified
+    assert numbers == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    with pytest.raises(TypeError):
+        view.slice("0")
+
+    with pytest.raises(TypeError):
+        view.take("1")
+
+    with pytest.raises(TypeError):
+        view.drop("1")
+
+
+def test_fluent_view_chunk_window(numbers: fluentlist[int]):
+    """Test the 'chunk' and 'window' methods of a view, which yield further views."""
+
+    chunks = list(numbers.view().chunk(4))
+
+    assert all(isinstance(chunk, fluentview) for chunk in chunks)
+    assert chunks == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+
+    windows = list(numbers.view(0, 5).window(3, step=2))
+
+    assert all(isinstance(window, fluentview) for window in windows)
+    assert windows == [[1, 2, 3], [3, 4, 5]]
+
+    with pytest.raises(ValueError):
+        list(numbers.view().chunk(0))
+
+    with pytest.raises(ValueError):
+        list(numbers.view().window(2, step=0))
+
+
+def test_fluent_view_read_only_methods(numbers: fluentlist[int]):
+    """Test the read-only fluent methods of a view."""
+
+    view = numbers.view(0, 6)
+
+    assert view.count(3) == 1
+    assert view.contains(6) is True
+    assert view.contains(7) is False
+    assert view.any(2) is True
+    assert view.all(2) is False
+
+    assert isinstance(view.map(lambda x: x * 2), fluentlist)
+    assert view.map(lambda x: x * 2) == [2, 4, 6, 8, 10, 12]
+    assert view.filter(lambda x: x % 2 == 0) == [2, 4, 6]
+    assert view.reduce(lambda a, b: a + b) == 21
+    assert view.reduce(lambda a, b: a + b, 100) == 121
+    assert view.first() == 1
+    assert view.last() == 6
+    assert view.first(lambda x: x > 3) == 4
+    assert view.last(lambda x: x < 3) == 2
+    assert view.reverse().sorted() == [1, 2, 3, 4, 5, 6]
+
+    assert fluentlist([1, 2, 2, 3]).view().unique() == [1, 2, 3]
+
+    things = fluentlist([Thing(name="a", age=1), Thing(name="b", age=2)]).view()
+
+    assert things.filter(age=2).first().name == "b"
+    assert fluentlist().view().first() is None
+
+
+def test_fluent_view_collect(numbers: fluentlist[int]):
+    """Test that views are only materialised on collection or mutation."""
+
+    view = numbers.view(2, 5)
+
+    collected = view.collect()
+
+    assert isinstance(collected, fluentlist)
+    assert collected == [3, 4, 5]
+    assert not collected is numbers
+
+    # Ensure that methods not supported by the view, such as those which modify the
+    # items, are called upon a newly collected container, leaving the source unmodified
+    appended = view.append(6)
+
+    assert isinstance(appended, fluentlist)
+    assert appended == [3, 4, 5, 6]
+    assert numbers == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    # Ensure that unknown attributes are rejected without collecting the view's items
+    class counted(fluentlist):
+        collected: int = 0
+
+        def __init__(self, *args):
+            counted.collected += 1
+
+            super().__init__(*args)
+
+    view = fluentview(numbers, factory=counted)
+
+    with pytest.raises(AttributeError):
+        view.nonexistent
+
+    assert hasattr(view, "nonexistent") is False
+    assert counted.collected == 0
+
+    assert view.append(11) == numbers + [11]
+    assert counted.collected == 1
+
+
+def test_fluent_view_array_methods():
+    """Test that array views support the array's methods, such as those which modify."""
+
+    numbers = fluentarray("d", [3, 1, 2])
+
+    view = numbers.view()
+
+    appended = view.append(4)
+
+    assert isinstance(appended, fluentarray)
+    assert appended.typecode == "d"
+    assert list(appended) == [3.0, 1.0, 2.0, 4.0]
+    assert list(numbers) == [3.0, 1.0, 2.0]
+
+    assert view.tolist() == [3.0, 1.0, 2.0]
+
+    with pytest.raises(AttributeError):
+        view.nonexistent
+
+
+def test_fluent_view_tuple():
+    """Test views onto a 'fluenttuple', which collect into new tuples."""
+
+    numbers = fluenttuple(range(10))
+
+    view = numbers.view().drop(5).take(3)
+
+    assert isinstance(view, fluentview)
+    assert view == [5, 6, 7]
+    assert view._source is numbers
+
+    assert isinstance(view.collect(), fluenttuple)
+    assert view.collect() == (5, 6, 7)
+    assert isinstance(view.map(str), fluenttuple)
+    assert view.reverse().collect() == (7, 6, 5)
+
+    # Ensure that slicing a tuple directly still returns a new tuple
+    assert isinstance(numbers.slice(2, 4), fluenttuple)
+    assert numbers.slice(2, 4) == (2, 3)
+    assert numbers.take(2) == (0, 1)
+    assert numbers.drop(8) == (8, 9)
+
+
+def test_fluent_view_pickling(numbers: fluentlist[int]):
+    """Test that views are pickled as views over a copy of only their own items."""
+
+    view = fluentlist(range(1000)).view(10, 13)
+
+    data = pickle.dumps(view)
+
+    assert len(data) < 200
+
+    result = pickle.loads(data)
+
+    assert isinstance(result, fluentview)
+    assert result == [10, 11, 12]
+    assert isinstance(result.collect(), fluentlist)
+
+    assert pickle.loads(pickle.dumps(fluenttuple(numbers).view(step=5))) == [1, 6]